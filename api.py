@@ -3,20 +3,30 @@ REST API for Website Analyzer
 Production-ready FastAPI application for website analysis
 """
 
-import os
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+import asyncio
+import functools
+import importlib.util
+import orjson
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, HttpUrl
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 from typing import Optional, Dict, Any, Union
+import threading
+import time
 import uuid
 from datetime import datetime
+from cachetools import TTLCache
 from config import Config
-from src.workflows.unified_workflow import analyze
+from src.workflows.unified_workflow import analysis_cache_key, analyze
 
-# Set API keys
-os.environ["OPENAI_API_KEY"] = Config.get_openai_key()
-if Config.PAGESPEED_API_KEY:
-    os.environ["PAGESPEED_API_KEY"] = Config.PAGESPEED_API_KEY
+# Keys are read from the environment once at import and never change afterwards
+_OPENAI_KEY = Config.OPENAI_API_KEY
+_PAGESPEED_KEY = Config.PAGESPEED_API_KEY
+KEYS_OK = Config.validate_required_keys()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -24,20 +34,96 @@ app = FastAPI(
     description="Comprehensive AI-powered website analysis for SEO, Performance, and UI/UX",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
-# Enable CORS for all origins (configure as needed for production)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Change to specific domains in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Enable CORS for the configured origins (set CORS_ORIGINS in production).
+# With an explicit origin list the middleware matches by set membership; with
+# no origins (same-origin deployments) the layer is skipped entirely.
+if Config.CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=Config.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "DELETE"],
+        allow_headers=["*"],
+    )
+
+# Compress large payloads (analysis reports); small status probes go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+class ShardedAnalysisStore:
+    """
+    Bounded in-memory analysis store split into independently locked shards.
+
+    Each shard is a TTLCache guarded by its own lock, so concurrent background
+    tasks only contend when their analysis IDs hash to the same shard. Records
+    are replaced rather than mutated in place, so readers always see a
+    consistent snapshot.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, shards: int = 16):
+        per_shard = max(1, maxsize // shards)
+        self._shards = [TTLCache(maxsize=per_shard, ttl=ttl) for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def _index(self, analysis_id: str) -> int:
+        return hash(analysis_id) % len(self._shards)
+
+    def get(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """Return the record for analysis_id, or None if missing/expired"""
+        i = self._index(analysis_id)
+        with self._locks[i]:
+            return self._shards[i].get(analysis_id)
+
+    def set(self, analysis_id: str, record: Dict[str, Any]) -> None:
+        """Store a complete record for analysis_id"""
+        i = self._index(analysis_id)
+        with self._locks[i]:
+            self._shards[i][analysis_id] = record
+
+    def pop(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """Remove and return the record for analysis_id, or None if missing"""
+        i = self._index(analysis_id)
+        with self._locks[i]:
+            return self._shards[i].pop(analysis_id, None)
+
 
 # In-memory storage for analysis results (use database in production)
-analysis_store: Dict[str, Dict[str, Any]] = {}
+# Bounded so records expire once clients stop polling instead of growing forever
+analysis_store = ShardedAnalysisStore(
+    maxsize=Config.ANALYSIS_STORE_MAXSIZE,
+    ttl=Config.ANALYSIS_STORE_TTL
+)
+
+# Cached (wall-clock second, ISO string) pair shared by every status update
+_timestamp_cache = (0.0, "")
+
+
+def now_iso() -> str:
+    """
+    Current time as an ISO-8601 string, refreshed at most every 0.5s.
+
+    Status records only need second-level precision, so hot polling and
+    status-update paths reuse the cached string instead of building a new
+    datetime on every call.
+    """
+    global _timestamp_cache
+    now = time.time()
+    cached_at, cached_value = _timestamp_cache
+    if now - cached_at > 0.5:
+        cached_value = datetime.fromtimestamp(now).isoformat()
+        _timestamp_cache = (now, cached_value)
+    return cached_value
+
+
+# Worker pool for the blocking analysis pipeline (LLM calls, Playwright, parsing).
+# Spawned rather than forked so workers don't inherit the server's threads.
+analysis_pool = ProcessPoolExecutor(
+    max_workers=Config.ANALYSIS_WORKERS,
+    mp_context=multiprocessing.get_context("spawn")
+)
 
 
 # Request/Response Models
@@ -58,8 +144,10 @@ class AnalysisRequest(BaseModel):
         description="Whether to stream results (not supported in REST API)"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        json_schema_extra={
             "examples": [
                 {
                     "input": "https://nightwatch.io",
@@ -75,10 +163,13 @@ class AnalysisRequest(BaseModel):
                 }
             ]
         }
+    )
 
 
 class AnalysisResponse(BaseModel):
     """Response model for immediate analysis"""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     analysis_id: str = Field(..., description="Unique identifier for this analysis")
     status: str = Field(..., description="Status of the analysis (completed, error)")
     result: Optional[str] = Field(None, description="Analysis results (if completed)")
@@ -88,6 +179,8 @@ class AnalysisResponse(BaseModel):
 
 class AsyncAnalysisResponse(BaseModel):
     """Response model for async analysis"""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     analysis_id: str = Field(..., description="Unique identifier for this analysis")
     status: str = Field(..., description="Status of the analysis (pending, processing, completed, error)")
     message: str = Field(..., description="Status message")
@@ -95,6 +188,8 @@ class AsyncAnalysisResponse(BaseModel):
 
 class AnalysisStatusResponse(BaseModel):
     """Response model for checking analysis status"""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     analysis_id: str = Field(..., description="Unique identifier for this analysis")
     status: str = Field(..., description="Status of the analysis")
     result: Optional[str] = Field(None, description="Analysis results (if completed)")
@@ -102,64 +197,158 @@ class AnalysisStatusResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of last update")
 
 
+class AnalysisProbeResponse(BaseModel):
+    """Response model for lightweight status polling (no result payload)"""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
+    analysis_id: str = Field(..., description="Unique identifier for this analysis")
+    status: str = Field(..., description="Status of the analysis")
+    error: Optional[str] = Field(None, description="Error message (if error occurred)")
+    timestamp: str = Field(..., description="Timestamp of last update")
+
+
 class HealthResponse(BaseModel):
     """Response model for health check"""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     status: str = Field(..., description="API health status")
     version: str = Field(..., description="API version")
     openai_configured: bool = Field(..., description="Whether OpenAI API key is configured")
     pagespeed_configured: bool = Field(..., description="Whether PageSpeed API key is configured")
 
 
+# Completed analyses keyed by input hash; only touched from the event loop
+analysis_cache: Optional[TTLCache] = TTLCache(
+    maxsize=Config.ANALYSIS_CACHE_MAXSIZE,
+    ttl=Config.ANALYSIS_CACHE_TTL
+) if Config.ANALYSIS_CACHE_MAXSIZE > 0 else None
+
+# One lock per in-flight input so concurrent identical requests run analyze() once
+_analysis_locks: Dict[bytes, asyncio.Lock] = {}
+
+
+async def run_analysis(user_input: Union[str, Dict[str, Any]]) -> str:
+    """
+    Run analyze() in the worker pool without blocking the event loop.
+
+    Results are memoized by input hash for Config.ANALYSIS_CACHE_TTL seconds.
+    Concurrent requests for the same input wait on a shared lock and reuse the
+    first result instead of each running the full pipeline.
+    """
+    # Workers are spawned on first use and inherit the environment at that point
+    Config.export_api_keys()
+    loop = asyncio.get_running_loop()
+
+    if analysis_cache is None:
+        return await loop.run_in_executor(
+            analysis_pool,
+            functools.partial(analyze, user_input, stream=False, use_cache=False)
+        )
+
+    key = analysis_cache_key(user_input)
+    cached = analysis_cache.get(key)
+    if cached is not None:
+        return cached
+
+    lock = _analysis_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        try:
+            # Another request may have finished while we were waiting
+            cached = analysis_cache.get(key)
+            if cached is not None:
+                return cached
+
+            result = await loop.run_in_executor(
+                analysis_pool,
+                functools.partial(analyze, user_input, stream=False, use_cache=False)
+            )
+            analysis_cache[key] = result
+            return result
+        finally:
+            if _analysis_locks.get(key) is lock:
+                del _analysis_locks[key]
+
+
+# Strong references to in-flight analysis jobs (the event loop only keeps weak ones)
+analysis_jobs: set = set()
+
+
 # Background task for async analysis
-def run_analysis_task(analysis_id: str, user_input: Union[str, Dict[str, Any]]):
+async def run_analysis_task(analysis_id: str, user_input: Union[str, Dict[str, Any]]):
     """Background task to run website analysis"""
     try:
         # Update status to processing
-        analysis_store[analysis_id]["status"] = "processing"
-        analysis_store[analysis_id]["timestamp"] = datetime.now().isoformat()
+        analysis_store.set(analysis_id, {
+            "status": "processing",
+            "result": None,
+            "error": None,
+            "timestamp": now_iso()
+        })
 
         # Run analysis
-        result = analyze(user_input, stream=False)
+        result = await run_analysis(user_input)
 
         # Store results
-        analysis_store[analysis_id]["status"] = "completed"
-        analysis_store[analysis_id]["result"] = result
-        analysis_store[analysis_id]["timestamp"] = datetime.now().isoformat()
+        analysis_store.set(analysis_id, {
+            "status": "completed",
+            "result": result,
+            "error": None,
+            "timestamp": now_iso()
+        })
 
     except Exception as e:
         # Store error
-        analysis_store[analysis_id]["status"] = "error"
-        analysis_store[analysis_id]["error"] = str(e)
-        analysis_store[analysis_id]["timestamp"] = datetime.now().isoformat()
+        analysis_store.set(analysis_id, {
+            "status": "error",
+            "result": None,
+            "error": str(e),
+            "timestamp": now_iso()
+        })
+
+
+@app.on_event("shutdown")
+def shutdown_analysis_pool():
+    """Cancel pending jobs and stop worker processes when the server shuts down"""
+    for job in list(analysis_jobs):
+        job.cancel()
+    analysis_pool.shutdown(wait=False, cancel_futures=True)
 
 
 # API Endpoints
+# Static response bodies (configuration is fixed at import, so encode them once)
+_ROOT_BODY = orjson.dumps({
+    "name": "Website Analyzer API",
+    "version": "1.0.0",
+    "description": "Comprehensive AI-powered website analysis",
+    "endpoints": {
+        "docs": "/docs",
+        "health": "/health",
+        "analyze": "/analyze",
+        "analyze_async": "/analyze/async",
+        "status": "/analyze/{analysis_id}",
+        "status_probe": "/analyze/{analysis_id}/status",
+        "result": "/analyze/{analysis_id}/result"
+    }
+})
+
+_HEALTH_BODY = orjson.dumps(HealthResponse(
+    status="healthy",
+    version="1.0.0",
+    openai_configured=bool(_OPENAI_KEY),
+    pagespeed_configured=bool(_PAGESPEED_KEY)
+).model_dump())
+
+
 @app.get("/", tags=["General"])
 async def root():
     """Root endpoint - API information"""
-    return {
-        "name": "Website Analyzer API",
-        "version": "1.0.0",
-        "description": "Comprehensive AI-powered website analysis",
-        "endpoints": {
-            "docs": "/docs",
-            "health": "/health",
-            "analyze": "/analyze",
-            "analyze_async": "/analyze/async",
-            "status": "/analyze/{analysis_id}"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health", response_model=HealthResponse, tags=["General"])
 async def health_check():
     """Health check endpoint"""
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0",
-        openai_configured=bool(Config.OPENAI_API_KEY),
-        pagespeed_configured=bool(Config.PAGESPEED_API_KEY)
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.post("/analyze", response_model=AnalysisResponse, tags=["Analysis"])
@@ -179,49 +368,50 @@ async def analyze_website(request: AnalysisRequest):
     - UI/UX design (with vision AI)
     - Executive summary with recommendations
     """
-    analysis_id = str(uuid.uuid4())
+    analysis_id = uuid.uuid4().hex
 
     try:
         # Validate configuration
-        if not Config.validate_required_keys():
+        if not KEYS_OK:
             raise HTTPException(
                 status_code=500,
                 detail="API keys not configured. Please set OPENAI_API_KEY in config.py"
             )
 
         # Run analysis
-        result = analyze(request.input, stream=False)
+        result = await run_analysis(request.input)
 
         # Store results
-        analysis_store[analysis_id] = {
+        timestamp = now_iso()
+        analysis_store.set(analysis_id, {
             "status": "completed",
             "result": result,
             "error": None,
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": timestamp
+        })
 
         return AnalysisResponse(
             analysis_id=analysis_id,
             status="completed",
             result=result,
             error=None,
-            timestamp=datetime.now().isoformat()
+            timestamp=timestamp
         )
 
     except Exception as e:
         # Store error
-        analysis_store[analysis_id] = {
+        analysis_store.set(analysis_id, {
             "status": "error",
             "result": None,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": now_iso()
+        })
 
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/analyze/async", response_model=AsyncAnalysisResponse, tags=["Analysis"])
-async def analyze_website_async(request: AnalysisRequest, background_tasks: BackgroundTasks):
+async def analyze_website_async(request: AnalysisRequest):
     """
     Analyze a website asynchronously (returns immediately with analysis_id)
 
@@ -234,30 +424,36 @@ async def analyze_website_async(request: AnalysisRequest, background_tasks: Back
     - Screenshot: `{"screenshot": "path.png"}` or `{"screenshots": {...}}`
     """
     # Validate configuration
-    if not Config.validate_required_keys():
+    if not KEYS_OK:
         raise HTTPException(
             status_code=500,
             detail="API keys not configured. Please set OPENAI_API_KEY in config.py"
         )
 
     # Generate analysis ID
-    analysis_id = str(uuid.uuid4())
+    analysis_id = uuid.uuid4().hex
 
     # Initialize analysis record
-    analysis_store[analysis_id] = {
+    analysis_store.set(analysis_id, {
         "status": "pending",
         "result": None,
         "error": None,
-        "timestamp": datetime.now().isoformat()
-    }
+        "timestamp": now_iso()
+    })
 
-    # Add background task
-    background_tasks.add_task(run_analysis_task, analysis_id, request.input)
+    # Schedule the job on the event loop; the blocking work itself runs in
+    # analysis_pool, so it never occupies the shared anyio threadpool
+    job = asyncio.create_task(run_analysis_task(analysis_id, request.input))
+    analysis_jobs.add(job)
+    job.add_done_callback(analysis_jobs.discard)
 
     return AsyncAnalysisResponse(
         analysis_id=analysis_id,
         status="pending",
-        message=f"Analysis started. Use GET /analyze/{analysis_id} to check status."
+        message=(
+            f"Analysis started. Poll GET /analyze/{analysis_id}/status and fetch "
+            f"GET /analyze/{analysis_id}/result once completed."
+        )
     )
 
 
@@ -272,32 +468,103 @@ async def get_analysis_status(analysis_id: str):
     - `completed`: Analysis finished successfully
     - `error`: Analysis failed
     """
-    if analysis_id not in analysis_store:
+    analysis = analysis_store.get(analysis_id)
+
+    if analysis is None:
         raise HTTPException(status_code=404, detail="Analysis ID not found")
 
-    analysis = analysis_store[analysis_id]
+    # Stored records already match AnalysisStatusResponse, so serialize them
+    # directly instead of validating a model on every poll
+    return ORJSONResponse({
+        "analysis_id": analysis_id,
+        "status": analysis["status"],
+        "result": analysis.get("result"),
+        "error": analysis.get("error"),
+        "timestamp": analysis["timestamp"]
+    })
 
-    return AnalysisStatusResponse(
-        analysis_id=analysis_id,
-        status=analysis["status"],
-        result=analysis.get("result"),
-        error=analysis.get("error"),
-        timestamp=analysis["timestamp"]
-    )
+
+@app.get("/analyze/{analysis_id}/status", response_model=AnalysisProbeResponse, tags=["Analysis"])
+async def get_analysis_status_probe(analysis_id: str):
+    """
+    Get the status of an analysis without its result payload
+
+    Cheap to poll repeatedly; fetch `/analyze/{analysis_id}/result` once the
+    status is `completed`.
+    """
+    analysis = analysis_store.get(analysis_id)
+
+    if analysis is None:
+        raise HTTPException(status_code=404, detail="Analysis ID not found")
+
+    return ORJSONResponse({
+        "analysis_id": analysis_id,
+        "status": analysis["status"],
+        "error": analysis.get("error"),
+        "timestamp": analysis["timestamp"]
+    })
+
+
+# Size of each chunk written when streaming a completed result
+RESULT_CHUNK_SIZE = 64 * 1024
+
+
+@app.get("/analyze/{analysis_id}/result", tags=["Analysis"])
+async def get_analysis_result(analysis_id: str):
+    """
+    Stream the result of a completed analysis as plain text
+
+    Returns 409 while the analysis is still pending or processing, or if it
+    failed (see `/analyze/{analysis_id}/status` for the error).
+    """
+    analysis = analysis_store.get(analysis_id)
+
+    if analysis is None:
+        raise HTTPException(status_code=404, detail="Analysis ID not found")
+
+    if analysis["status"] != "completed":
+        raise HTTPException(
+            status_code=409,
+            detail=f"Analysis is {analysis['status']}, result not available"
+        )
+
+    result = (analysis.get("result") or "").encode("utf-8")
+
+    def iter_chunks():
+        view = memoryview(result)
+        for start in range(0, len(view), RESULT_CHUNK_SIZE):
+            yield view[start:start + RESULT_CHUNK_SIZE].tobytes()
+
+    return StreamingResponse(iter_chunks(), media_type="text/plain; charset=utf-8")
 
 
 @app.delete("/analyze/{analysis_id}", tags=["Analysis"])
 async def delete_analysis(analysis_id: str):
     """Delete an analysis record"""
-    if analysis_id not in analysis_store:
-        raise HTTPException(status_code=404, detail="Analysis ID not found")
+    removed = analysis_store.pop(analysis_id)
 
-    del analysis_store[analysis_id]
+    if removed is None:
+        raise HTTPException(status_code=404, detail="Analysis ID not found")
 
     return {"message": f"Analysis {analysis_id} deleted successfully"}
 
 
-# Run with: uvicorn api:app --host 0.0.0.0 --port 8000 --reload
+def uvicorn_server_options() -> Dict[str, str]:
+    """
+    Select uvloop and httptools for uvicorn when they are installed.
+
+    Both ship with uvicorn[standard]; on platforms without them (e.g. uvloop on
+    Windows) uvicorn keeps its asyncio/h11 defaults.
+    """
+    options = {}
+    if importlib.util.find_spec("uvloop") is not None:
+        options["loop"] = "uvloop"
+    if importlib.util.find_spec("httptools") is not None:
+        options["http"] = "httptools"
+    return options
+
+
+# Run with: uvicorn api:app --host 0.0.0.0 --port 8000 --reload --loop uvloop --http httptools
 if __name__ == "__main__":
     import uvicorn
 
@@ -315,7 +582,8 @@ if __name__ == "__main__":
     print("\nAPI Features:")
     print("  - Synchronous analysis (/analyze)")
     print("  - Asynchronous analysis (/analyze/async)")
-    print("  - Status checking (/analyze/{id})")
+    print("  - Status checking (/analyze/{id}, /analyze/{id}/status)")
+    print("  - Result streaming (/analyze/{id}/result)")
     print("  - Health monitoring (/health)")
     print("  - OpenAPI documentation (/docs)")
 
@@ -329,5 +597,6 @@ if __name__ == "__main__":
         "api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        **uvicorn_server_options()
     )
@@ -4,18 +4,20 @@ Website Analyzer CLI
 Command-line interface for website analysis
 """
 
-import os
 import sys
 import argparse
-import json
+import functools
+import logging
+import orjson
 from pathlib import Path
 from config import Config
 from src.workflows.unified_workflow import analyze
 
-# Set API keys
-os.environ["OPENAI_API_KEY"] = Config.get_openai_key()
-if Config.PAGESPEED_API_KEY:
-    os.environ["PAGESPEED_API_KEY"] = Config.PAGESPEED_API_KEY
+@functools.lru_cache(maxsize=1)
+def get_openai_client():
+    """Shared OpenAI client, created on first use"""
+    from openai import OpenAI
+    return OpenAI(api_key=Config.get_openai_key())
 
 
 def print_banner():
@@ -36,6 +38,8 @@ def cmd_analyze(args):
         print("  OPENAI_API_KEY = 'sk-your-key-here'")
         sys.exit(1)
 
+    Config.export_api_keys()
+
     # Determine input type
     if args.url:
         user_input = args.url
@@ -48,7 +52,7 @@ def cmd_analyze(args):
         if not html_file.exists():
             print(f"[ERROR] File not found: {args.html_file}")
             sys.exit(1)
-        user_input = html_file.read_text(encoding='utf-8')
+        user_input = html_file.read_bytes()
         print(f"Analyzing HTML from file: {args.html_file}\n")
     elif args.screenshot:
         user_input = {"screenshot": args.screenshot}
@@ -56,10 +60,10 @@ def cmd_analyze(args):
     elif args.screenshots:
         # Parse JSON screenshots
         try:
-            screenshots = json.loads(args.screenshots)
+            screenshots = orjson.loads(args.screenshots)
             user_input = {"screenshots": screenshots}
             print(f"Analyzing multiple screenshots\n")
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             print("[ERROR] Invalid JSON format for screenshots")
             print("Expected format: '{\"desktop\": \"path1.png\", \"mobile\": \"path2.png\"}'")
             sys.exit(1)
@@ -117,8 +121,7 @@ def cmd_test(args):
     # Test OpenAI connection
     print("\n2. Testing OpenAI connection...")
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=Config.get_openai_key())
+        client = get_openai_client()
         # Simple test call
         response = client.chat.completions.create(
             model="gpt-4o-mini",
@@ -133,11 +136,17 @@ def cmd_test(args):
     # Check Playwright
     print("\n3. Checking Playwright installation...")
     try:
+        from importlib.metadata import version
         from playwright.sync_api import sync_playwright
+        playwright_version = version("playwright")
+
+        # Ask the driver where Chromium lives instead of launching a browser
         with sync_playwright() as p:
-            browser = p.chromium.launch()
-            browser.close()
-        print("   [OK] Playwright and Chromium installed")
+            chromium_path = Path(p.chromium.executable_path)
+        if not chromium_path.exists():
+            raise FileNotFoundError(f"Chromium not found at {chromium_path}")
+
+        print(f"   [OK] Playwright {playwright_version} and Chromium installed")
     except Exception as e:
         print(f"   [ERROR] Playwright check failed: {str(e)}")
         print("      Run: playwright install chromium")
@@ -199,13 +208,14 @@ def cmd_api(args):
     # Start API
     try:
         import uvicorn
-        from api import app
+        from api import app, uvicorn_server_options
         uvicorn.run(
             app,
             host=args.host,
             port=args.port,
             reload=args.reload,
-            log_level="info"
+            log_level="info",
+            **uvicorn_server_options()
         )
     except ImportError:
         print("[ERROR] FastAPI/uvicorn not installed")
@@ -218,6 +228,15 @@ def cmd_api(args):
 
 def main():
     """Main CLI entry point"""
+    # Extractors, agents and workflow steps report progress through logging; show it like the
+    # other console output (scoped to src.* so httpx/openai request logs stay quiet)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    for name in ("src.extractors", "src.agents", "src.workflows"):
+        progress_logger = logging.getLogger(name)
+        progress_logger.addHandler(handler)
+        progress_logger.setLevel(logging.INFO)
+
     parser = argparse.ArgumentParser(
         description="Website Analyzer CLI - Comprehensive SEO, Performance, and UI/UX analysis",
         formatter_class=argparse.RawDescriptionHelpFormatter,
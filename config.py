@@ -26,6 +26,97 @@ class Config:
         ""  # Add your key here or set as environment variable (optional)
     )
 
+    # ===========================================
+    # API SERVER SETTINGS
+    # ===========================================
+
+    # Maximum number of analysis records kept in memory by the REST API
+    ANALYSIS_STORE_MAXSIZE = int(os.getenv("ANALYSIS_STORE_MAXSIZE", "10000"))
+
+    # Seconds an analysis record stays available for status polling
+    ANALYSIS_STORE_TTL = int(os.getenv("ANALYSIS_STORE_TTL", "3600"))
+
+    # Worker processes used to run analyses off the API event loop
+    ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", str(os.cpu_count() or 1)))
+
+    # Completed analyses reused for identical input (0 disables the cache)
+    ANALYSIS_CACHE_MAXSIZE = int(os.getenv("ANALYSIS_CACHE_MAXSIZE", "1024"))
+
+    # Seconds a cached analysis result is considered fresh
+    ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", str(6 * 3600)))
+
+    # Comma-separated origins allowed by CORS ("*" for any, empty to disable CORS)
+    CORS_ORIGINS = [
+        origin.strip()
+        for origin in os.getenv("CORS_ORIGINS", "*").split(",")
+        if origin.strip()
+    ]
+
+    # ===========================================
+    # PLAYGROUND SETTINGS
+    # ===========================================
+
+    # Development mode: auto-reload the playground on code changes
+    DEBUG = os.getenv("DEBUG", "false").lower() in ("1", "true", "yes")
+
+    # Playground worker processes (ignored in DEBUG mode, where reload is used)
+    WEB_WORKERS = int(os.getenv("WEB_WORKERS", "1"))
+
+    # ===========================================
+    # LLM RESPONSE CACHE
+    # ===========================================
+
+    # Serve repeated identical agent calls from cache instead of the OpenAI API
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+    # Maximum number of cached agent responses
+    LLM_CACHE_MAXSIZE = int(os.getenv("LLM_CACHE_MAXSIZE", "512"))
+
+    # Seconds a cached agent response stays valid
+    LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))
+
+    # Persist cached agent responses to disk so they survive between runs
+    LLM_CACHE_PERSIST = os.getenv("LLM_CACHE_PERSIST", "false").lower() in ("1", "true", "yes")
+
+    # Directory holding the persistent LLM cache (one JSON file per response)
+    LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".cache/llm")
+
+    # Opt-in: reuse UI/UX responses for near-identical prompts on the same screenshots (embedding similarity)
+    SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+
+    # Minimum cosine similarity for a semantic cache hit
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+
+    # ===========================================
+    # PAGESPEED INSIGHTS
+    # ===========================================
+
+    # Maximum number of PageSpeed Insights results kept in memory
+    PAGESPEED_CACHE_MAXSIZE = int(os.getenv("PAGESPEED_CACHE_MAXSIZE", "512"))
+
+    # Seconds a PageSpeed Insights result is reused for the same URL and strategy (0 disables)
+    PAGESPEED_CACHE_TTL = int(os.getenv("PAGESPEED_CACHE_TTL", "300"))
+
+    # ===========================================
+    # BROWSER AUTOMATION
+    # ===========================================
+
+    # Headless Chromium instances kept running for UI/UX screenshot capture
+    BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+
+    # URL captures allowed to run at once across all pooled browsers
+    BROWSER_MAX_SESSIONS = int(os.getenv("BROWSER_MAX_SESSIONS", "4"))
+
+    # Seconds a URL's screenshots and accessibility audit are reused (0 disables)
+    UIUX_CACHE_TTL = int(os.getenv("UIUX_CACHE_TTL", "3600"))
+
+    # Directory holding cached captures (screenshots plus one JSON file per URL)
+    UIUX_CACHE_DIR = os.getenv("UIUX_CACHE_DIR", ".cache/uiux")
+
+    # Vision detail level (low/high/auto) for the first screenshot and for further viewports
+    UIUX_PRIMARY_IMAGE_DETAIL = os.getenv("UIUX_PRIMARY_IMAGE_DETAIL", "auto")
+    UIUX_EXTRA_IMAGE_DETAIL = os.getenv("UIUX_EXTRA_IMAGE_DETAIL", "low")
+
     # ===========================================
     # HELPER METHODS
     # ===========================================
@@ -45,6 +136,14 @@ class Config:
         """Get PageSpeed API key (optional)"""
         return cls.PAGESPEED_API_KEY
 
+    @classmethod
+    def export_api_keys(cls):
+        """Export configured API keys to the environment (safe to call repeatedly)"""
+        if not os.environ.get("OPENAI_API_KEY"):
+            os.environ["OPENAI_API_KEY"] = cls.get_openai_key()
+        if cls.PAGESPEED_API_KEY and not os.environ.get("PAGESPEED_API_KEY"):
+            os.environ["PAGESPEED_API_KEY"] = cls.PAGESPEED_API_KEY
+
     @classmethod
     def validate_required_keys(cls):
         """Check if required API keys are configured"""
@@ -4,15 +4,9 @@ Agno Playground App for Website Analyzer
 Interactive web interface for testing the unified workflow
 """
 
-import os
 from config import Config
 from src.workflows.unified_workflow import unified_workflow
 
-# Set API keys
-os.environ["OPENAI_API_KEY"] = Config.get_openai_key()
-if Config.PAGESPEED_API_KEY:
-    os.environ["PAGESPEED_API_KEY"] = Config.PAGESPEED_API_KEY
-
 
 if __name__ == "__main__":
     # Validate configuration
@@ -27,13 +21,25 @@ if __name__ == "__main__":
         print("Please configure your OpenAI API key in config.py")
         exit(1)
 
+    Config.export_api_keys()
+
     print("\n" + "="*70)
     print("Starting Agno Playground...")
     print("="*70 + "\n")
 
+    # Auto-reload only while developing; reload re-imports and rebuilds every agent.
+    # The workflow and its agents are already built by the import above, so
+    # each worker starts warm instead of constructing them on its first request.
+    if Config.DEBUG:
+        serve_options = {"reload": True}
+    elif Config.WEB_WORKERS > 1:
+        serve_options = {"workers": Config.WEB_WORKERS}
+    else:
+        serve_options = {}
+
     # Serve the playground
     unified_workflow.serve(
         host="0.0.0.0",
         port=7777,
-        reload=True
+        **serve_options
     )
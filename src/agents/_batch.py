@@ -0,0 +1,126 @@
+"""
+OpenAI Batch API Helpers
+Submit agent prompts as a single /v1/batches job for non-interactive bulk runs.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.agent import Agent
+
+logger = logging.getLogger(__name__)
+
+# Batch statuses after which the job will not make further progress
+TERMINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _system_prompt(agent: Agent) -> str:
+    """Flatten an agent's description and instructions into one system message"""
+    parts = []
+    if agent.description:
+        parts.append(agent.description)
+
+    instructions = agent.instructions
+    if isinstance(instructions, (list, tuple)):
+        parts.append("\n".join(instructions))
+    elif instructions:
+        parts.append(str(instructions))
+
+    if agent.markdown:
+        parts.append("Use markdown to format your answers.")
+    return "\n\n".join(parts)
+
+
+def batch_request(custom_id: str, agent: Agent, input: str) -> Dict[str, Any]:
+    """
+    Build one Batch API request line for an agent call.
+
+    Args:
+        custom_id: Identifier used to match the response to this request
+        agent: Agent whose model and instructions are used
+        input: User message sent to the agent
+
+    Returns:
+        Dict in the /v1/chat/completions batch line format
+    """
+    body: Dict[str, Any] = {
+        "model": agent.model.id,
+        "messages": [
+            {"role": "system", "content": _system_prompt(agent)},
+            {"role": "user", "content": input},
+        ],
+    }
+    temperature = getattr(agent.model, "temperature", None)
+    if temperature is not None:
+        body["temperature"] = temperature
+
+    return {"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body}
+
+
+def run_batch(requests: List[Dict[str, Any]], poll_interval: int = 30, client: Optional[Any] = None) -> Dict[str, str]:
+    """
+    Submit requests as one batch job and wait for it to finish.
+
+    Batch jobs are billed at the discounted batch rate but may take up to the
+    24h completion window, so this is only meant for bulk, non-interactive runs.
+
+    Args:
+        requests: Lines built with batch_request()
+        poll_interval: Seconds between status checks
+        client: OpenAI client (a default client is created when None)
+
+    Returns:
+        Dict mapping custom_id to the response text (error message on failure)
+    """
+    if not requests:
+        return {}
+
+    if client is None:
+        from openai import OpenAI
+        from src.agents._http import shared_http_client
+        client = OpenAI(http_client=shared_http_client)
+
+    payload = "\n".join(json.dumps(line) for line in requests).encode("utf-8")
+    batch_file = client.files.create(file=("batch.jsonl", payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info("[Batch] Submitted %d requests (batch %s)", len(requests), batch.id)
+
+    while batch.status not in TERMINAL_BATCH_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        if counts is not None:
+            logger.info("[Batch] %s: %s/%s completed", batch.status, counts.completed, counts.total)
+
+    results = {line["custom_id"]: f"[Batch] Request not completed (batch {batch.status})" for line in requests}
+
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        for line in client.files.content(file_id).text.splitlines():
+            if not line.strip():
+                continue
+            custom_id, content = _parse_result_line(json.loads(line))
+            results[custom_id] = content
+
+    logger.info("[Batch] Finished with status: %s", batch.status)
+    return results
+
+
+def _parse_result_line(line: Dict[str, Any]) -> Tuple[str, str]:
+    """Extract (custom_id, text) from one line of a batch output or error file"""
+    custom_id = line.get("custom_id", "")
+    response = line.get("response") or {}
+    body = response.get("body") or {}
+
+    if response.get("status_code") == 200 and body.get("choices"):
+        return custom_id, body["choices"][0]["message"]["content"] or ""
+
+    error = line.get("error") or body.get("error") or {}
+    return custom_id, f"[Batch] Error: {error.get('message', 'unknown error')}"
@@ -0,0 +1,347 @@
+"""
+LLM Response Cache
+Deterministic response cache shared by the analysis agents.
+"""
+
+import copy
+import functools
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, List, Optional, Protocol, Sequence, Tuple
+
+from agno.agent import Agent
+from cachetools import TTLCache
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached agent responses"""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss"""
+        ...
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store value under key (ttl in seconds, backend default when None)"""
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU cache with a fixed time-to-live.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        ttl: Seconds a cached response stays valid
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        # TTLCache uses a single ttl for all entries; per-call ttl is ignored
+        with self._lock:
+            self._cache[key] = value
+
+
+def _fingerprint(value: Any) -> Any:
+    """Reduce an agent input (str, dict, Message, Image, bytes) to JSON-safe data"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return {str(k): _fingerprint(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_fingerprint(v) for v in value]
+
+    # Media objects (agno.media.Image) - hash the payload, not the object
+    content = getattr(value, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return {"content": hashlib.sha256(content).hexdigest(), "format": getattr(value, "format", None)}
+    if hasattr(value, "to_dict"):
+        return _fingerprint(value.to_dict())
+    return str(value)
+
+
+def manifest_digest(
+    model_id: str,
+    instructions: Any,
+    temperature: Optional[float] = None,
+    tools: Optional[Sequence[Any]] = None,
+) -> str:
+    """
+    Hash the static part of an LLM call (model configuration and prompt).
+
+    Args:
+        model_id: Model identifier (e.g. gpt-4o-mini)
+        instructions: Agent instructions (string or list of strings)
+        temperature: Sampling temperature configured on the model
+        tools: Tools available to the agent
+
+    Returns:
+        Hex digest identifying the agent configuration
+    """
+    payload = {
+        "model": model_id,
+        "instructions": _fingerprint(instructions),
+        "temperature": temperature,
+        "tools": sorted(str(getattr(t, "name", t)) for t in (tools or [])),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def llm_cache_key(
+    model_id: str,
+    instructions: Any,
+    input: Any,
+    temperature: Optional[float] = None,
+    tools: Optional[Sequence[Any]] = None,
+    images: Optional[Sequence[Any]] = None,
+    manifest: Optional[str] = None,
+) -> str:
+    """
+    Build a deterministic SHA-256 cache key for an LLM call.
+
+    Args:
+        model_id: Model identifier (e.g. gpt-4o-mini)
+        instructions: Agent instructions (string or list of strings)
+        input: Message sent to the agent
+        temperature: Sampling temperature configured on the model
+        tools: Tools available to the agent
+        images: Images attached to the call
+        manifest: Precomputed manifest_digest() of the other arguments (optional)
+
+    Returns:
+        Hex digest identifying the call
+    """
+    payload = {
+        "manifest": manifest or manifest_digest(model_id, instructions, temperature, tools),
+        "input": _fingerprint(input),
+        "images": _fingerprint(list(images or [])),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _default_backend() -> Optional[CacheBackend]:
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+    if Config.LLM_CACHE_PERSIST:
+        from src.agents._disk_cache import DiskCacheBackend
+        return DiskCacheBackend(Config.LLM_CACHE_DIR, maxsize=Config.LLM_CACHE_MAXSIZE, ttl=Config.LLM_CACHE_TTL)
+    return MemoryCacheBackend(maxsize=Config.LLM_CACHE_MAXSIZE, ttl=Config.LLM_CACHE_TTL)
+
+
+# Process-wide backend shared by every CachedAgent (None when caching is disabled)
+llm_cache: Optional[CacheBackend] = _default_backend()
+
+
+class CachedAgent(Agent):
+    """
+    Agent that serves repeated non-streaming calls from the LLM response cache.
+
+    Identical (model, instructions, input, temperature, tools, images) calls
+    return a copy of the first RunOutput instead of calling the model again.
+    Streaming calls always go to the model.
+    """
+
+    @functools.cached_property
+    def _manifest(self) -> str:
+        # Instructions and model settings are static, so serialize them once per agent
+        return manifest_digest(
+            model_id=getattr(self.model, "id", ""),
+            instructions=self.instructions,
+            temperature=getattr(self.model, "temperature", None),
+            tools=self.tools,
+        )
+
+    def _cache_key(self, input: Any, images: Optional[Sequence[Any]]) -> str:
+        return llm_cache_key(
+            model_id=getattr(self.model, "id", ""),
+            instructions=self.instructions,
+            input=input,
+            images=images,
+            manifest=self._manifest,
+        )
+
+    def _cache_get(self, key: str, input: Any, images: Optional[Sequence[Any]]) -> Optional[Any]:
+        return llm_cache.get(key)
+
+    def _cache_set(self, key: str, input: Any, images: Optional[Sequence[Any]], result: Any) -> None:
+        llm_cache.set(key, copy.deepcopy(result))
+
+    def run(self, input: Any, *, stream: Optional[bool] = None, images: Optional[Sequence[Any]] = None, **kwargs: Any):
+        if stream or llm_cache is None:
+            return super().run(input, stream=stream, images=images, **kwargs)
+
+        key = self._cache_key(input, images)
+        cached = self._cache_get(key, input, images)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = super().run(input, stream=stream, images=images, **kwargs)
+        if getattr(result, "content", None) is not None:
+            self._cache_set(key, input, images, result)
+        return result
+
+    def arun(self, input: Any, *, stream: Optional[bool] = None, images: Optional[Sequence[Any]] = None, **kwargs: Any):
+        if stream or llm_cache is None:
+            return super().arun(input, stream=stream, images=images, **kwargs)
+        return self._cached_arun(input, images=images, **kwargs)
+
+    async def _cached_arun(self, input: Any, images: Optional[Sequence[Any]] = None, **kwargs: Any):
+        key = self._cache_key(input, images)
+        cached = self._cache_get(key, input, images)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = await super().arun(input, stream=False, images=images, **kwargs)
+        if getattr(result, "content", None) is not None:
+            self._cache_set(key, input, images, result)
+        return result
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour response cache keyed by prompt embeddings.
+
+    Entries are partitioned by an exact fingerprint (e.g. hashes of attached
+    screenshots), and within a partition a cached response is reused when the
+    cosine similarity of the prompt embeddings reaches the threshold. Vectors
+    are stored normalized so similarity is a plain dot product over a bounded
+    list, which stays cheap next to the LLM call it replaces.
+
+    Args:
+        threshold: Minimum cosine similarity for a hit (0-1)
+        maxsize: Maximum number of cached responses
+        ttl: Seconds a cached response stays valid
+        embedding_model: OpenAI embedding model used for prompts
+    """
+
+    # Embedding models accept ~8k tokens; long prompts are compared on their prefix
+    MAX_EMBED_CHARS = 24000
+
+    def __init__(self, threshold: float, maxsize: int, ttl: int, embedding_model: str = "text-embedding-3-small"):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.embedding_model = embedding_model
+        self._entries: deque = deque(maxlen=maxsize)
+        self._vectors: OrderedDict = OrderedDict()  # exact key -> embedding, reused between lookup and add
+        self._lock = threading.Lock()
+        self._client = None
+
+    def _embed(self, key: str, text: str) -> List[float]:
+        with self._lock:
+            if key in self._vectors:
+                return self._vectors[key]
+
+        if self._client is None:
+            from openai import OpenAI
+            from src.agents._http import shared_http_client
+            self._client = OpenAI(http_client=shared_http_client)
+
+        response = self._client.embeddings.create(input=text[:self.MAX_EMBED_CHARS], model=self.embedding_model)
+        vector = response.data[0].embedding
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        vector = [v / norm for v in vector]
+
+        with self._lock:
+            self._vectors[key] = vector
+            while len(self._vectors) > (self._entries.maxlen or 1):
+                self._vectors.popitem(last=False)
+        return vector
+
+    def get(self, key: str, partition: str, text: str) -> Optional[Any]:
+        """Return the most similar cached response in partition, or None"""
+        now = time.monotonic()
+
+        # Cold partitions are a guaranteed miss: skip the embedding round trip
+        with self._lock:
+            if not any(entry_partition == partition and expires_at >= now
+                       for expires_at, entry_partition, _, _ in self._entries):
+                return None
+
+        vector = self._embed(key, text)
+        best: Tuple[float, Any] = (self.threshold, None)
+
+        with self._lock:
+            for expires_at, entry_partition, entry_vector, value in self._entries:
+                if expires_at < now or entry_partition != partition:
+                    continue
+                similarity = sum(a * b for a, b in zip(vector, entry_vector))
+                if similarity >= best[0]:
+                    best = (similarity, value)
+        return best[1]
+
+    def add(self, key: str, partition: str, text: str, value: Any) -> None:
+        """Cache value under the embedding of text"""
+        vector = self._embed(key, text)
+        with self._lock:
+            self._entries.append((time.monotonic() + self.ttl, partition, vector, value))
+
+
+def _default_semantic_cache() -> Optional[SemanticCache]:
+    if not (Config.LLM_CACHE_ENABLED and Config.SEMANTIC_CACHE_ENABLED):
+        return None
+    return SemanticCache(
+        threshold=Config.SEMANTIC_CACHE_THRESHOLD,
+        maxsize=Config.LLM_CACHE_MAXSIZE,
+        ttl=Config.LLM_CACHE_TTL,
+    )
+
+
+# Process-wide semantic layer used by SemanticCachedAgent
+semantic_cache: Optional[SemanticCache] = _default_semantic_cache()
+
+
+class SemanticCachedAgent(CachedAgent):
+    """
+    CachedAgent that also reuses responses for semantically similar prompts.
+
+    Used for the vision agent, whose prompts vary slightly from run to run.
+    Attached images must match exactly; only the text part of the prompt is
+    compared by embedding similarity. Calls without images only use the exact
+    cache, since nothing would tie a similar prompt to the same analyzed page.
+    """
+
+    def _semantic_parts(self, input: Any, images: Optional[Sequence[Any]]) -> Tuple[str, str]:
+        text = input if isinstance(input, str) else json.dumps(_fingerprint(input), sort_keys=True)
+        partition = hashlib.sha256(json.dumps({
+            "manifest": self._manifest,
+            "images": _fingerprint(list(images or [])),
+        }, sort_keys=True).encode("utf-8")).hexdigest()
+        return partition, text
+
+    def _cache_get(self, key: str, input: Any, images: Optional[Sequence[Any]]) -> Optional[Any]:
+        cached = super()._cache_get(key, input, images)
+        if cached is not None or semantic_cache is None or not images:
+            return cached
+        try:
+            partition, text = self._semantic_parts(input, images)
+            return semantic_cache.get(key, partition, text)
+        except Exception as e:
+            # Embedding failures must never block the actual analysis
+            logger.warning("[!] Semantic cache lookup failed: %s", e)
+            return None
+
+    def _cache_set(self, key: str, input: Any, images: Optional[Sequence[Any]], result: Any) -> None:
+        super()._cache_set(key, input, images, result)
+        if semantic_cache is None or not images:
+            return
+        try:
+            partition, text = self._semantic_parts(input, images)
+            semantic_cache.add(key, partition, text, copy.deepcopy(result))
+        except Exception as e:
+            logger.warning("[!] Semantic cache update failed: %s", e)
@@ -0,0 +1,75 @@
+"""
+Classifier Category Cache
+Coarse input categories so one classifier decision covers many similar payloads.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, Optional
+
+from config import Config
+from src.agents._cache import MemoryCacheBackend
+
+# Only the start of the input identifies its category; body copy is ignored
+CATEGORY_PREFIX_LENGTH = 256
+
+# Upper bounds (characters) of the length buckets
+LENGTH_BUCKETS = ((1_000, "lt1k"), (10_000, "1k-10k"), (100_000, "10k-100k"))
+
+FEATURE_PATTERNS = {
+    "has_html": re.compile(r"<html", re.IGNORECASE),
+    "has_body": re.compile(r"<body", re.IGNORECASE),
+    "has_title": re.compile(r"<title", re.IGNORECASE),
+    "has_og": re.compile(r"""property=["']og:""", re.IGNORECASE),
+    "has_url": re.compile(r"https?://", re.IGNORECASE),
+}
+
+# Types whose normalized_input is the input itself, so a decision can be reused
+# for another payload in the same category (URL/screenshot answers embed the
+# extracted value and are only served from the exact-match LLM cache)
+CATEGORY_CACHEABLE_TYPES = {"html", "unknown"}
+
+
+def category_key(text: str) -> str:
+    """
+    Build a coarse category key for classifier input.
+
+    Args:
+        text: Classifier input string
+
+    Returns:
+        Key such as "html:1k-10k:has_body:has_title:<prefix hash>"
+    """
+    kind = "html" if "<" in text and ">" in text else "text"
+    bucket = next((name for limit, name in LENGTH_BUCKETS if len(text) < limit), "gt100k")
+    features = [name for name, pattern in FEATURE_PATTERNS.items() if pattern.search(text)]
+    prefix = hashlib.sha256(text[:CATEGORY_PREFIX_LENGTH].encode("utf-8")).hexdigest()[:16]
+    return ":".join([kind, bucket, *features, prefix])
+
+
+def _default_classification_cache() -> Optional[MemoryCacheBackend]:
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+    return MemoryCacheBackend(maxsize=Config.LLM_CACHE_MAXSIZE, ttl=Config.LLM_CACHE_TTL)
+
+
+# Classifier decisions keyed by category_key()
+classification_cache: Optional[MemoryCacheBackend] = _default_classification_cache()
+
+
+def get_cached_classification(text: str) -> Optional[Dict[str, Any]]:
+    """Return a cached classification for text's category, or None on a miss"""
+    if classification_cache is None:
+        return None
+    decision = classification_cache.get(category_key(text))
+    if decision is None:
+        return None
+    return {**decision, "normalized_input": text.strip()}
+
+
+def cache_classification(text: str, classification: Dict[str, Any]) -> None:
+    """Store a classifier decision for text's category (only for reusable types)"""
+    if classification_cache is None or classification.get("type") not in CATEGORY_CACHEABLE_TYPES:
+        return
+    decision = {k: v for k, v in classification.items() if k != "normalized_input"}
+    classification_cache.set(category_key(text), decision)
@@ -0,0 +1,100 @@
+"""
+Persistent LLM Response Cache
+JSON-file cache backend so repeated runs across processes reuse agent responses.
+
+Usage:
+    python -m src.agents._disk_cache --clear
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from config import Config
+
+
+class DiskCacheBackend:
+    """
+    Cache backend storing one human-readable JSON file per cache key.
+
+    Each file holds {"response": <RunOutput dict>, "model": str, "created": iso8601}.
+    Entries older than the ttl are treated as misses, and the oldest files are
+    removed once more than maxsize entries exist.
+
+    Args:
+        directory: Folder holding the cache files
+        maxsize: Maximum number of cached responses
+        ttl: Seconds a cached response stays valid
+    """
+
+    def __init__(self, directory: str, maxsize: int, ttl: int):
+        self.directory = Path(directory)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        from agno.run.agent import RunOutput
+        return RunOutput.from_dict(entry["response"])
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        # Entry age comes from the file mtime; per-call ttl is ignored
+        entry = {
+            "response": value.to_dict(),
+            "model": getattr(value, "model", None),
+            "created": datetime.now().isoformat(),
+        }
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path(key).with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(entry, indent=2, default=str), encoding="utf-8")
+            os.replace(tmp_path, self._path(key))
+            self._prune()
+
+    def _prune(self) -> None:
+        files = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in files[:max(0, len(files) - self.maxsize)]:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """Delete all cached responses and return how many were removed"""
+        removed = 0
+        with self._lock:
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the persistent LLM response cache")
+    parser.add_argument("--clear", action="store_true", help="Delete all cached responses")
+    args = parser.parse_args()
+
+    backend = DiskCacheBackend(Config.LLM_CACHE_DIR, Config.LLM_CACHE_MAXSIZE, Config.LLM_CACHE_TTL)
+    if args.clear:
+        print(f"[OK] Removed {backend.clear()} cached responses from {backend.directory}")
+    else:
+        count = len(list(backend.directory.glob("*.json")))
+        print(f"LLM cache directory: {backend.directory} ({count} entries)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""
+Shared HTTP Client
+One pooled connection to the OpenAI API shared by every agent model.
+"""
+
+import atexit
+import importlib.util
+
+import httpx
+
+# Keep-alive connections kept open to api.openai.com across agent calls
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Sync calls (Agent.run) only: arun paths use the async client agno creates per model.
+# No shared httpx.AsyncClient, because its connections are bound to the event loop that
+# opened them and analyze_iter()/the vision step start a fresh loop with asyncio.run().
+shared_http_client = httpx.Client(
+    # HTTP/2 multiplexes concurrent agent calls over one TLS session (needs the h2 package)
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+    timeout=httpx.Timeout(600.0, connect=10.0),
+)
+
+atexit.register(shared_http_client.close)
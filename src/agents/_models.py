@@ -0,0 +1,23 @@
+"""
+Shared Model Instances
+One OpenAIChat per model id, reused by every agent on that model.
+"""
+
+import functools
+
+from agno.models.openai import OpenAIChat
+from src.agents._http import shared_http_client
+
+
+@functools.lru_cache(maxsize=None)
+def model(model_id: str) -> OpenAIChat:
+    """
+    Return the shared OpenAIChat instance for a model id.
+
+    Args:
+        model_id: The OpenAI model ID (e.g. gpt-4o-mini)
+
+    Returns:
+        OpenAIChat bound to the shared HTTP client
+    """
+    return OpenAIChat(id=model_id, http_client=shared_http_client)
@@ -3,20 +3,33 @@ Input Classifier Agent
 Intelligent agent that detects input type (URL, HTML, or Screenshot) and routes to appropriate workflow.
 """
 
+import functools
+
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from src.instructions.classifier_instructions import CLASSIFIER_INSTRUCTIONS
+from src.agents._cache import CachedAgent
+from src.agents._models import model
+from src.instructions.classifier_instructions import get_classifier_instructions
 
 
 # Input Classifier Agent
-input_classifier = Agent(
-    name="Input Classifier",
-    model=OpenAIChat(id="gpt-4o-mini"),  # Fast, efficient for classification
-    instructions=CLASSIFIER_INSTRUCTIONS,
-    markdown=False,  # We want JSON output, not markdown
-    description=(
-        "Intelligent classifier that analyzes user input and determines whether "
-        "it's a URL, raw HTML, screenshot path/data, or unknown format. Routes "
-        "input to the appropriate analysis workflow."
-    ),
-)
+@functools.lru_cache(maxsize=1)
+def get_input_classifier() -> Agent:
+    """Return the shared Input Classifier Agent, created on first use"""
+    return CachedAgent(
+        name="Input Classifier",
+        model=model("gpt-4o-mini"),  # Fast, efficient for classification
+        instructions=get_classifier_instructions(),
+        markdown=False,  # We want JSON output, not markdown
+        description=(
+            "Intelligent classifier that analyzes user input and determines whether "
+            "it's a URL, raw HTML, screenshot path/data, or unknown format. Routes "
+            "input to the appropriate analysis workflow."
+        ),
+    )
+
+
+def __getattr__(name: str):
+    # Backward compatibility for `from src.agents.classifier_agent import input_classifier`
+    if name == "input_classifier":
+        return get_input_classifier()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,140 @@
+"""
+Fast Input Classifier
+Rule-based routing for unambiguous inputs, checked before the LLM classifier.
+"""
+
+import base64
+import binascii
+import json
+import re
+from typing import Any, Dict, Optional
+
+# Whole input is a single URL (no surrounding natural language)
+URL_PATTERN = re.compile(r"^https?://[^\s/$.?#][^\s]*$", re.IGNORECASE)
+
+# URLs inside natural language ("Please analyze https://example.com for SEO")
+URL_SEARCH_PATTERN = re.compile(r"https?://[^\s'\"<>]+", re.IGNORECASE)
+URL_TRAILING_PUNCTUATION = ".,;:!?)]}'\""
+
+# Only the start of a document is inspected for HTML markers
+HTML_SNIFF_LENGTH = 1000
+HTML_MARKERS = ("<html", "<head", "<body", "<!doctype")
+
+# Common tags that identify an HTML snippet without document structure
+HTML_TAG_PATTERN = re.compile(r"<\s*(?:html|head|body|div|p|span|a|img|section|h[1-6])\b", re.IGNORECASE)
+
+# Single image path: Windows drive, relative (./, ../), home or plain path
+IMAGE_PATH_PATTERN = re.compile(
+    r"^(?:[A-Za-z]:[\\/]|\.{1,2}[\\/]|~[\\/]|[\\/])?[^\n<>\"|?*]*\.(?:png|jpe?g|webp)$",
+    re.IGNORECASE,
+)
+
+# Inline image data (data URIs or long bare base64 runs) shown to the LLM as a fingerprint
+BASE64_MIN_LENGTH = 256
+BASE64_IMAGE_PATTERN = re.compile(
+    r"(?:data:image/[\w.+-]+;base64,)?[A-Za-z0-9+/]{%d,}={0,2}" % BASE64_MIN_LENGTH
+)
+
+# Base64 characters decoded from each end of a payload (multiple of 4)
+BASE64_FINGERPRINT_CHARS = 24
+
+IMAGE_SIGNATURES = ((b"\x89PNG", "png"), (b"\xff\xd8\xff", "jpeg"), (b"GIF8", "gif"), (b"RIFF", "webp"))
+
+
+def classify_fast(input_data: Any) -> Optional[Dict[str, str]]:
+    """
+    Classify inputs whose type is obvious without calling the LLM.
+
+    Args:
+        input_data: Raw workflow input (string or dict)
+
+    Returns:
+        Classification dict in the same format as the Input Classifier Agent,
+        or None when the input is ambiguous and needs the LLM
+    """
+    if isinstance(input_data, dict):
+        if "screenshot" in input_data or "screenshots" in input_data:
+            input_type = "screenshot"
+        elif isinstance(input_data.get("url"), str) and URL_PATTERN.match(input_data["url"].strip()):
+            input_type = "url"
+        elif "html" in input_data:
+            input_type = "html"
+        else:
+            return None
+        return _classification(input_type, f"Structured input with '{input_type}' key", input_data)
+
+    if not isinstance(input_data, str):
+        return None
+
+    text = input_data.strip()
+    if URL_PATTERN.match(text):
+        return _classification("url", "Input is a single URL with http(s) protocol", text)
+
+    # JSON text such as '{"screenshots": {...}}' is classified like a dict
+    if text.startswith("{") and text.endswith("}"):
+        try:
+            parsed = json.loads(text)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, dict):
+            return classify_fast(parsed)
+
+    if text.startswith("<"):
+        head = text[:HTML_SNIFF_LENGTH].lower()
+        if text.endswith(">") and any(marker in head for marker in HTML_MARKERS):
+            return _classification("html", "Input is an HTML document", text)
+        if HTML_TAG_PATTERN.search(head):
+            return _classification("html", "Input is an HTML snippet without document structure", text, "medium")
+
+    if IMAGE_PATH_PATTERN.match(text):
+        return _classification("screenshot", "Input is an image file path", {"screenshot": text})
+
+    # Natural language with exactly one URL and no markup
+    if "<" not in text:
+        urls = {match.rstrip(URL_TRAILING_PUNCTUATION) for match in URL_SEARCH_PATTERN.findall(text)}
+        if len(urls) == 1:
+            return _classification("url", "Natural language input containing one URL", urls.pop())
+
+    return None
+
+
+def _classification(input_type: str, reasoning: str, normalized_input: Any, confidence: str = "high") -> Dict[str, str]:
+    return {
+        "type": input_type,
+        "confidence": confidence,
+        "reasoning": f"{reasoning} (rule-based)",
+        "normalized_input": normalized_input if isinstance(normalized_input, str) else json.dumps(normalized_input),
+    }
+
+
+def fingerprint_base64(text: str) -> str:
+    """
+    Replace inline base64 image data with a short fingerprint.
+
+    The classifier only needs to know that image data is present, so the
+    multi-megabyte payload is not sent to the LLM.
+
+    Args:
+        text: Classifier input string
+
+    Returns:
+        Text with each payload replaced by
+        "<base64 png, N bytes, head=<hex>, tail=<hex>>"
+    """
+    return BASE64_IMAGE_PATTERN.sub(_base64_fingerprint, text)
+
+
+def _base64_fingerprint(match: "re.Match[str]") -> str:
+    payload = match.group(0).split(",", 1)[-1]
+    size = len(payload) * 3 // 4 - payload.count("=")
+
+    # Decode only aligned 4-character groups from each end
+    aligned_end = len(payload) - len(payload) % 4
+    try:
+        head = base64.b64decode(payload[:BASE64_FINGERPRINT_CHARS])
+        tail = base64.b64decode(payload[max(0, aligned_end - BASE64_FINGERPRINT_CHARS):aligned_end])
+    except (binascii.Error, ValueError):
+        return match.group(0)
+
+    image_type = next((name for signature, name in IMAGE_SIGNATURES if head.startswith(signature)), "data")
+    return f"<base64 {image_type}, {size} bytes, head={head[:16].hex()}, tail={tail[-16:].hex()}>"
@@ -3,8 +3,11 @@ Technical Performance Analysis Agent
 Configures the performance analyst agent with specialized instructions.
 """
 
+import functools
+
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
+from src.agents._cache import CachedAgent
+from src.agents._models import model
 from src.instructions.performance_instructions import PERFORMANCE_ANALYST_INSTRUCTIONS
 
 
@@ -19,9 +22,9 @@ def create_performance_analyst(model_id: str = "gpt-4o-mini") -> Agent:
         Configured Agent instance
     """
 
-    performance_analyst = Agent(
+    performance_analyst = CachedAgent(
         name="Technical Performance Analyst",
-        model=OpenAIChat(id=model_id),
+        model=model(model_id),
         instructions=PERFORMANCE_ANALYST_INSTRUCTIONS,
         markdown=True,
         description="Expert in web performance optimization, Core Web Vitals, and technical SEO",
@@ -30,5 +33,14 @@ def create_performance_analyst(model_id: str = "gpt-4o-mini") -> Agent:
     return performance_analyst
 
 
-# Create default instance
-performance_analyst = create_performance_analyst()
+@functools.lru_cache(maxsize=1)
+def get_performance_analyst(model_id: str = "gpt-4o-mini") -> Agent:
+    """Return the shared Technical Performance Analysis Agent, created on first use"""
+    return create_performance_analyst(model_id)
+
+
+def __getattr__(name: str):
+    # Backward compatibility for `from src.agents.performance_agent import performance_analyst`
+    if name == "performance_analyst":
+        return get_performance_analyst()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
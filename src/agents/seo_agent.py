@@ -3,8 +3,11 @@ SEO Analysis Agent
 Defines the agent responsible for analyzing SEO features.
 """
 
+import functools
+
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
+from src.agents._cache import CachedAgent
+from src.agents._models import model
 from src.instructions.seo_instructions import SEO_ANALYST_INSTRUCTIONS
 
 
@@ -18,9 +21,9 @@ def create_seo_analyst(model_id: str = "gpt-4o-mini") -> Agent:
     Returns:
         Configured Agent instance for SEO analysis
     """
-    seo_analyst = Agent(
+    seo_analyst = CachedAgent(
         name = "SEO Analyst",
-        model = OpenAIChat(id=model_id),
+        model = model(model_id),
         instructions = SEO_ANALYST_INSTRUCTIONS,
         markdown = True,
     )
@@ -28,5 +31,14 @@ def create_seo_analyst(model_id: str = "gpt-4o-mini") -> Agent:
     return seo_analyst
 
 
-# Create default instance
-seo_analyst = create_seo_analyst()
+@functools.lru_cache(maxsize=1)
+def get_seo_analyst(model_id: str = "gpt-4o-mini") -> Agent:
+    """Return the shared SEO Analysis Agent, created on first use"""
+    return create_seo_analyst(model_id)
+
+
+def __getattr__(name: str):
+    # Backward compatibility for `from src.agents.seo_agent import seo_analyst`
+    if name == "seo_analyst":
+        return get_seo_analyst()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,20 +3,33 @@ Summary Analyst Agent
 Expert agent for synthesizing SEO, Performance, and UI/UX analyses into actionable insights.
 """
 
+import functools
+
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from src.instructions.summary_instructions import SUMMARY_ANALYST_INSTRUCTIONS
+from src.agents._cache import CachedAgent
+from src.agents._models import model
+from src.instructions.summary_instructions import get_summary_instructions
 
 
 # Summary Analyst Agent
-summary_analyst = Agent(
-    name="Website Analyst",
-    model=OpenAIChat(id="gpt-4o-mini"),  # Text-based analysis is sufficient
-    instructions=SUMMARY_ANALYST_INSTRUCTIONS,
-    markdown=True,
-    description=(
-        "Expert website analyst specializing in synthesizing comprehensive analysis "
-        "reports. Combines SEO, Performance, and UI/UX findings into actionable "
-        "recommendations and executive summaries."
-    ),
-)
+@functools.lru_cache(maxsize=1)
+def get_summary_analyst() -> Agent:
+    """Return the shared Summary Analyst Agent, created on first use"""
+    return CachedAgent(
+        name="Website Analyst",
+        model=model("gpt-4o-mini"),  # Text-based analysis is sufficient
+        instructions=get_summary_instructions(),
+        markdown=True,
+        description=(
+            "Expert website analyst specializing in synthesizing comprehensive analysis "
+            "reports. Combines SEO, Performance, and UI/UX findings into actionable "
+            "recommendations and executive summaries."
+        ),
+    )
+
+
+def __getattr__(name: str):
+    # Backward compatibility for `from src.agents.summary_agent import summary_analyst`
+    if name == "summary_analyst":
+        return get_summary_analyst()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
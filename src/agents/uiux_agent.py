@@ -3,20 +3,33 @@ UI/UX Analyst Agent
 Expert agent for analyzing visual design, user experience, and accessibility.
 """
 
+import functools
+
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from src.instructions.uiux_instructions import UIUX_ANALYSIS_INSTRUCTIONS
+from src.agents._cache import SemanticCachedAgent
+from src.agents._models import model
+from src.instructions.uiux_instructions import get_uiux_instructions
 
 
 # UI/UX Analyst Agent with Vision Capabilities
-uiux_analyst = Agent(
-    name="UI/UX Analyst",
-    model=OpenAIChat(id="gpt-4o"),  # Vision-capable model
-    instructions=UIUX_ANALYSIS_INSTRUCTIONS,
-    markdown=True,
-    description=(
-        "Expert UI/UX analyst specializing in visual design, user experience, "
-        "accessibility, and modern web design practices. Analyzes screenshots "
-        "and accessibility data to provide comprehensive UI/UX insights."
-    ),
-)
+@functools.lru_cache(maxsize=1)
+def get_uiux_analyst() -> Agent:
+    """Return the shared UI/UX Analyst Agent, created on first use"""
+    return SemanticCachedAgent(
+        name="UI/UX Analyst",
+        model=model("gpt-4o"),  # Vision-capable model
+        instructions=get_uiux_instructions(),
+        markdown=True,
+        description=(
+            "Expert UI/UX analyst specializing in visual design, user experience, "
+            "accessibility, and modern web design practices. Analyzes screenshots "
+            "and accessibility data to provide comprehensive UI/UX insights."
+        ),
+    )
+
+
+def __getattr__(name: str):
+    # Backward compatibility for `from src.agents.uiux_agent import uiux_analyst`
+    if name == "uiux_analyst":
+        return get_uiux_analyst()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
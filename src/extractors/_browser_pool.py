@@ -0,0 +1,115 @@
+"""
+Shared Browser Pool
+Persistent headless Chromium instances reused across UI/UX extractions.
+"""
+
+import asyncio
+import atexit
+import itertools
+import logging
+import threading
+from typing import Any, Awaitable, List, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Lazily launched Chromium browsers owned by one background event loop.
+
+    Playwright objects are bound to the event loop that created them, so the
+    pool runs its own loop in a daemon thread and every coroutine that uses a
+    pooled browser is executed there via run() / run_async(). Callers only
+    create and close browser contexts; the browsers stay up until exit.
+
+    Args:
+        size: Number of browsers handed out round-robin
+        max_sessions: Maximum number of capture sessions running at once
+    """
+
+    def __init__(self, size: int, max_sessions: int):
+        self.size = max(1, size)
+        self.max_sessions = max(1, max_sessions)
+        self._sessions: Optional[asyncio.Semaphore] = None
+        self._launch_lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._playwright = None
+        self._browsers: List[Any] = []
+        self._next_index = itertools.count()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="browser-pool", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+            return self._loop
+
+    def run(self, coroutine: Awaitable[Any]) -> Any:
+        """Run a coroutine on the pool loop and block until it finishes"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop()).result()
+
+    async def run_async(self, coroutine: Awaitable[Any]) -> Any:
+        """Await a coroutine on the pool loop from any other event loop"""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop()))
+
+    async def get_browser(self) -> Any:
+        """
+        Return the next pooled browser, launching or relaunching it as needed.
+
+        Must be awaited on the pool loop (inside a coroutine passed to run()).
+        """
+        # Concurrent sessions must not start Playwright or launch a browser twice
+        async with self._launch_lock:
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+                self._playwright = await async_playwright().start()
+                self._browsers = [None] * self.size
+
+            index = next(self._next_index) % self.size
+            browser = self._browsers[index]
+            if browser is None or not browser.is_connected():
+                browser = await self._playwright.chromium.launch(headless=True)
+                self._browsers[index] = browser
+            return browser
+
+    def session_slot(self) -> asyncio.Semaphore:
+        """
+        Semaphore limiting concurrent capture sessions (use with async with).
+
+        Must be used on the pool loop, like get_browser().
+        """
+        if self._sessions is None:
+            self._sessions = asyncio.Semaphore(self.max_sessions)
+        return self._sessions
+
+    async def _shutdown(self) -> None:
+        for browser in self._browsers:
+            if browser is not None and browser.is_connected():
+                await browser.close()
+        self._browsers = []
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def close(self) -> None:
+        """Close the browsers and stop the pool loop (registered with atexit)"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=10)
+        except Exception as e:
+            logger.error("[UI/UX] Error closing browser pool: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5)
+
+
+# Process-wide pool used by UIUXExtractor
+browser_pool = BrowserPool(Config.BROWSER_POOL_SIZE, Config.BROWSER_MAX_SESSIONS)
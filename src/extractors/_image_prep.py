@@ -0,0 +1,117 @@
+"""
+Screenshot Preprocessing
+Load, downscale and convert screenshot images.
+"""
+
+import functools
+import io
+import os
+
+# SIMD base64 encoder when pybase64 is installed (same API as the stdlib module)
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Longest edge (px) worth sending to the vision model; larger images are downscaled
+MAX_IMAGE_EDGE = 2048
+
+# Read size for streamed base64 encoding (a multiple of 3, so chunks need no padding)
+BASE64_CHUNK_SIZE = 192 * 1024
+
+
+def prepare_screenshot(path: str) -> bytes:
+    """
+    Return the image bytes for a screenshot file, memoized per file version.
+
+    Args:
+        path: Path to the screenshot file
+
+    Returns:
+        Image bytes (downscaled, in the file's own format, when the image is too large)
+    """
+    stat = os.stat(path)
+    return _prepare(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _prepare(path: str, mtime_ns: int, size: int) -> bytes:
+    # mtime_ns/size are part of the cache key so edited files are re-read
+    with open(path, "rb") as f:
+        image_bytes = f.read()
+    return downscale_image(image_bytes)
+
+
+def prepare_screenshot_base64(path: str) -> str:
+    """
+    Return the base64 payload for a screenshot file.
+
+    Files that need no downscaling are encoded in chunks while reading, so
+    the full file bytes and the full base64 string never coexist in memory.
+
+    Args:
+        path: Path to the screenshot file
+
+    Returns:
+        Base64 encoded image string
+    """
+    if _needs_downscale(path):
+        return base64.b64encode(prepare_screenshot(path)).decode("ascii")
+
+    encoded = bytearray()
+    with open(path, "rb") as f:
+        while chunk := f.read(BASE64_CHUNK_SIZE):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode("ascii")
+
+
+def _needs_downscale(path: str) -> bool:
+    """Check the image dimensions from the file header (False without Pillow)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return False
+
+    with Image.open(path) as image:
+        return max(image.size) > MAX_IMAGE_EDGE
+
+
+def downscale_image(image_bytes: bytes) -> bytes:
+    """Shrink images larger than MAX_IMAGE_EDGE (no-op when Pillow is not installed)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return image_bytes
+
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        if max(image.size) <= MAX_IMAGE_EDGE:
+            return image_bytes
+        # Keep the original format so the declared image format stays correct
+        image_format = image.format or "PNG"
+        image.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE))
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format, optimize=True)
+        return buffer.getvalue()
+
+
+def convert_image(image_bytes: bytes, image_format: str, quality: int) -> bytes:
+    """
+    Re-encode an image in another format.
+
+    Args:
+        image_bytes: Source image bytes
+        image_format: Pillow format name (e.g. WEBP, JPEG)
+        quality: Encoder quality for lossy formats (1-100)
+
+    Returns:
+        Encoded image bytes
+
+    Raises:
+        ImportError: If Pillow is not installed
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format, quality=quality)
+        return buffer.getvalue()
@@ -1,14 +1,183 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urlparse, urljoin
-import json
+import orjson
 import re
 from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Optional, Tuple
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import importlib.util
+
+# libxml2-backed parser is several times faster; fall back to the pure-Python one
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+HEADING_LEVELS = {f'h{level}': level for level in range(1, 7)}
+
+# <meta name=...> / <meta property=...> values mapped to SEOFeatures fields
+META_NAME_FIELDS = {
+    'description': 'meta_description',
+    'robots': 'meta_robots',
+    'twitter:card': 'twitter_card',
+    'twitter:title': 'twitter_title',
+    'twitter:description': 'twitter_description',
+}
+META_PROPERTY_FIELDS = {
+    'og:title': 'og_title',
+    'og:description': 'og_description',
+    'og:image': 'og_image',
+    'og:url': 'og_url',
+}
+
+BREADCRUMB_PATTERN = re.compile(r'breadcrumb', re.I)
+SEARCH_NAME_PATTERN = re.compile(r'search|query', re.I)
+LAST_MODIFIED_PATTERN = re.compile(r'last-modified|updated', re.I)
+
+# Full-page text scans use the RE2 DFA engine when google-re2 is installed
+try:
+    import re2 as text_re
+except ImportError:
+    text_re = re
+
+# Text scanning patterns
+WHITESPACE_PATTERN = re.compile(r'\s+')
+WORD_PATTERN = re.compile(r'\b\w+\b')
+KEYWORD_PATTERN = text_re.compile(r'\b[a-z]{3,}\b')
+EMAIL_PATTERN = text_re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE_PATTERN = text_re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+
+# Common stop words excluded from keyword analysis
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'her',
+    'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how',
+    'its', 'may', 'new', 'now', 'old', 'see', 'two', 'who', 'boy', 'did',
+    'she', 'use', 'way', 'this', 'that', 'with', 'have', 'from', 'they',
+    'been', 'more', 'when', 'what', 'were', 'will', 'would', 'there'
+})
+
+# URL path readability patterns
+READABLE_WORD_PATTERN = re.compile(r'[a-z]{3,}')
+NUMERIC_ID_PATTERN = re.compile(r'\d{3,}')
+
+# Content-type words looked up among the URL path tokens
+URL_KEYWORDS = frozenset({'blog', 'article', 'product', 'service', 'about', 'contact', 'news'})
+URL_TOKEN_SEPARATOR = re.compile(r'[/_\-.]')
+
+
+# href prefixes that resolve against the page URL without changing its host
+RELATIVE_HREF_PREFIXES = ('./', '../', '?')
+ABSOLUTE_HREF_PREFIXES = ('http://', 'https://', '//')
+NETLOC_END_PATTERN = re.compile(r'[/?#]')
+
+
+def _attr_tokens(value) -> List[str]:
+    """Split a multi-valued attribute (class, rel) the same way for both parsers"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return value.split()
+    return list(value)
+
+
+# Optional C-backed DOM (lexbor) for the tag-counting extractors
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Optional JIT for the per-page scoring arithmetic (plain Python without numba)
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True)
+def _score_depth(word_count, paragraph_count, avg_para_len, has_lists, has_tables,
+                 h1, h2, h3, total_images, images_with_alt):
+    """Content depth score (0-100) from scalar page counts"""
+    score = 0
+
+    # Word count contribution (max 30 points)
+    if word_count >= 2000:
+        score += 30
+    elif word_count >= 1000:
+        score += 20
+    elif word_count >= 500:
+        score += 10
+    elif word_count >= 300:
+        score += 5
+
+    # Paragraph quality (max 20 points)
+    if paragraph_count >= 10:
+        score += 10
+    elif paragraph_count >= 5:
+        score += 5
+
+    if avg_para_len >= 30:
+        score += 10
+    elif avg_para_len >= 15:
+        score += 5
+
+    # Structural elements (max 20 points)
+    if has_lists:
+        score += 10
+    if has_tables:
+        score += 10
+
+    # Heading structure (max 15 points)
+    if h1 == 1:
+        score += 5
+    if h2 >= 3:
+        score += 5
+    if h3 >= 2:
+        score += 5
+
+    # Images (max 15 points)
+    if total_images >= 5:
+        score += 10
+    elif total_images >= 2:
+        score += 5
+
+    if images_with_alt > 0:
+        alt_ratio = images_with_alt / max(total_images, 1)
+        if alt_ratio >= 0.8:
+            score += 5
 
-
-@dataclass
+    return min(score, 100)
+
+# With lexbor available, text and tag walks come from the lexbor tree and
+# BeautifulSoup only has to materialize the tags its remaining lookups use
+SOUP_STRAINER = SoupStrainer(['title', 'meta', 'link', 'a', 'script', 'time', 'input', 'footer', 'address', 'nav'])
+
+
+# Feature groups for HtmlContentExtractor.extract(features=...)
+FEATURE_META = 1
+FEATURE_HEADINGS = 2
+FEATURE_LINKS = 4
+FEATURE_IMAGES = 8
+FEATURE_SOCIAL = 16
+FEATURE_INTERNATIONAL = 32
+FEATURE_NAVIGATION = 64
+FEATURE_FRESHNESS = 128
+FEATURE_STRUCTURED_DATA = 256
+FEATURE_CONTENT = 512
+FEATURE_URL = 1024
+FEATURE_KEYWORDS = 2048
+FEATURE_CONTENT_DEPTH = 4096
+
+# Groups covered by _single_pass_walk(); requesting all of them uses the single traversal
+# (content depth counts are collected in the same walk only when FEATURE_CONTENT_DEPTH is set)
+TAG_FEATURES = (FEATURE_META | FEATURE_HEADINGS | FEATURE_LINKS | FEATURE_IMAGES | FEATURE_SOCIAL
+                | FEATURE_INTERNATIONAL | FEATURE_NAVIGATION | FEATURE_FRESHNESS)
+FEATURE_ALL = (TAG_FEATURES | FEATURE_STRUCTURED_DATA | FEATURE_CONTENT | FEATURE_URL
+               | FEATURE_KEYWORDS | FEATURE_CONTENT_DEPTH)
+
+
+@dataclass(slots=True)
 class SEOFeatures:
     """Data class to store extracted SEO features from html"""
     # Meta tags
@@ -108,8 +277,24 @@ class SEOFeatures:
     images_without_alt: int = 0
     missing_alt_images: List[str] = field(default_factory=list)
 
+def _create_session() -> requests.Session:
+    """Shared HTTP session so repeated fetches reuse pooled connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class HtmlContentExtractor:
     """Main class for analyzing SEO features from HTML"""
+
+    _SESSION = _create_session()
+
+    REQUEST_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept-Encoding': 'gzip, deflate',
+    }
     
     def __init__(self, url: str = None, html: str = None):
         """
@@ -122,24 +307,80 @@ class HtmlContentExtractor:
         self.url = url
         self.html = html
         self.soup = None
+        self.tree = None
         self.features = SEOFeatures()
+        self._base_netloc = urlparse(url).netloc if url else None
+        self._plain_text: Optional[str] = None
+        self._stripped = False
         
         if url and not html:
             self._fetch_html()
         
         if self.html:
-            self.soup = BeautifulSoup(self.html, 'html.parser')
+            if LexborHTMLParser is not None:
+                self.tree = LexborHTMLParser(self.html)
+                self.soup = BeautifulSoup(self.html, HTML_PARSER, parse_only=SOUP_STRAINER)
+            else:
+                self.soup = BeautifulSoup(self.html, HTML_PARSER)
     
+    @classmethod
+    def extract_many(
+        cls,
+        urls: List[str],
+        max_workers: int = 32,
+        max_per_host: int = 4,
+        features: int = FEATURE_ALL,
+    ) -> Dict[str, Dict]:
+        """
+        Fetch and extract many URLs concurrently.
+
+        Fetching is I/O bound, so pages are processed on a thread pool. A
+        per-host semaphore caps concurrent requests to the same domain.
+
+        Args:
+            urls: URLs to analyze
+            max_workers: Maximum number of pages processed at once
+            max_per_host: Maximum concurrent requests to a single host
+            features: Bitmask of FEATURE_* groups passed to extract()
+
+        Returns:
+            Dictionary mapping each URL to its extracted features (or an error dict)
+        """
+        host_limits: Dict[str, threading.Semaphore] = {}
+        host_limits_lock = threading.Lock()
+
+        def extract_one(url: str) -> Dict:
+            host = urlparse(url).netloc
+            with host_limits_lock:
+                limit = host_limits.setdefault(host, threading.Semaphore(max_per_host))
+            with limit:
+                return cls(url=url).extract(features)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(extract_one, url): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    results[url] = {"error": f"Error analyzing {url}: {e}"}
+        return results
+
     def _fetch_html(self) -> None:
         """Fetch HTML content from URL"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(self.url, headers=headers, timeout=10)
+            response = HtmlContentExtractor._SESSION.get(self.url, headers=self.REQUEST_HEADERS, timeout=10)
             response.raise_for_status()
+
+            # Content-Length is the body size only when the transfer is not compressed
+            content_length = response.headers.get('Content-Length')
+            if content_length and content_length.isdigit() and not response.headers.get('Content-Encoding'):
+                self.features.page_size_bytes = int(content_length)
+            else:
+                self.features.page_size_bytes = len(response.content)
             self.html = response.text
-            self.features.page_size_bytes = len(response.content)
+            del response
             self.features.page_size_kb = round(self.features.page_size_bytes / 1024, 2)
         except requests.RequestException as e:
             return(f"Error fetching URL {self.url}: {e}")
@@ -151,68 +392,83 @@ class HtmlContentExtractor:
             return
         
         # Title tag
-        title_tag = self.soup.find('title')
+        title_tag = self._css_first('title')
         if title_tag:
-            self.features.title = title_tag.get_text(strip=True)
+            self.features.title = title_tag[1]
             self.features.title_length = len(self.features.title)
         
         # Meta description
-        meta_desc = self.soup.find('meta', attrs={'name': 'description'})
+        meta_desc = self._css_first('meta[name="description"]')
         if meta_desc:
-            self.features.meta_description = meta_desc.get('content', '')
+            self.features.meta_description = meta_desc[0].get('content') or ''
             self.features.meta_description_length = len(self.features.meta_description)
         
         # Meta robots
-        meta_robots = self.soup.find('meta', attrs={'name': 'robots'})
+        meta_robots = self._css_first('meta[name="robots"]')
         if meta_robots:
-            self.features.meta_robots = meta_robots.get('content', '')
+            self.features.meta_robots = meta_robots[0].get('content') or ''
         
         # Canonical URL
-        canonical = self.soup.find('link', attrs={'rel': 'canonical'})
+        canonical = self._css_first('link[rel~="canonical"]')
         if canonical:
-            self.features.canonical_url = canonical.get('href', '')
+            self.features.canonical_url = canonical[0].get('href') or ''
+    
+    def _css_first(self, selector: str) -> Optional[Tuple[Dict, str]]:
+        """
+        Return (attributes, stripped text) of the first element matching a CSS selector.
+
+        Uses lexbor's C selector engine when available, soupsieve otherwise.
+        """
+        if self.tree is not None:
+            node = self.tree.css_first(selector)
+            return None if node is None else (node.attributes, node.text(strip=True))
+        tag = self.soup.select_one(selector)
+        return None if tag is None else (tag.attrs, tag.get_text(strip=True))
+    
+    def _css_all(self, selector: str) -> List[Dict]:
+        """Return the attributes of every element matching a CSS selector"""
+        if self.tree is not None:
+            return [node.attributes for node in self.tree.css(selector)]
+        return [tag.attrs for tag in self.soup.select(selector)]
     
     def extract_headings(self) -> None:
         """Extract heading tag features"""
         if not self.soup:
             return
 
-        # H1 tags
-        h1_tags = self.soup.find_all('h1')
-        self.features.h1_count = len(h1_tags)
-        self.features.h1_texts = [h1.get_text(strip=True) for h1 in h1_tags]
-
-        # H2 tags
-        h2_tags = self.soup.find_all('h2')
-        self.features.h2_count = len(h2_tags)
-        self.features.h2_texts = [h2.get_text(strip=True) for h2 in h2_tags]
+        # One document-order query for all levels, bucketed by tag name
+        heading_texts = {level: [] for level in range(1, 7)}
+        if self.tree is not None:
+            # Fast path: lexbor DOM
+            for node in self.tree.css(', '.join(HEADING_LEVELS)):
+                heading_texts[HEADING_LEVELS[node.tag]].append(node.text(strip=True))
+        else:
+            for tag in self.soup.find_all(list(HEADING_LEVELS)):
+                heading_texts[HEADING_LEVELS[tag.name]].append(tag.get_text(strip=True))
 
-        # H3 tags
-        h3_tags = self.soup.find_all('h3')
-        self.features.h3_count = len(h3_tags)
-        self.features.h3_texts = [h3.get_text(strip=True) for h3 in h3_tags]
+        # H1-H3 counts and texts
+        self.features.h1_count = len(heading_texts[1])
+        self.features.h1_texts = heading_texts[1]
+        self.features.h2_count = len(heading_texts[2])
+        self.features.h2_texts = heading_texts[2]
+        self.features.h3_count = len(heading_texts[3])
+        self.features.h3_texts = heading_texts[3]
 
         # H4, H5, H6 counts
-        self.features.h4_count = len(self.soup.find_all('h4'))
-        self.features.h5_count = len(self.soup.find_all('h5'))
-        self.features.h6_count = len(self.soup.find_all('h6'))
-    
+        self.features.h4_count = len(heading_texts[4])
+        self.features.h5_count = len(heading_texts[5])
+        self.features.h6_count = len(heading_texts[6])
+
     def extract_content_metrics(self) -> None:
         """Extract content-related metrics"""
         if not self.soup:
             return
         
         # Get visible text
-        for script in self.soup(['script', 'style']):
-            script.decompose()
-        
-        text = self.soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        text = self._get_plain_text()
         
         # Word count
-        words = re.findall(r'\b\w+\b', text)
+        words = WORD_PATTERN.findall(text)
         self.features.word_count = len(words)
         
         # Text to HTML ratio
@@ -220,63 +476,76 @@ class HtmlContentExtractor:
         html_length = len(self.html) if self.html else 1
         self.features.text_html_ratio = round((text_length / html_length) * 100, 2)
     
-    def extract_image_features(self) -> None:
-        """Extract image-related features"""
-        if not self.soup:
-            return
-        
-        images = self.soup.find_all('img')
-        self.features.total_images = len(images)
-        
-        for img in images:
-            alt_text = img.get('alt', '')
-            src = img.get('src', '')
-            
-            if alt_text and alt_text.strip():
-                self.features.images_with_alt += 1
-            else:
-                self.features.images_without_alt += 1
-                if src:
-                    self.features.missing_alt_images.append(src[:100])  # Limit URL length
-    
     def extract_link_features(self) -> None:
         """Extract link-related features"""
         if not self.soup or not self.url:
             return
         
-        base_domain = urlparse(self.url).netloc
         links = self.soup.find_all('a', href=True)
         
         for link in links:
-            href = link['href']
-            
-            # Skip anchors and javascript links
-            if href.startswith('#') or href.startswith('javascript:'):
+            link_domain = self._link_domain(link['href'])
+            if link_domain is None:
                 continue
             
-            # Make absolute URL
-            absolute_url = urljoin(self.url, href)
-            link_domain = urlparse(absolute_url).netloc
-            
-            if link_domain == base_domain:
+            if link_domain == self._base_netloc:
                 self.features.internal_links += 1
             elif link_domain:  # External link
                 self.features.external_links += 1
         
         self.features.total_links = self.features.internal_links + self.features.external_links
     
+    def _link_domain(self, href: str) -> Optional[str]:
+        """
+        Return the host an href points to, or None for anchors/javascript links.
+
+        Common href shapes are resolved with string checks; only unusual ones
+        (bare relative paths, mailto:, ...) go through urljoin + urlparse.
+        """
+        # Skip anchors and javascript links
+        if href.startswith('#') or href.startswith('javascript:'):
+            return None
+
+        if href.startswith(ABSOLUTE_HREF_PREFIXES):
+            rest = href[href.index('//') + 2:]
+            match = NETLOC_END_PATTERN.search(rest)
+            return rest[:match.start()] if match else rest
+        if href.startswith('/') or href.startswith(RELATIVE_HREF_PREFIXES):
+            return self._base_netloc
+
+        return urlparse(urljoin(self.url, href)).netloc
     
+    def _get_plain_text(self) -> str:
+        """
+        Return the visible page text, computed once and shared by all extractors.
+
+        Strips script/style tags on first use (the document is mutated once) and
+        normalizes whitespace the same way for every caller.
+        """
+        if self._plain_text is None:
+            if self.tree is not None:
+                # The strained soup holds no body text; read it from the lexbor tree
+                if not self._stripped:
+                    self.tree.strip_tags(['script', 'style'])
+                    self._stripped = True
+                raw_text = self.tree.root.text() if self.tree.root is not None else ''
+            else:
+                if not self._stripped:
+                    for script in self.soup(['script', 'style']):
+                        script.decompose()
+                    self._stripped = True
+                raw_text = self.soup.get_text()
+
+            # Collapse every whitespace run in one C-level pass
+            self._plain_text = WHITESPACE_PATTERN.sub(' ', raw_text).strip()
+        return self._plain_text
+
     def extract_text(self) -> Optional[str]:
         """Extract text content"""
         if not self.soup:
             return None
-        scripts = self.soup(['script', 'style'])
-        for script in scripts:
-            script.decompose()
-        text = self.soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        self.features.text = ' '.join(chunk for chunk in chunks if chunk)
+        self.features.text = self._get_plain_text()
+        return self.features.text
 
     def extract_url_structure(self) -> None:
         """Extract and analyze URL structure features"""
@@ -297,41 +566,32 @@ class HtmlContentExtractor:
 
         # URL readability (check for readable words vs IDs/numbers)
         path = parsed_url.path.lower()
-        if re.search(r'[a-z]{3,}', path):
+        if READABLE_WORD_PATTERN.search(path):
             self.features.url_readability = "Good"
-        elif re.search(r'\d{3,}', path):
+        elif NUMERIC_ID_PATTERN.search(path):
             self.features.url_readability = "Poor (contains IDs)"
         else:
             self.features.url_readability = "Average"
 
-        # Check if URL contains common keywords
-        common_keywords = ['blog', 'article', 'product', 'service', 'about', 'contact', 'news']
-        self.features.url_has_keywords = any(keyword in path for keyword in common_keywords)
+        # Check if URL contains common keywords (plural tokens like "products" count too)
+        tokens = set(URL_TOKEN_SEPARATOR.split(path))
+        tokens.update(token[:-1] for token in tokens.copy() if token.endswith('s'))
+        self.features.url_has_keywords = not URL_KEYWORDS.isdisjoint(tokens)
 
     def extract_keyword_analysis(self) -> None:
         """Analyze keyword usage and density"""
-        if not self.soup or not self.features.text:
+        if not self.soup:
             return
 
         # Get text content
-        text = self.features.text.lower()
-        words = re.findall(r'\b[a-z]{3,}\b', text)
-
-        # Common stop words to exclude
-        stop_words = {
-            'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'her',
-            'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how',
-            'its', 'may', 'new', 'now', 'old', 'see', 'two', 'who', 'boy', 'did',
-            'she', 'use', 'way', 'this', 'that', 'with', 'have', 'from', 'they',
-            'been', 'more', 'when', 'what', 'were', 'will', 'would', 'there'
-        }
-
-        # Filter out stop words
-        filtered_words = [word for word in words if word not in stop_words]
+        text = self._get_plain_text().lower()
+        if not text:
+            return
+        words = KEYWORD_PATTERN.findall(text)
 
-        # Count word frequency
-        word_freq = Counter(filtered_words)
-        total_words = len(filtered_words)
+        # Count word frequency (stop words excluded)
+        word_freq = Counter(word for word in words if word not in STOP_WORDS)
+        total_words = sum(word_freq.values())
 
         # Get top 10 keywords
         top_10 = word_freq.most_common(10)
@@ -363,76 +623,43 @@ class HtmlContentExtractor:
         if not self.soup:
             return
 
+        if self.tree is not None:
+            paragraph_texts = [node.text(strip=True) for node in self.tree.css('p')]
+            list_count = len(self.tree.css('ul, ol'))
+            table_count = len(self.tree.css('table'))
+        else:
+            paragraph_texts = [p.get_text(strip=True) for p in self.soup.find_all('p')]
+            list_count = len(self.soup.find_all(['ul', 'ol']))
+            table_count = len(self.soup.find_all('table'))
+
         # Paragraph analysis
-        paragraphs = self.soup.find_all('p')
-        self.features.paragraph_count = len(paragraphs)
+        self.features.paragraph_count = len(paragraph_texts)
 
-        if paragraphs:
-            para_lengths = [len(p.get_text(strip=True).split()) for p in paragraphs]
+        if paragraph_texts:
+            para_lengths = [len(text.split()) for text in paragraph_texts]
             self.features.average_paragraph_length = round(
                 sum(para_lengths) / len(para_lengths), 1
             )
 
         # Lists (ordered and unordered)
-        lists = self.soup.find_all(['ul', 'ol'])
-        self.features.list_count = len(lists)
-        self.features.has_lists = len(lists) > 0
+        self.features.list_count = list_count
+        self.features.has_lists = list_count > 0
 
         # Tables
-        tables = self.soup.find_all('table')
-        self.features.table_count = len(tables)
-        self.features.has_tables = len(tables) > 0
-
-        # Calculate content depth score (0-100)
-        score = 0
-
-        # Word count contribution (max 30 points)
-        if self.features.word_count >= 2000:
-            score += 30
-        elif self.features.word_count >= 1000:
-            score += 20
-        elif self.features.word_count >= 500:
-            score += 10
-        elif self.features.word_count >= 300:
-            score += 5
-
-        # Paragraph quality (max 20 points)
-        if self.features.paragraph_count >= 10:
-            score += 10
-        elif self.features.paragraph_count >= 5:
-            score += 5
-
-        if self.features.average_paragraph_length >= 30:
-            score += 10
-        elif self.features.average_paragraph_length >= 15:
-            score += 5
-
-        # Structural elements (max 20 points)
-        if self.features.has_lists:
-            score += 10
-        if self.features.has_tables:
-            score += 10
+        self.features.table_count = table_count
+        self.features.has_tables = table_count > 0
 
-        # Heading structure (max 15 points)
-        if self.features.h1_count == 1:
-            score += 5
-        if self.features.h2_count >= 3:
-            score += 5
-        if self.features.h3_count >= 2:
-            score += 5
-
-        # Images (max 15 points)
-        if self.features.total_images >= 5:
-            score += 10
-        elif self.features.total_images >= 2:
-            score += 5
+        self._score_content_depth()
 
-        if self.features.images_with_alt > 0:
-            alt_ratio = self.features.images_with_alt / max(self.features.total_images, 1)
-            if alt_ratio >= 0.8:
-                score += 5
-
-        self.features.content_depth_score = min(score, 100)
+    def _score_content_depth(self) -> None:
+        """Calculate content depth score and readability from collected counts"""
+        features = self.features
+        features.content_depth_score = _score_depth(
+            features.word_count, features.paragraph_count, float(features.average_paragraph_length),
+            features.has_lists, features.has_tables,
+            features.h1_count, features.h2_count, features.h3_count,
+            features.total_images, features.images_with_alt,
+        )
 
         # Readability assessment (simple)
         if self.features.word_count > 0:
@@ -457,7 +684,7 @@ class HtmlContentExtractor:
 
             for script in json_ld_scripts:
                 try:
-                    data = json.loads(script.string)
+                    data = orjson.loads(script.string)
 
                     # Handle both single objects and arrays
                     items = data if isinstance(data, list) else [data]
@@ -478,7 +705,7 @@ class HtmlContentExtractor:
                             elif schema_type == 'LocalBusiness':
                                 self.features.has_local_business_schema = True
 
-                except (json.JSONDecodeError, TypeError):
+                except (orjson.JSONDecodeError, TypeError):
                     continue
 
     def extract_social_meta_tags(self) -> None:
@@ -486,52 +713,44 @@ class HtmlContentExtractor:
         if not self.soup:
             return
 
-        # Open Graph tags
-        og_title = self.soup.find('meta', property='og:title')
-        if og_title:
-            self.features.og_title = og_title.get('content', '')
-
-        og_desc = self.soup.find('meta', property='og:description')
-        if og_desc:
-            self.features.og_description = og_desc.get('content', '')
-
-        og_image = self.soup.find('meta', property='og:image')
-        if og_image:
-            self.features.og_image = og_image.get('content', '')
+        def meta_content(attr: str, value: str) -> Optional[str]:
+            meta = self._css_first(f'meta[{attr}="{value}"]')
+            return None if meta is None else (meta[0].get('content') or '')
 
-        og_url = self.soup.find('meta', property='og:url')
-        if og_url:
-            self.features.og_url = og_url.get('content', '')
+        # Open Graph tags
+        for prop, name in (('og:title', 'og_title'), ('og:description', 'og_description'),
+                           ('og:image', 'og_image'), ('og:url', 'og_url')):
+            content = meta_content('property', prop)
+            if content is not None:
+                setattr(self.features, name, content)
 
         # Twitter Card tags
-        twitter_card = self.soup.find('meta', attrs={'name': 'twitter:card'})
-        if twitter_card:
-            self.features.twitter_card = twitter_card.get('content', '')
-
-        twitter_title = self.soup.find('meta', attrs={'name': 'twitter:title'})
-        if twitter_title:
-            self.features.twitter_title = twitter_title.get('content', '')
-
-        twitter_desc = self.soup.find('meta', attrs={'name': 'twitter:description'})
-        if twitter_desc:
-            self.features.twitter_description = twitter_desc.get('content', '')
+        for prop, name in (('twitter:card', 'twitter_card'), ('twitter:title', 'twitter_title'),
+                           ('twitter:description', 'twitter_description')):
+            content = meta_content('name', prop)
+            if content is not None:
+                setattr(self.features, name, content)
 
     def extract_international_seo(self) -> None:
         """Extract hreflang and language features"""
         if not self.soup:
             return
 
-        # Language attribute
-        html_tag = self.soup.find('html')
-        if html_tag:
-            self.features.language = html_tag.get('lang', '')
+        # Language attribute (<html> is not kept by the strained soup)
+        if self.tree is not None:
+            if self.tree.root is not None:
+                self.features.language = self.tree.root.attributes.get('lang') or ''
+        else:
+            html_tag = self.soup.find('html')
+            if html_tag:
+                self.features.language = html_tag.get('lang', '')
 
         # Hreflang tags
-        hreflang_links = self.soup.find_all('link', rel='alternate', hreflang=True)
+        hreflang_links = self._css_all('link[rel~="alternate"][hreflang]')
         if hreflang_links:
             self.features.has_hreflang = True
             self.features.hreflang_tags = [
-                f"{link.get('hreflang')}: {link.get('href', '')[:50]}"
+                f"{link.get('hreflang')}: {(link.get('href') or '')[:50]}"
                 for link in hreflang_links[:5]  # Limit to first 5
             ]
 
@@ -541,26 +760,47 @@ class HtmlContentExtractor:
             return
 
         # Breadcrumbs detection (common patterns)
-        breadcrumb_indicators = [
-            self.soup.find('nav', class_=re.compile(r'breadcrumb', re.I)),
-            self.soup.find('ol', class_=re.compile(r'breadcrumb', re.I)),
-            self.soup.find('div', class_=re.compile(r'breadcrumb', re.I)),
-        ]
-        self.features.has_breadcrumbs = any(breadcrumb_indicators)
+        if self.tree is not None:
+            self.features.has_breadcrumbs = any(
+                BREADCRUMB_PATTERN.search(' '.join(_attr_tokens(node.attributes.get('class'))))
+                for node in self.tree.css('nav, ol, div')
+            )
+        else:
+            breadcrumb_indicators = [
+                self.soup.find('nav', class_=BREADCRUMB_PATTERN),
+                self.soup.find('ol', class_=BREADCRUMB_PATTERN),
+                self.soup.find('div', class_=BREADCRUMB_PATTERN),
+            ]
+            self.features.has_breadcrumbs = any(breadcrumb_indicators)
 
         # Search functionality
         search_forms = self.soup.find_all('input', attrs={'type': 'search'})
-        search_forms += self.soup.find_all('input', attrs={'name': re.compile(r'search|query', re.I)})
+        search_forms += self.soup.find_all('input', attrs={'name': SEARCH_NAME_PATTERN})
         self.features.has_search = len(search_forms) > 0
 
-        # Contact information (email, phone)
-        page_text = self.soup.get_text()
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
+        self._detect_contact_info()
+
+    def _detect_contact_info(self) -> None:
+        """Detect contact information (email, phone) in the page text"""
+        def has_contact(text: str) -> bool:
+            return bool(EMAIL_PATTERN.search(text) or PHONE_PATTERN.search(text))
 
-        has_email = bool(re.search(email_pattern, page_text))
-        has_phone = bool(re.search(phone_pattern, page_text))
-        self.features.has_contact_info = has_email or has_phone
+        # A mailto:/tel: link is contact info on its own; no text scan needed
+        if self._css_first('a[href^="mailto:"], a[href^="tel:"]') is not None:
+            self.features.has_contact_info = True
+            return
+
+        # Contact details usually live in footer/address/nav; scan those small
+        # sections first and fall back to the full page text on a miss.
+        # _get_plain_text() runs first so script/style content is already stripped.
+        page_text = self._get_plain_text()
+        if self.tree is not None:
+            sections = [node.text(separator=' ') for node in self.tree.css('footer, address, nav')]
+        else:
+            sections = [tag.get_text(' ') for tag in self.soup.find_all(['footer', 'address', 'nav'])]
+        section_text = ' '.join(sections)
+
+        self.features.has_contact_info = has_contact(section_text) or has_contact(page_text)
 
     def extract_content_freshness(self) -> None:
         """Extract content freshness indicators"""
@@ -568,7 +808,7 @@ class HtmlContentExtractor:
             return
 
         # Look for last modified meta tag
-        last_modified = self.soup.find('meta', attrs={'name': re.compile(r'last-modified|updated', re.I)})
+        last_modified = self.soup.find('meta', attrs={'name': LAST_MODIFIED_PATTERN})
         if last_modified:
             self.features.has_date_modified = True
             self.features.last_modified = last_modified.get('content', '')
@@ -584,58 +824,238 @@ class HtmlContentExtractor:
         if not self.soup:
             return
 
-        images = self.soup.find_all('img')
-        self.features.total_images = len(images)
-
-        for img in images:
-            alt_text = img.get('alt', '')
-            src = img.get('src', '')
+        if self.tree is not None:
+            images = [node.attributes for node in self.tree.css('img')]
+        else:
+            images = [img.attrs for img in self.soup.find_all('img')]
+
+        # lexbor reports valueless attributes as None
+        alts = [((img.get('alt') or '').strip(), img.get('src') or '') for img in images]
+
+        self.features.total_images = len(alts)
+        self.features.images_with_alt = sum(1 for alt, _ in alts if alt)
+        self.features.images_without_alt = self.features.total_images - self.features.images_with_alt
+        self.features.missing_alt_images = [src[:100] for alt, src in alts if not alt and src]  # Limit URL length
+
+    def _iter_elements(self):
+        """Yield (tag name, attributes, node) for every element in document order"""
+        if self.tree is not None:
+            root = self.tree.root
+            yield root.tag, root.attributes, root
+            for node in root.traverse():
+                if node.mem_id != root.mem_id:
+                    yield node.tag, node.attributes, node
+        else:
+            for tag in self.soup.find_all(True):
+                yield tag.name, tag.attrs, tag
 
-            if alt_text and alt_text.strip():
-                self.features.images_with_alt += 1
-            else:
-                self.features.images_without_alt += 1
-                if src:
-                    self.features.missing_alt_images.append(src[:100])  # Limit URL length
+    def _node_text(self, node) -> str:
+        if self.tree is not None:
+            return node.text(strip=True)
+        return node.get_text(strip=True)
 
-    def extract(self) -> Dict:
+    def _single_pass_walk(self, content_depth: bool = True) -> None:
         """
-        Run all extraction methods and return results
+        Collect every tag-based feature in one traversal of the document.
 
-        Returns:
-            Dictionary of all extracted features
+        Covers meta tags, headings, links, images, social tags, viewport,
+        language/hreflang, navigation elements, freshness and the content
+        depth counts (equivalent to the individual extract_* methods).
+
+        Args:
+            content_depth: Also collect the paragraph, list and table counts
         """
         if not self.soup:
-            return {"error": "No HTML content to analyze"}
+            return
 
-        # Core SEO extraction
-        self.extract_meta_tags()
-        self.extract_headings()
-        self.extract_content_metrics()
-        self.extract_text()
+        features = self.features
+        headings = {level: [] for level in range(1, 7)}
+        paragraph_lengths = []
+        list_count = table_count = 0
+        hreflang_tags = []
+        first_time_datetime = None
+        seen_meta = set()  # first matching tag wins, like soup.find()
 
-        # Link analysis
-        self.extract_link_features()
+        for tag, attrs, node in self._iter_elements():
+            if tag in HEADING_LEVELS:
+                headings[HEADING_LEVELS[tag]].append(self._node_text(node))
 
-        # Image analysis
-        self.extract_image_features()
+            elif tag == 'p':
+                if content_depth:
+                    paragraph_lengths.append(len(self._node_text(node).split()))
 
-        # Structured data (enhanced)
-        self.extract_structured_data_enhanced()
+            elif tag in ('ul', 'ol'):
+                list_count += 1
 
-        # Social meta tags (Open Graph + Twitter)
-        self.extract_social_meta_tags()
+            elif tag == 'table':
+                table_count += 1
 
-        # Mobile
-        self.features.has_viewport = self.soup.find('meta', attrs={'name': 'viewport'}) is not None
+            elif tag == 'a':
+                href = attrs.get('href')
+                if href is None or self._base_netloc is None:
+                    continue
+                link_domain = self._link_domain(href)
+                if link_domain is None:
+                    continue
+                if link_domain == self._base_netloc:
+                    features.internal_links += 1
+                elif link_domain:  # External link
+                    features.external_links += 1
+
+            elif tag == 'img':
+                # lexbor reports valueless attributes as None
+                alt_text = attrs.get('alt') or ''
+                src = attrs.get('src') or ''
+                features.total_images += 1
+                if alt_text.strip():
+                    features.images_with_alt += 1
+                else:
+                    features.images_without_alt += 1
+                    if src:
+                        features.missing_alt_images.append(src[:100])  # Limit URL length
+
+            elif tag == 'meta':
+                name = attrs.get('name')
+                prop = attrs.get('property')
+                content = attrs.get('content') or ''
+
+                if name in META_NAME_FIELDS and name not in seen_meta:
+                    seen_meta.add(name)
+                    setattr(features, META_NAME_FIELDS[name], content)
+                elif name == 'viewport':
+                    features.has_viewport = True
+                elif name and 'last-modified' not in seen_meta and LAST_MODIFIED_PATTERN.search(name):
+                    seen_meta.add('last-modified')
+                    features.has_date_modified = True
+                    features.last_modified = content
+
+                if prop in META_PROPERTY_FIELDS and prop not in seen_meta:
+                    seen_meta.add(prop)
+                    setattr(features, META_PROPERTY_FIELDS[prop], content)
+
+            elif tag == 'link':
+                rel = _attr_tokens(attrs.get('rel'))
+                if 'canonical' in rel and features.canonical_url is None:
+                    features.canonical_url = attrs.get('href') or ''
+                if 'alternate' in rel and 'hreflang' in attrs:
+                    hreflang_tags.append(f"{attrs.get('hreflang')}: {(attrs.get('href') or '')[:50]}")
+
+            elif tag == 'title':
+                if features.title is None:
+                    features.title = self._node_text(node)
+                    features.title_length = len(features.title)
+
+            elif tag == 'html':
+                if features.language is None:
+                    features.language = attrs.get('lang') or ''
+
+            elif tag == 'input':
+                input_name = attrs.get('name')
+                if attrs.get('type') == 'search' or (input_name and SEARCH_NAME_PATTERN.search(input_name)):
+                    features.has_search = True
+
+            elif tag == 'time':
+                if first_time_datetime is None and 'datetime' in attrs:
+                    first_time_datetime = attrs.get('datetime') or ''
+
+            if tag in ('nav', 'ol', 'div') and not features.has_breadcrumbs:
+                classes = ' '.join(_attr_tokens(attrs.get('class')))
+                if BREADCRUMB_PATTERN.search(classes):
+                    features.has_breadcrumbs = True
+
+        # Meta tags
+        if features.meta_description is not None:
+            features.meta_description_length = len(features.meta_description)
+
+        # Headings
+        features.h1_count, features.h1_texts = len(headings[1]), headings[1]
+        features.h2_count, features.h2_texts = len(headings[2]), headings[2]
+        features.h3_count, features.h3_texts = len(headings[3]), headings[3]
+        features.h4_count = len(headings[4])
+        features.h5_count = len(headings[5])
+        features.h6_count = len(headings[6])
+
+        # Links
+        features.total_links = features.internal_links + features.external_links
+
+        # Content depth counts
+        if content_depth:
+            features.paragraph_count = len(paragraph_lengths)
+            if paragraph_lengths:
+                features.average_paragraph_length = round(sum(paragraph_lengths) / len(paragraph_lengths), 1)
+            features.list_count, features.has_lists = list_count, list_count > 0
+            features.table_count, features.has_tables = table_count, table_count > 0
+
+        # International SEO
+        if hreflang_tags:
+            features.has_hreflang = True
+            features.hreflang_tags = hreflang_tags[:5]  # Limit to first 5
+
+        # Freshness: a last-modified meta tag takes precedence over <time>
+        if first_time_datetime is not None and not features.last_modified:
+            features.has_date_modified = True
+            features.last_modified = first_time_datetime
+
+    def extract(self, features: int = FEATURE_ALL) -> Dict:
+        """
+        Run the requested extraction methods and return results
+
+        Args:
+            features: Bitmask of FEATURE_* groups to extract. Skipping
+                FEATURE_KEYWORDS and FEATURE_CONTENT_DEPTH roughly halves the
+                per-page cost for header-only analyses.
+
+        Returns:
+            Dictionary of all features (groups not requested keep their defaults)
+        """
+        if not self.soup:
+            return {"error": "No HTML content to analyze"}
+
+        single_pass = features & TAG_FEATURES == TAG_FEATURES
+        if single_pass:
+            # All tag-based features in a single traversal
+            self._single_pass_walk(content_depth=bool(features & FEATURE_CONTENT_DEPTH))
+        else:
+            if features & FEATURE_META:
+                self.extract_meta_tags()
+                self.features.has_viewport = self._css_first('meta[name="viewport"]') is not None
+            if features & FEATURE_HEADINGS:
+                self.extract_headings()
+            if features & FEATURE_LINKS:
+                self.extract_link_features()
+            if features & FEATURE_IMAGES:
+                self.extract_image_features()
+            if features & FEATURE_SOCIAL:
+                self.extract_social_meta_tags()
+            if features & FEATURE_INTERNATIONAL:
+                self.extract_international_seo()
+            if features & FEATURE_FRESHNESS:
+                self.extract_content_freshness()
+
+        # Structured data (enhanced) - before script tags are stripped for text extraction
+        if features & FEATURE_STRUCTURED_DATA:
+            self.extract_structured_data_enhanced()
+
+        # Text-based features (word count and text also feed the depth score)
+        if features & (FEATURE_CONTENT | FEATURE_CONTENT_DEPTH):
+            self.extract_content_metrics()
+            self.extract_text()
 
         # NEW: Phase 1 enhancements
-        self.extract_url_structure()
-        self.extract_keyword_analysis()
-        self.extract_content_depth()
-        self.extract_international_seo()
-        self.extract_navigation_ux()
-        self.extract_content_freshness()
+        if features & FEATURE_URL:
+            self.extract_url_structure()
+        if features & FEATURE_KEYWORDS:
+            self.extract_keyword_analysis()
+        if features & FEATURE_CONTENT_DEPTH:
+            if single_pass:
+                self._score_content_depth()
+            else:
+                self.extract_content_depth()
+        if features & FEATURE_NAVIGATION:
+            if single_pass:
+                self._detect_contact_info()
+            else:
+                self.extract_navigation_ux()
 
         return asdict(self.features)
     
@@ -3,18 +3,119 @@ Technical Performance Analysis Extractor
 Extracts performance metrics using multiple free/cost-effective sources.
 """
 
-import json
+import asyncio
+import copy
+import functools
+import logging
+import operator
+import orjson
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
 from config import Config
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+PAGESPEED_API_URL = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+
+
+def _create_session() -> requests.Session:
+    """Shared HTTP session so PageSpeed and header requests reuse pooled connections"""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # PageSpeed calls handle 429/5xx themselves (Retry-After aware); only
+    # connection failures are retried here, never a slow 90s read
+    pagespeed_retry = Retry(total=3, read=0, backoff_factor=0.3)
+    session.mount(PAGESPEED_API_URL, HTTPAdapter(pool_maxsize=50, max_retries=pagespeed_retry))
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+_SESSION = _create_session()
+
+
+# Lighthouse audits read by PerformanceAnalyzer.
+# Core Web Vitals map to (audit key, 0-100 score field, numeric value field).
+CORE_WEB_VITAL_METRICS = (
+    ("largest-contentful-paint", "lcp_score", "lcp_value"),
+    ("cumulative-layout-shift", "cls_score", "cls_value"),
+    ("first-contentful-paint", "fcp_score", "fcp_value"),
+    ("interactive", "tti_score", "tti_value"),
+    ("speed-index", "speed_index_score", "speed_index_value"),
+    ("total-blocking-time", "tbt_score", "tbt_value"),
+)
+OPPORTUNITY_AUDITS = (
+    "render-blocking-resources",
+    "unused-css-rules",
+    "unused-javascript",
+    "modern-image-formats",
+    "offscreen-images",
+    "unminified-css",
+    "unminified-javascript",
+    "uses-optimized-images",
+    "uses-text-compression",
+    "uses-responsive-images",
+)
+OPPORTUNITY_RANK = {key: rank for rank, key in enumerate(OPPORTUNITY_AUDITS)}
+DIAGNOSTIC_AUDITS = (
+    "main-thread-tasks",
+    "bootup-time",
+    "third-party-summary",
+    "font-display",
+    "uses-http2",
+)
+USED_AUDITS = frozenset(
+    [key for key, _, _ in CORE_WEB_VITAL_METRICS] + list(OPPORTUNITY_AUDITS) + list(DIAGNOSTIC_AUDITS)
+)
+
+# Recent PageSpeed results keyed by (url, strategy); PSI calls take 10-60s and count against quota
+_PSI_CACHE = TTLCache(maxsize=Config.PAGESPEED_CACHE_MAXSIZE, ttl=max(Config.PAGESPEED_CACHE_TTL, 1))
+_PSI_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=2048)
+def _site_host(url: str) -> str:
+    """Lower-cased host of a URL without a leading www. (cached; pages repeat hosts a lot)"""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+# Large report sections that no extractor reads
+UNUSED_LIGHTHOUSE_SECTIONS = ("fullPageScreenshot", "i18n", "timing")
+
+
+def _prune_report(data: Dict) -> Dict:
+    """Drop report sections and audits that are never read, keeping only lighthouseResult"""
+    lighthouse = data.get("lighthouseResult", {})
+    for section in UNUSED_LIGHTHOUSE_SECTIONS:
+        lighthouse.pop(section, None)
+
+    audits = lighthouse.get("audits", {})
+    for key in [key for key in audits if key not in USED_AUDITS]:
+        del audits[key]
+    return lighthouse
+
+
+@dataclass(slots=True)
 class TechnicalPerformanceFeatures:
-    """Dataclass to store all technical performance metrics"""
+    """
+    Dataclass to store all technical performance metrics
+
+    Construct instances normally: the generated __init__ is several times
+    faster than copy.copy() of a prebuilt template for a slots dataclass.
+    """
 
     # Source information
     url: str = ""
@@ -153,6 +254,50 @@ class PerformanceAnalyzer:
     Analyzes website performance using Google PageSpeed Insights API.
     """
 
+    # Feature fields returned by extract(), in output order
+    OUTPUT_FIELDS = (
+        "url",
+        "analyzed_at",
+        "performance_score",
+        "accessibility_score",
+        "best_practices_score",
+        "seo_score",
+        "lcp_score",
+        "lcp_value",
+        "fid_score",
+        "fid_value",
+        "cls_score",
+        "cls_value",
+        "fcp_score",
+        "fcp_value",
+        "tti_score",
+        "tti_value",
+        "speed_index_score",
+        "speed_index_value",
+        "tbt_score",
+        "tbt_value",
+        "render_blocking_css_count",
+        "render_blocking_js_count",
+        "render_blocking_resources",
+        "unused_js_bytes",
+        "unused_css_bytes",
+        "total_js_execution_time",
+        "third_party_requests",
+        "third_party_size",
+        "third_party_blocking_time",
+        "uses_http2",
+        "font_display_set",
+        "opportunities",
+        "diagnostics",
+        "analysis_source",
+        "api_error",
+        "fallback_used",
+    )
+    _output_values = operator.attrgetter(*OUTPUT_FIELDS)
+
+    # Attempts per PageSpeed call when the API answers 429 or 5xx
+    MAX_ATTEMPTS = 4
+
     def __init__(self, url: str, api_key: Optional[str] = None):
         """
         Initialize the Performance Analyzer.
@@ -166,7 +311,7 @@ class PerformanceAnalyzer:
         self.features = TechnicalPerformanceFeatures(url=url)
 
         # PageSpeed Insights API endpoint
-        self.api_url = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+        self.api_url = PAGESPEED_API_URL
 
     def extract(self) -> Dict[str, Any]:
         """
@@ -175,7 +320,7 @@ class PerformanceAnalyzer:
         Returns:
             Dictionary of performance features
         """
-        print(f"[*] Analyzing performance using PageSpeed Insights API...")
+        logger.info("[*] Analyzing performance using PageSpeed Insights API...")
 
         try:
             # Build API request parameters
@@ -188,42 +333,89 @@ class PerformanceAnalyzer:
             if self.api_key:
                 params["key"] = self.api_key
 
+            cache_key = (self.url, params["strategy"])
+            if Config.PAGESPEED_CACHE_TTL > 0:
+                with _PSI_CACHE_LOCK:
+                    cached = _PSI_CACHE.get(cache_key)
+                if cached is not None:
+                    logger.info("[+] PageSpeed Insights result served from cache")
+                    return copy.deepcopy(cached)
+
             # Make API request (increased timeout for slower sites)
-            response = requests.get(self.api_url, params=params, timeout=90)
-            response.raise_for_status()
+            response = self._request_pagespeed(params)
 
-            data = response.json()
+            # Keep only the audits we read; screenshots and unused audits are dropped right away
+            lighthouse = _prune_report(orjson.loads(response.content))
+            del response
+
+            # Resolve the shared report sections once for all extractors
+            audits = lighthouse.get("audits", {})
+            categories = lighthouse.get("categories", {})
 
             # Extract metrics
-            self._extract_lighthouse_metrics(data)
-            self._extract_core_web_vitals(data)
-            self._extract_opportunities(data)
-            self._extract_diagnostics(data)
+            self._extract_lighthouse_metrics(categories)
+            self._extract_core_web_vitals(audits)
+            self._extract_opportunities(audits)
+            self._extract_diagnostics(audits)
 
             self.features.analysis_source = "pagespeed"
             self.features.analyzed_at = time.strftime("%Y-%m-%d %H:%M:%S")
 
-            print("[+] PageSpeed Insights analysis complete")
+            if Config.PAGESPEED_CACHE_TTL > 0:
+                with _PSI_CACHE_LOCK:
+                    _PSI_CACHE[cache_key] = copy.deepcopy(self._to_dict())
+
+            logger.info("[+] PageSpeed Insights analysis complete")
 
         except requests.exceptions.RequestException as e:
             error_msg = f"PageSpeed API request failed: {str(e)}"
-            print(f"[!] {error_msg}")
+            logger.warning("[!] %s", error_msg)
             self.features.api_error = error_msg
             self.features.fallback_used = True
 
         except Exception as e:
             error_msg = f"Unexpected error during PageSpeed analysis: {str(e)}"
-            print(f"[!] {error_msg}")
+            logger.warning("[!] %s", error_msg)
             self.features.api_error = error_msg
 
         return self._to_dict()
 
-    def _extract_lighthouse_metrics(self, data: Dict) -> None:
-        """Extract Lighthouse performance scores"""
+    def _request_pagespeed(self, params: Dict[str, Any]) -> requests.Response:
+        """
+        Call the PageSpeed API, retrying rate-limited (429) and 5xx responses.
+
+        Args:
+            params: Query parameters for the runPagespeed endpoint
+
+        Returns:
+            Successful response (raises requests.HTTPError once retries run out)
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            response = _SESSION.get(self.api_url, params=params, timeout=90)
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt == self.MAX_ATTEMPTS - 1:
+                break
+
+            delay = self._retry_delay(response, attempt)
+            logger.warning("[!] PageSpeed API returned %s, retrying in %.1fs...", response.status_code, delay)
+            time.sleep(delay)
+
+        response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before the next attempt: Retry-After when given, else exponential backoff"""
         try:
-            lighthouse = data.get("lighthouseResult", {})
-            categories = lighthouse.get("categories", {})
+            delay = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            # Missing or HTTP-date Retry-After
+            delay = 0.5 * 2 ** attempt
+        return min(max(delay, 0.0), 30.0)
 
+    def _extract_lighthouse_metrics(self, categories: Dict) -> None:
+        """Extract Lighthouse performance scores"""
+        try:
             # Overall category scores (0-1 scale, convert to 0-100)
             perf = categories.get("performance", {})
             self.features.performance_score = int(perf.get("score", 0) * 100) if perf.get("score") else None
@@ -238,85 +430,40 @@ class PerformanceAnalyzer:
             self.features.seo_score = int(seo.get("score", 0) * 100) if seo.get("score") else None
 
         except Exception as e:
-            print(f"[!] Error extracting Lighthouse metrics: {str(e)}")
+            logger.warning("[!] Error extracting Lighthouse metrics: %s", e)
 
-    def _extract_core_web_vitals(self, data: Dict) -> None:
+    def _extract_core_web_vitals(self, audits: Dict) -> None:
         """Extract Core Web Vitals and other performance metrics"""
         try:
-            lighthouse = data.get("lighthouseResult", {})
-            audits = lighthouse.get("audits", {})
-
-            # Helper function to extract metric
-            def extract_metric(audit_key: str):
-                audit = audits.get(audit_key, {})
-                return {
-                    "score": audit.get("score"),  # 0-1
-                    "value": audit.get("numericValue"),  # milliseconds
-                    "display_value": audit.get("displayValue"),
-                }
-
-            # Largest Contentful Paint (LCP)
-            lcp = extract_metric("largest-contentful-paint")
-            self.features.lcp_score = lcp["score"] * 100 if lcp["score"] is not None else None
-            self.features.lcp_value = lcp["value"]
-
-            # First Input Delay (FID) - often estimated as TBT
-            # Note: FID requires real user data, so we use TBT as proxy
-
-            # Cumulative Layout Shift (CLS)
-            cls = extract_metric("cumulative-layout-shift")
-            self.features.cls_score = cls["score"] * 100 if cls["score"] is not None else None
-            self.features.cls_value = cls["value"]
-
-            # First Contentful Paint (FCP)
-            fcp = extract_metric("first-contentful-paint")
-            self.features.fcp_score = fcp["score"] * 100 if fcp["score"] is not None else None
-            self.features.fcp_value = fcp["value"]
-
-            # Time to Interactive (TTI)
-            tti = extract_metric("interactive")
-            self.features.tti_score = tti["score"] * 100 if tti["score"] is not None else None
-            self.features.tti_value = tti["value"]
-
-            # Speed Index
-            si = extract_metric("speed-index")
-            self.features.speed_index_score = si["score"] * 100 if si["score"] is not None else None
-            self.features.speed_index_value = si["value"]
-
-            # Total Blocking Time (TBT) - proxy for FID
-            tbt = extract_metric("total-blocking-time")
-            self.features.tbt_score = tbt["score"] * 100 if tbt["score"] is not None else None
-            self.features.tbt_value = tbt["value"]
-            # Use TBT as FID proxy
-            self.features.fid_score = self.features.tbt_score
-            self.features.fid_value = self.features.tbt_value
+            features = self.features
+            for audit_key, score_field, value_field in CORE_WEB_VITAL_METRICS:
+                audit = audits.get(audit_key)
+                if not audit:
+                    continue
+                score = audit.get("score")  # 0-1
+                setattr(features, score_field, score * 100 if score is not None else None)
+                setattr(features, value_field, audit.get("numericValue"))  # milliseconds
+
+            # First Input Delay (FID) requires real user data, so TBT is used as proxy
+            features.fid_score = features.tbt_score
+            features.fid_value = features.tbt_value
 
         except Exception as e:
-            print(f"[!] Error extracting Core Web Vitals: {str(e)}")
+            logger.warning("[!] Error extracting Core Web Vitals: %s", e)
 
-    def _extract_opportunities(self, data: Dict) -> None:
+    def _extract_opportunities(self, audits: Dict) -> None:
         """Extract optimization opportunities from PageSpeed Insights"""
         try:
-            lighthouse = data.get("lighthouseResult", {})
-            audits = lighthouse.get("audits", {})
+            features = self.features
+            opportunities = []
+
+            # One pass over the (pruned) audits; each audit is fetched once
+            for key, audit in audits.items():
+                if key not in OPPORTUNITY_RANK:
+                    continue
 
-            opportunity_keys = [
-                "render-blocking-resources",
-                "unused-css-rules",
-                "unused-javascript",
-                "modern-image-formats",
-                "offscreen-images",
-                "unminified-css",
-                "unminified-javascript",
-                "uses-optimized-images",
-                "uses-text-compression",
-                "uses-responsive-images",
-            ]
-
-            for key in opportunity_keys:
-                audit = audits.get(key, {})
                 if audit.get("score") is not None and audit["score"] < 1:
-                    self.features.opportunities.append({
+                    opportunities.append({
                         "id": key,
                         "title": audit.get("title"),
                         "description": audit.get("description"),
@@ -325,47 +472,39 @@ class PerformanceAnalyzer:
                         "display_value": audit.get("displayValue"),
                     })
 
-            # Extract specific resource information
-            rb = audits.get("render-blocking-resources", {})
-            if rb.get("details"):
-                items = rb["details"].get("items", [])
-                self.features.render_blocking_resources = [item.get("url") for item in items]
-                for item in items:
-                    url = item.get("url", "")
-                    if url.endswith(".css"):
-                        self.features.render_blocking_css_count += 1
-                    elif url.endswith(".js"):
-                        self.features.render_blocking_js_count += 1
-
-            # Unused JS
-            unused_js = audits.get("unused-javascript", {})
-            if unused_js.get("details"):
-                self.features.unused_js_bytes = unused_js.get("numericValue")
-
-            # Unused CSS
-            unused_css = audits.get("unused-css-rules", {})
-            if unused_css.get("details"):
-                self.features.unused_css_bytes = unused_css.get("numericValue")
+                details = audit.get("details")
+                if not details:
+                    continue
+
+                if key == "render-blocking-resources":
+                    # Extract specific resource information
+                    items = details.get("items", [])
+                    features.render_blocking_resources = [item.get("url") for item in items]
+                    for item in items:
+                        url = item.get("url", "")
+                        if url.endswith(".css"):
+                            features.render_blocking_css_count += 1
+                        elif url.endswith(".js"):
+                            features.render_blocking_js_count += 1
+                elif key == "unused-javascript":
+                    features.unused_js_bytes = audit.get("numericValue")
+                elif key == "unused-css-rules":
+                    features.unused_css_bytes = audit.get("numericValue")
+
+            # Report order varies; keep the fixed OPPORTUNITY_AUDITS order
+            opportunities.sort(key=lambda opportunity: OPPORTUNITY_RANK[opportunity["id"]])
+            features.opportunities.extend(opportunities)
 
         except Exception as e:
-            print(f"[!] Error extracting opportunities: {str(e)}")
+            logger.warning("[!] Error extracting opportunities: %s", e)
 
-    def _extract_diagnostics(self, data: Dict) -> None:
+    def _extract_diagnostics(self, audits: Dict) -> None:
         """Extract diagnostic information"""
         try:
-            lighthouse = data.get("lighthouseResult", {})
-            audits = lighthouse.get("audits", {})
+            audits_get = audits.get
 
-            diagnostic_keys = [
-                "main-thread-tasks",
-                "bootup-time",
-                "third-party-summary",
-                "font-display",
-                "uses-http2",
-            ]
-
-            for key in diagnostic_keys:
-                audit = audits.get(key, {})
+            for key in DIAGNOSTIC_AUDITS:
+                audit = audits_get(key, {})
                 if audit.get("score") is not None:
                     self.features.diagnostics.append({
                         "id": key,
@@ -376,11 +515,11 @@ class PerformanceAnalyzer:
                     })
 
             # Main thread work
-            bootup = audits.get("bootup-time", {})
+            bootup = audits_get("bootup-time", {})
             self.features.total_js_execution_time = bootup.get("numericValue")
 
             # Third-party analysis
-            third_party = audits.get("third-party-summary", {})
+            third_party = audits_get("third-party-summary", {})
             if third_party.get("details"):
                 items = third_party["details"].get("items", [])
                 self.features.third_party_requests = len(items)
@@ -388,56 +527,19 @@ class PerformanceAnalyzer:
                 self.features.third_party_blocking_time = sum(item.get("blockingTime", 0) for item in items)
 
             # HTTP/2
-            http2_audit = audits.get("uses-http2", {})
+            http2_audit = audits_get("uses-http2", {})
             self.features.uses_http2 = http2_audit.get("score", 0) == 1
 
             # Font display
-            font_audit = audits.get("font-display", {})
+            font_audit = audits_get("font-display", {})
             self.features.font_display_set = font_audit.get("score", 0) == 1
 
         except Exception as e:
-            print(f"[!] Error extracting diagnostics: {str(e)}")
+            logger.warning("[!] Error extracting diagnostics: %s", e)
 
     def _to_dict(self) -> Dict[str, Any]:
         """Convert features to dictionary"""
-        return {
-            "url": self.features.url,
-            "analyzed_at": self.features.analyzed_at,
-            "performance_score": self.features.performance_score,
-            "accessibility_score": self.features.accessibility_score,
-            "best_practices_score": self.features.best_practices_score,
-            "seo_score": self.features.seo_score,
-            "lcp_score": self.features.lcp_score,
-            "lcp_value": self.features.lcp_value,
-            "fid_score": self.features.fid_score,
-            "fid_value": self.features.fid_value,
-            "cls_score": self.features.cls_score,
-            "cls_value": self.features.cls_value,
-            "fcp_score": self.features.fcp_score,
-            "fcp_value": self.features.fcp_value,
-            "tti_score": self.features.tti_score,
-            "tti_value": self.features.tti_value,
-            "speed_index_score": self.features.speed_index_score,
-            "speed_index_value": self.features.speed_index_value,
-            "tbt_score": self.features.tbt_score,
-            "tbt_value": self.features.tbt_value,
-            "render_blocking_css_count": self.features.render_blocking_css_count,
-            "render_blocking_js_count": self.features.render_blocking_js_count,
-            "render_blocking_resources": self.features.render_blocking_resources,
-            "unused_js_bytes": self.features.unused_js_bytes,
-            "unused_css_bytes": self.features.unused_css_bytes,
-            "total_js_execution_time": self.features.total_js_execution_time,
-            "third_party_requests": self.features.third_party_requests,
-            "third_party_size": self.features.third_party_size,
-            "third_party_blocking_time": self.features.third_party_blocking_time,
-            "uses_http2": self.features.uses_http2,
-            "font_display_set": self.features.font_display_set,
-            "opportunities": self.features.opportunities,
-            "diagnostics": self.features.diagnostics,
-            "analysis_source": self.features.analysis_source,
-            "api_error": self.features.api_error,
-            "fallback_used": self.features.fallback_used,
-        }
+        return dict(zip(self.OUTPUT_FIELDS, self._output_values(self.features)))
 
 
 class HeaderAnalyzer:
@@ -447,6 +549,59 @@ class HeaderAnalyzer:
     This is a FREE operation that provides valuable technical insights.
     """
 
+    # Feature fields returned by extract(), in output order
+    OUTPUT_FIELDS = (
+        "url",
+        "analyzed_at",
+        "response_time",
+        "http_status_code",
+        "redirects_count",
+        "uses_gzip_compression",
+        "uses_brotli_compression",
+        "has_cache_control",
+        "cache_control_value",
+        "has_etag",
+        "has_expires",
+        "expires_value",
+        "has_hsts",
+        "hsts_value",
+        "has_csp",
+        "csp_value",
+        "has_x_frame_options",
+        "x_frame_options_value",
+        "has_x_content_type_options",
+        "has_referrer_policy",
+        "referrer_policy_value",
+        "server_type",
+        "uses_http2",
+        "uses_http3",
+        "analysis_source",
+        "api_error",
+    )
+    _output_values = operator.attrgetter(*OUTPUT_FIELDS)
+
+    # Advertise every encoding we detect so the server reports its real Content-Encoding
+    REQUEST_HEADERS = {
+        "Accept-Encoding": "br, gzip, deflate",
+        "User-Agent": "SeoAgnoAnalyzer/1.0",
+    }
+
+    # Status codes returned by servers that do not implement HEAD
+    HEAD_UNSUPPORTED_STATUSES = {405, 501}
+
+    # Lower-cased header name -> (presence flag field, value field)
+    HEADER_FIELDS = {
+        "cache-control": ("has_cache_control", "cache_control_value"),
+        "etag": ("has_etag", None),
+        "expires": ("has_expires", "expires_value"),
+        "strict-transport-security": ("has_hsts", "hsts_value"),
+        "content-security-policy": ("has_csp", "csp_value"),
+        "x-frame-options": ("has_x_frame_options", "x_frame_options_value"),
+        "x-content-type-options": ("has_x_content_type_options", None),
+        "referrer-policy": ("has_referrer_policy", "referrer_policy_value"),
+        "server": (None, "server_type"),
+    }
+
     def __init__(self, url: str):
         """
         Initialize the Header Analyzer.
@@ -464,11 +619,15 @@ class HeaderAnalyzer:
         Returns:
             Dictionary of header-based features
         """
-        print(f"[*] Analyzing HTTP headers...")
+        logger.info("[*] Analyzing HTTP headers...")
 
         try:
             # Make HEAD request first (faster)
-            response = requests.head(self.url, timeout=10, allow_redirects=True)
+            response = _SESSION.head(self.url, headers=self.REQUEST_HEADERS, timeout=10, allow_redirects=True)
+            if response.status_code in self.HEAD_UNSUPPORTED_STATUSES:
+                # Server rejects HEAD: read the headers of a GET without downloading the body
+                response = _SESSION.get(self.url, headers=self.REQUEST_HEADERS, timeout=10, stream=True)
+                response.close()
             headers = response.headers
 
             # Track response time
@@ -483,41 +642,17 @@ class HeaderAnalyzer:
             self.features.uses_gzip_compression = "gzip" in content_encoding
             self.features.uses_brotli_compression = "br" in content_encoding
 
-            # Caching
-            if "Cache-Control" in headers:
-                self.features.has_cache_control = True
-                self.features.cache_control_value = headers["Cache-Control"]
-
-            if "ETag" in headers:
-                self.features.has_etag = True
-
-            if "Expires" in headers:
-                self.features.has_expires = True
-                self.features.expires_value = headers["Expires"]
-
-            # Security Headers
-            if "Strict-Transport-Security" in headers:
-                self.features.has_hsts = True
-                self.features.hsts_value = headers["Strict-Transport-Security"]
-
-            if "Content-Security-Policy" in headers:
-                self.features.has_csp = True
-                self.features.csp_value = headers["Content-Security-Policy"]
-
-            if "X-Frame-Options" in headers:
-                self.features.has_x_frame_options = True
-                self.features.x_frame_options_value = headers["X-Frame-Options"]
-
-            if "X-Content-Type-Options" in headers:
-                self.features.has_x_content_type_options = True
-
-            if "Referrer-Policy" in headers:
-                self.features.has_referrer_policy = True
-                self.features.referrer_policy_value = headers["Referrer-Policy"]
-
-            # Server information
-            if "Server" in headers:
-                self.features.server_type = headers["Server"]
+            # Caching, security and server headers in one pass over the response headers
+            features = self.features
+            for name, value in headers.items():
+                fields = self.HEADER_FIELDS.get(name.lower())
+                if fields is None:
+                    continue
+                flag_field, value_field = fields
+                if flag_field:
+                    setattr(features, flag_field, True)
+                if value_field:
+                    setattr(features, value_field, value)
 
             # HTTP version detection (approximate)
             if hasattr(response.raw, 'version'):
@@ -529,45 +664,18 @@ class HeaderAnalyzer:
             self.features.analysis_source = "headers"
             self.features.analyzed_at = time.strftime("%Y-%m-%d %H:%M:%S")
 
-            print("[+] HTTP header analysis complete")
+            logger.info("[+] HTTP header analysis complete")
 
         except Exception as e:
             error_msg = f"Error analyzing headers: {str(e)}"
-            print(f"[!] {error_msg}")
+            logger.warning("[!] %s", error_msg)
             self.features.api_error = error_msg
 
         return self._to_dict()
 
     def _to_dict(self) -> Dict[str, Any]:
         """Convert features to dictionary"""
-        return {
-            "url": self.features.url,
-            "analyzed_at": self.features.analyzed_at,
-            "response_time": self.features.response_time,
-            "http_status_code": self.features.http_status_code,
-            "redirects_count": self.features.redirects_count,
-            "uses_gzip_compression": self.features.uses_gzip_compression,
-            "uses_brotli_compression": self.features.uses_brotli_compression,
-            "has_cache_control": self.features.has_cache_control,
-            "cache_control_value": self.features.cache_control_value,
-            "has_etag": self.features.has_etag,
-            "has_expires": self.features.has_expires,
-            "expires_value": self.features.expires_value,
-            "has_hsts": self.features.has_hsts,
-            "hsts_value": self.features.hsts_value,
-            "has_csp": self.features.has_csp,
-            "csp_value": self.features.csp_value,
-            "has_x_frame_options": self.features.has_x_frame_options,
-            "x_frame_options_value": self.features.x_frame_options_value,
-            "has_x_content_type_options": self.features.has_x_content_type_options,
-            "has_referrer_policy": self.features.has_referrer_policy,
-            "referrer_policy_value": self.features.referrer_policy_value,
-            "server_type": self.features.server_type,
-            "uses_http2": self.features.uses_http2,
-            "uses_http3": self.features.uses_http3,
-            "analysis_source": self.features.analysis_source,
-            "api_error": self.features.api_error,
-        }
+        return dict(zip(self.OUTPUT_FIELDS, self._output_values(self.features)))
 
 
 class LocalPerformanceAnalyzer:
@@ -577,6 +685,59 @@ class LocalPerformanceAnalyzer:
     This is completely FREE and provides detailed metrics when APIs fail or reach limits.
     """
 
+    # Feature fields returned by extract(), in output order
+    OUTPUT_FIELDS = (
+        "url",
+        "analyzed_at",
+        "response_time",
+        "fcp_value",
+        "lcp_value",
+        "cls_value",
+        "total_page_size",
+        "total_requests",
+        "html_size",
+        "css_size",
+        "js_size",
+        "image_size",
+        "font_size",
+        "other_size",
+        "html_requests",
+        "css_requests",
+        "js_requests",
+        "image_requests",
+        "font_requests",
+        "other_requests",
+        "third_party_requests",
+        "third_party_size",
+        "analysis_source",
+        "api_error",
+    )
+    _output_values = operator.attrgetter(*OUTPUT_FIELDS)
+
+    # (MIME substring, category, URL suffixes) checked in order, mirroring the original if/elif chain
+    RESOURCE_RULES = (
+        ("text/html", "html", ()),
+        ("text/css", "css", (".css",)),
+        ("javascript", "js", (".js",)),
+        ("image", "image", ()),
+        ("font", "font", (".woff", ".woff2", ".ttf", ".otf")),
+    )
+    RESOURCE_CATEGORIES = ("html", "css", "js", "image", "font", "other")
+
+    # Injected before any page script runs; buffered observers also see entries from before it
+    WEB_VITALS_INIT_SCRIPT = """
+        window.__webVitals = {lcp: null, cls: 0};
+        new PerformanceObserver((list) => {
+            const entries = list.getEntries();
+            window.__webVitals.lcp = entries[entries.length - 1].startTime;
+        }).observe({type: 'largest-contentful-paint', buffered: true});
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) {
+                if (!entry.hadRecentInput) window.__webVitals.cls += entry.value;
+            }
+        }).observe({type: 'layout-shift', buffered: true});
+    """
+
     def __init__(self, url: str):
         """
         Initialize the Local Performance Analyzer.
@@ -594,7 +755,7 @@ class LocalPerformanceAnalyzer:
         Returns:
             Dictionary of performance features
         """
-        print(f"[*] Analyzing performance using local Playwright...")
+        logger.info("[*] Analyzing performance using local Playwright...")
 
         try:
             from playwright.sync_api import sync_playwright
@@ -604,31 +765,54 @@ class LocalPerformanceAnalyzer:
                 context = browser.new_context()
                 page = context.new_page()
 
-                # Collect resource information
+                # Collect resource information from DevTools network events; the
+                # byte count comes with loadingFinished, so no body is transferred
                 resources = []
-
-                def on_response(response):
-                    # Try to get body size, but handle cases where body is not available
-                    try:
-                        body_size = len(response.body()) if response.status == 200 else 0
-                    except Exception:
-                        # Body not available (redirect, failed request, or unsupported resource type)
-                        body_size = 0
-
-                    resources.append({
-                        "url": response.url,
-                        "status": response.status,
-                        "content_type": response.headers.get("content-type", ""),
-                        "size": body_size,
-                    })
-
-                page.on("response", on_response)
+                pending = {}  # CDP requestId -> resource seen in responseReceived
+
+                def on_response_received(event):
+                    response = event["response"]
+                    pending[event["requestId"]] = {
+                        "url": response.get("url", ""),
+                        "status": response.get("status"),
+                        "content_type": response.get("mimeType", ""),
+                        "size": 0,
+                    }
+
+                def on_loading_finished(event):
+                    resource = pending.pop(event["requestId"], None)
+                    if resource is not None:
+                        if resource["status"] == 200:
+                            resource["size"] = int(event.get("encodedDataLength", 0))
+                        resources.append(resource)
+
+                def on_loading_failed(event):
+                    # Failed or aborted loads still count as requests, with no size
+                    resource = pending.pop(event["requestId"], None)
+                    if resource is not None:
+                        resources.append(resource)
+
+                cdp = context.new_cdp_session(page)
+                cdp.send("Network.enable")
+                cdp.on("Network.responseReceived", on_response_received)
+                cdp.on("Network.loadingFinished", on_loading_finished)
+                cdp.on("Network.loadingFailed", on_loading_failed)
+
+                # Record LCP/CLS from the first paint on, so they can be read without waiting for network idle
+                page.add_init_script(self.WEB_VITALS_INIT_SCRIPT)
 
                 # Navigate and measure time
                 start_time = time.time()
-                page.goto(self.url, wait_until="networkidle", timeout=30000)
+                page.goto(self.url, wait_until="domcontentloaded", timeout=15000)
                 load_time = (time.time() - start_time) * 1000  # ms
 
+                try:
+                    # first-paint and first-contentful-paint
+                    page.wait_for_function("performance.getEntriesByType('paint').length >= 2", timeout=5000)
+                except Exception:
+                    # Blank or very slow pages never report both paints; use what is available
+                    pass
+
                 # Extract performance metrics using JavaScript
                 performance_data = page.evaluate("""() => {
                     const perf = performance.getEntriesByType('navigation')[0];
@@ -642,6 +826,8 @@ class LocalPerformanceAnalyzer:
                         transferSize: perf.transferSize,
                         encodedBodySize: perf.encodedBodySize,
                         decodedBodySize: perf.decodedBodySize,
+                        largestContentfulPaint: window.__webVitals?.lcp,
+                        cumulativeLayoutShift: window.__webVitals?.cls,
                     };
                 }""")
 
@@ -651,6 +837,8 @@ class LocalPerformanceAnalyzer:
                 # Store basic metrics
                 self.features.response_time = load_time
                 self.features.fcp_value = performance_data.get("firstContentfulPaint")
+                self.features.lcp_value = performance_data.get("largestContentfulPaint")
+                self.features.cls_value = performance_data.get("cumulativeLayoutShift")
                 self.features.total_page_size = performance_data.get("decodedBodySize")
                 self.features.total_requests = len(resources)
 
@@ -659,69 +847,69 @@ class LocalPerformanceAnalyzer:
                 self.features.analysis_source = "local"
                 self.features.analyzed_at = time.strftime("%Y-%m-%d %H:%M:%S")
 
-                print("[+] Local performance analysis complete")
+                logger.info("[+] Local performance analysis complete")
 
         except ImportError:
             error_msg = "Playwright not installed. Run: pip install playwright && playwright install chromium"
-            print(f"[!] {error_msg}")
+            logger.warning("[!] %s", error_msg)
             self.features.api_error = error_msg
 
         except Exception as e:
             error_msg = f"Error during local performance analysis: {str(e)}"
-            print(f"[!] {error_msg}")
+            logger.warning("[!] %s", error_msg)
             self.features.api_error = error_msg
 
         return self._to_dict()
 
     def _analyze_resources(self, resources: List[Dict]) -> None:
         """Analyze resource breakdown"""
+        sizes = dict.fromkeys(self.RESOURCE_CATEGORIES, 0)
+        counts = dict.fromkeys(self.RESOURCE_CATEGORIES, 0)
+        third_party_requests = third_party_size = 0
+        page_host = _site_host(self.url)
+
         for resource in resources:
-            content_type = resource["content_type"].lower()
-            size = resource["size"]
-
-            if "text/html" in content_type:
-                self.features.html_size = (self.features.html_size or 0) + size
-                self.features.html_requests += 1
-            elif "text/css" in content_type or resource["url"].endswith(".css"):
-                self.features.css_size = (self.features.css_size or 0) + size
-                self.features.css_requests += 1
-            elif "javascript" in content_type or resource["url"].endswith(".js"):
-                self.features.js_size = (self.features.js_size or 0) + size
-                self.features.js_requests += 1
-            elif "image" in content_type:
-                self.features.image_size = (self.features.image_size or 0) + size
-                self.features.image_requests += 1
-            elif "font" in content_type or any(resource["url"].endswith(ext) for ext in [".woff", ".woff2", ".ttf", ".otf"]):
-                self.features.font_size = (self.features.font_size or 0) + size
-                self.features.font_requests += 1
-            else:
-                self.features.other_size = (self.features.other_size or 0) + size
-                self.features.other_requests += 1
+            category = self._categorize_resource(resource["content_type"].lower(), resource["url"])
+            sizes[category] += resource["size"]
+            counts[category] += 1
+
+            # Requests to another site (subdomains of the page host are first-party)
+            host = _site_host(resource["url"])
+            if host and page_host and host != page_host and not host.endswith("." + page_host):
+                third_party_requests += 1
+                third_party_size += resource["size"]
+
+        # Assign once per category; categories without requests keep their None size
+        features = self.features
+        for category in self.RESOURCE_CATEGORIES:
+            if counts[category]:
+                setattr(features, f"{category}_size", (getattr(features, f"{category}_size") or 0) + sizes[category])
+                setattr(features, f"{category}_requests", getattr(features, f"{category}_requests") + counts[category])
+
+        if page_host:
+            features.third_party_requests = third_party_requests
+            features.third_party_size = third_party_size
+
+    @classmethod
+    def _categorize_resource(cls, content_type: str, url: str) -> str:
+        """Map a resource to html/css/js/image/font/other, MIME type first, then URL suffix"""
+        for mime_part, category, url_suffixes in cls.RESOURCE_RULES:
+            if mime_part in content_type or (url_suffixes and url.endswith(url_suffixes)):
+                return category
+        return "other"
 
     def _to_dict(self) -> Dict[str, Any]:
         """Convert features to dictionary"""
-        return {
-            "url": self.features.url,
-            "analyzed_at": self.features.analyzed_at,
-            "response_time": self.features.response_time,
-            "fcp_value": self.features.fcp_value,
-            "total_page_size": self.features.total_page_size,
-            "total_requests": self.features.total_requests,
-            "html_size": self.features.html_size,
-            "css_size": self.features.css_size,
-            "js_size": self.features.js_size,
-            "image_size": self.features.image_size,
-            "font_size": self.features.font_size,
-            "other_size": self.features.other_size,
-            "html_requests": self.features.html_requests,
-            "css_requests": self.features.css_requests,
-            "js_requests": self.features.js_requests,
-            "image_requests": self.features.image_requests,
-            "font_requests": self.features.font_requests,
-            "other_requests": self.features.other_requests,
-            "analysis_source": self.features.analysis_source,
-            "api_error": self.features.api_error,
-        }
+        return dict(zip(self.OUTPUT_FIELDS, self._output_values(self.features)))
+
+
+def _merge_local_fallback(combined_features: Dict[str, Any], local_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill fields still missing after PageSpeed/header analysis with local Playwright results"""
+    # Only update missing fields
+    for key, value in local_data.items():
+        if combined_features.get(key) is None:
+            combined_features[key] = value
+    return combined_features
 
 
 def analyze_performance(url: str, use_fallback: bool = True) -> Dict[str, Any]:
@@ -730,7 +918,7 @@ def analyze_performance(url: str, use_fallback: bool = True) -> Dict[str, Any]:
 
     Strategy:
     1. Try PageSpeed Insights API (best, most comprehensive)
-    2. Always run HTTP Headers analysis (free, fast)
+    2. Always run HTTP Headers analysis (free, fast) - concurrently with step 1
     3. If API fails and fallback enabled, use local Playwright
 
     Args:
@@ -740,26 +928,86 @@ def analyze_performance(url: str, use_fallback: bool = True) -> Dict[str, Any]:
     Returns:
         Combined dictionary of all performance features
     """
-    combined_features = {}
-
-    # 1. Try PageSpeed Insights
-    pagespeed = PerformanceAnalyzer(url)
-    pagespeed_data = pagespeed.extract()
-    combined_features.update(pagespeed_data)
+    # 1 + 2. PageSpeed Insights and HTTP headers are independent requests;
+    # run them side by side so the total wait is the slower of the two
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pagespeed_future = executor.submit(PerformanceAnalyzer(url).extract)
+        headers_future = executor.submit(HeaderAnalyzer(url).extract)
+        pagespeed_data = pagespeed_future.result()
+        headers_data = headers_future.result()
 
-    # 2. Always get HTTP headers (fast and free)
-    headers = HeaderAnalyzer(url)
-    headers_data = headers.extract()
-    combined_features.update(headers_data)
+    combined_features = {**pagespeed_data, **headers_data}
 
     # 3. Use local fallback if API failed
     if pagespeed_data.get("api_error") and use_fallback:
-        print("[*] PageSpeed API failed, using local fallback...")
-        local = LocalPerformanceAnalyzer(url)
-        local_data = local.extract()
-        # Only update missing fields
-        for key, value in local_data.items():
-            if combined_features.get(key) is None:
-                combined_features[key] = value
+        logger.info("[*] PageSpeed API failed, using local fallback...")
+        _merge_local_fallback(combined_features, LocalPerformanceAnalyzer(url).extract())
+
+    return combined_features
+
+
+async def analyze_performance_async(url: str, use_fallback: bool = True) -> Dict[str, Any]:
+    """
+    Async variant of analyze_performance() for callers already inside an event loop.
+
+    The analyzers use blocking HTTP (and the sync Playwright API, which cannot
+    run on an event loop thread), so each one runs in a worker thread.
+
+    Args:
+        url: URL to analyze
+        use_fallback: Whether to use local fallback if API fails
+
+    Returns:
+        Combined dictionary of all performance features
+    """
+    pagespeed_data, headers_data = await asyncio.gather(
+        asyncio.to_thread(PerformanceAnalyzer(url).extract),
+        asyncio.to_thread(HeaderAnalyzer(url).extract),
+    )
+
+    combined_features = {**pagespeed_data, **headers_data}
+
+    if pagespeed_data.get("api_error") and use_fallback:
+        logger.info("[*] PageSpeed API failed, using local fallback...")
+        local_data = await asyncio.to_thread(LocalPerformanceAnalyzer(url).extract)
+        _merge_local_fallback(combined_features, local_data)
 
     return combined_features
+
+
+async def analyze_performance_many(
+    urls: List[str],
+    concurrency: int = 4,
+    use_fallback: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Analyze many URLs concurrently, bounded to stay within the PageSpeed quota.
+
+    Rate-limited (429) and 5xx PageSpeed responses are retried by
+    PerformanceAnalyzer._request_pagespeed(), which waits for Retry-After
+    when given and backs off exponentially otherwise.
+
+    Args:
+        urls: URLs to analyze
+        concurrency: Maximum number of URLs analyzed at once
+        use_fallback: Whether to use local fallback if API fails
+
+    Returns:
+        Dictionary mapping each URL to its performance features (or an error dict)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def analyze_one(url: str):
+        async with semaphore:
+            try:
+                return url, await analyze_performance_async(url, use_fallback=use_fallback)
+            except Exception as e:
+                return url, {"url": url, "api_error": f"Error analyzing {url}: {e}"}
+
+    results = {}
+    tasks = [analyze_one(url) for url in urls]
+    for completed in asyncio.as_completed(tasks):
+        url, features = await completed
+        results[url] = features
+        logger.info("[+] Performance analysis finished for %s (%d/%d)", url, len(results), len(tasks))
+    return results
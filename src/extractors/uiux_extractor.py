@@ -3,12 +3,267 @@ UI/UX Feature Extractor
 Captures screenshots, runs accessibility audits, and extracts visual design features.
 """
 
+import asyncio
+import atexit
+import base64
+import binascii
+import functools
+import hashlib
+import importlib.util
 import os
 import json
-import base64
-from typing import Dict, Any, Optional, List
+import logging
+import re
+import shutil
+import string
+import tempfile
+import time
+import uuid
+from typing import Dict, Any, Optional, List, Literal, Tuple
 from pathlib import Path
 
+from config import Config
+from src.extractors._browser_pool import browser_pool
+from src.extractors._image_prep import convert_image, downscale_image, prepare_screenshot, prepare_screenshot_base64
+
+logger = logging.getLogger(__name__)
+
+# Viewport configurations available for URL analysis
+_ALL_VIEWPORTS = {
+    "desktop": {"width": 1920, "height": 1080},
+    "tablet": {"width": 768, "height": 1024},
+    "mobile": {"width": 375, "height": 667},
+}
+
+# Captured unless viewports are requested explicitly (tablet is opt-in)
+DEFAULT_VIEWPORTS = ("desktop", "mobile")
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Captured screenshots are written here and removed after this many seconds
+SCREENSHOT_RETENTION_SECONDS = 3600
+
+# Image format for each provided screenshot file extension
+IMAGE_FORMATS = {".png": "png", ".jpg": "jpeg", ".jpeg": "jpeg", ".webp": "webp"}
+
+# Inline screenshots: data URIs, or bare base64 longer than any file path
+DATA_URI_PREFIX = "data:image/"
+BASE64_ALPHABET = frozenset(string.ascii_letters + string.digits + "+/=")
+MIN_INLINE_BASE64_LENGTH = 256
+
+# Leading bytes identifying inline image formats
+IMAGE_SIGNATURES = ((b"\x89PNG", "png"), (b"\xff\xd8\xff", "jpeg"), (b"RIFF", "webp"))
+
+# Formats captured screenshots can be saved in, and the lossy encoding quality
+CAPTURE_FORMATS = ("png", "jpeg", "webp")
+IMAGE_QUALITY = 80
+
+# Navigation waits (milliseconds): DOMContentLoaded, then a bounded wait for load
+NAVIGATION_TIMEOUT_MS = 15000
+LOAD_TIMEOUT_MS = 5000
+SETTLE_MS = 800
+
+# Captures are clipped to the first fold (px), so taller viewports are cut at this height
+FOLD_HEIGHT = 900
+
+# Analytics and ad hosts aborted during capture; they change neither layout nor
+# the accessibility checks but keep the network busy
+BLOCKED_DOMAINS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "googleadservices.com", "facebook.net",
+    "hotjar.com", "segment.com", "segment.io", "mixpanel.com", "amplitude.com",
+    "clarity.ms", "scorecardresearch.com", "adnxs.com", "criteo.com",
+    "taboola.com", "outbrain.com", "quantserve.com", "nr-data.net",
+)
+
+# Matched by the Playwright driver, so only blocked requests reach Python
+BLOCKED_URL_PATTERN = re.compile(
+    r"^https?://([^/?#]*\.)?(%s)(:\d+)?([/?#]|$)" % "|".join(re.escape(d) for d in BLOCKED_DOMAINS)
+)
+
+
+# Basic accessibility checks, evaluated in the page as one script
+ACCESSIBILITY_PROBE_SCRIPT = """() => {
+    // Selectors do the bulk of the counting; loops only cover what CSS cannot
+    // express (whitespace-only text) and iterate NodeLists without copying them
+    let imagesWithoutAlt = document.querySelectorAll('img:not([alt]), img[alt=""]').length;
+    for (const img of document.querySelectorAll('img[alt]:not([alt=""])')) {
+        if (img.alt.trim() === '') imagesWithoutAlt++;
+    }
+
+    let linksWithoutText = 0;
+    for (const link of document.querySelectorAll('a:not([aria-label]), a[aria-label=""]')) {
+        if (!link.textContent.trim()) linksWithoutText++;
+    }
+
+    // Collect label targets once instead of querying per input
+    const labelTargets = new Set(
+        Array.from(document.querySelectorAll('label[for]'), label => label.getAttribute('for'))
+    );
+    let inputsWithoutLabels = 0;
+    for (const input of document.querySelectorAll('input:not([type="hidden"]):is(:not([aria-label]), [aria-label=""])')) {
+        if (!input.id || !labelTargets.has(input.id)) inputsWithoutLabels++;
+    }
+
+    const levels = Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, h6'), h => parseInt(h.tagName[1]));
+    const headingIssues = [];
+
+    // Check for H1
+    const h1Count = levels.filter(l => l === 1).length;
+    if (h1Count === 0) headingIssues.push('No H1 heading found');
+    if (h1Count > 1) headingIssues.push(`Multiple H1 headings (${h1Count})`);
+
+    // Check for skipped levels
+    for (let i = 1; i < levels.length; i++) {
+        if (levels[i] - levels[i-1] > 1) {
+            headingIssues.push(`Skipped heading level from H${levels[i-1]} to H${levels[i]}`);
+            break;
+        }
+    }
+
+    return {
+        imagesWithoutAlt: imagesWithoutAlt,
+        linksWithoutText: linksWithoutText,
+        inputsWithoutLabels: inputsWithoutLabels,
+        hasLang: document.documentElement.hasAttribute('lang'),
+        headingIssues: headingIssues,
+    };
+}"""
+
+
+class Screenshot(dict):
+    """
+    Screenshot reference stored in the extracted features.
+
+    A plain {"path": ..., "format": ...} dict, or {"data": <base64>, "format": ...}
+    for screenshots provided inline, so features stay JSON-serializable
+    between workflow steps. Files are only read, and base64 encoded, when
+    a consumer asks for it. Wrap decoded feature entries again with
+    Screenshot(entry) to use the helpers.
+    """
+
+    @property
+    def path(self) -> Optional[str]:
+        return self.get("path")
+
+    @property
+    def format(self) -> str:
+        return self.get("format", "png")
+
+    @property
+    def size(self) -> int:
+        """Size of the image in bytes"""
+        if "data" in self:
+            data = self["data"]
+            return len(data) * 3 // 4 - data.count("=", -2)
+        return os.path.getsize(self["path"])
+
+    def as_bytes(self) -> bytes:
+        """Return the image bytes (downscaled when oversized, memoized per file version)"""
+        if "data" in self:
+            # a2b_base64 accepts the ASCII str directly, skipping b64decode's bytes copy
+            return downscale_image(binascii.a2b_base64(self["data"]))
+        return prepare_screenshot(self["path"])
+
+    def as_base64(self) -> str:
+        """Return the base64 encoded image (streamed from disk unless it must be downscaled)"""
+        if "data" in self:
+            # Inline screenshots are passed through exactly as provided
+            return self["data"]
+        return prepare_screenshot_base64(self["path"])
+
+
+def _inline_screenshot(value: str) -> Optional[Screenshot]:
+    """Return a Screenshot for a data URI or bare base64 string, or None for a path"""
+    if value.startswith(DATA_URI_PREFIX):
+        header, _, data = value.partition(",")
+        image_format = header[len(DATA_URI_PREFIX):].split(";", 1)[0].lower()
+        return Screenshot(data=data, format="jpeg" if image_format == "jpg" else image_format)
+
+    if len(value) < MIN_INLINE_BASE64_LENGTH or not BASE64_ALPHABET.issuperset(value[:64]):
+        return None
+    try:
+        head = base64.b64decode(value[:16])
+    except ValueError:
+        return None
+    image_format = next((name for signature, name in IMAGE_SIGNATURES if head.startswith(signature)), "png")
+    return Screenshot(data=value, format=image_format)
+
+
+@functools.lru_cache(maxsize=1)
+def _screenshot_dir() -> Path:
+    """
+    Directory for captured screenshots.
+
+    With the capture cache enabled this is Config.UIUX_CACHE_DIR, so cached
+    entries can point at their screenshots across runs; otherwise a
+    per-process temp directory removed at exit.
+    """
+    if Config.UIUX_CACHE_TTL > 0:
+        directory = Path(Config.UIUX_CACHE_DIR).resolve()
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+
+    directory = tempfile.mkdtemp(prefix="uiux-screenshots-")
+    atexit.register(shutil.rmtree, directory, True)
+    return Path(directory)
+
+
+def _new_screenshot_path(viewport_name: str, image_format: str) -> Path:
+    """Reserve a unique file path for a capture and drop expired captures"""
+    directory = _screenshot_dir()
+    cutoff = time.time() - max(SCREENSHOT_RETENTION_SECONDS, Config.UIUX_CACHE_TTL)
+    for old_path in directory.iterdir():
+        try:
+            if old_path.stat().st_mtime < cutoff:
+                old_path.unlink()
+        except OSError:
+            continue
+    return directory / f"{uuid.uuid4().hex}-{viewport_name}.{image_format}"
+
+
+def _capture_cache_path(url: str, image_format: str, viewports: List[str]) -> Optional[Path]:
+    """Cache file for a URL capture, or None when the capture cache is disabled"""
+    if Config.UIUX_CACHE_TTL <= 0:
+        return None
+    payload = json.dumps({"url": url, "format": image_format, "viewports": viewports, "fold": FOLD_HEIGHT}, sort_keys=True)
+    return _screenshot_dir() / f"{hashlib.sha256(payload.encode('utf-8')).hexdigest()}.json"
+
+
+def _load_cached_capture(cache_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+    """Return cached URL features if fresh and all screenshots still exist"""
+    if cache_path is None:
+        return None
+    try:
+        if time.time() - cache_path.stat().st_mtime > Config.UIUX_CACHE_TTL:
+            return None
+        features = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    screenshots = {name: Screenshot(entry) for name, entry in features["screenshots"].items()}
+    if not all(screenshot.path and os.path.exists(screenshot.path) for screenshot in screenshots.values()):
+        return None
+    features["screenshots"] = screenshots
+    return features
+
+
+def _store_capture(cache_path: Optional[Path], features: Dict[str, Any]) -> None:
+    """Write URL features to the capture cache (failed captures are not cached)"""
+    if cache_path is None or not features["screenshots"]:
+        return
+    try:
+        tmp_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps(features), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("[UI/UX] Could not cache capture: %s", e)
+
+
+async def _abort_route(route) -> None:
+    """Route handler for BLOCKED_URL_PATTERN requests"""
+    await route.abort()
+
 
 class UIUXExtractor:
     """
@@ -25,6 +280,8 @@ class UIUXExtractor:
         url: Optional[str] = None,
         screenshot: Optional[str] = None,
         screenshots: Optional[Dict[str, str]] = None,
+        image_format: Literal["png", "jpeg", "webp"] = "jpeg",
+        viewports: Optional[List[str]] = None,
     ):
         """
         Initialize extractor with URL or screenshot(s).
@@ -34,10 +291,26 @@ class UIUXExtractor:
             screenshot: Path to single screenshot file
             screenshots: Dict mapping viewport names to screenshot paths
                         e.g., {"desktop": "path.png", "mobile": "path2.png"}
+            image_format: Format for captured screenshots (jpeg/webp are 3-10x
+                        smaller than png; webp needs Pillow)
+            viewports: Viewports to capture for a URL (desktop, tablet, mobile);
+                        defaults to desktop and mobile
         """
+        if image_format not in CAPTURE_FORMATS:
+            raise ValueError(f"image_format must be one of {', '.join(CAPTURE_FORMATS)}")
+        if image_format == "webp" and importlib.util.find_spec("PIL") is None:
+            raise ValueError("image_format='webp' requires Pillow (pip install Pillow)")
+
+        viewport_names = list(viewports or DEFAULT_VIEWPORTS)
+        unknown = [name for name in viewport_names if name not in _ALL_VIEWPORTS]
+        if unknown:
+            raise ValueError(f"Unknown viewport(s): {', '.join(unknown)} (choose from {', '.join(_ALL_VIEWPORTS)})")
+
         self.url = url
         self.screenshot = screenshot
         self.screenshots = screenshots
+        self.image_format = image_format
+        self.viewports = {name: _ALL_VIEWPORTS[name] for name in viewport_names}
 
         # Determine input mode
         if url:
@@ -55,25 +328,25 @@ class UIUXExtractor:
 
         Returns:
             Dictionary containing:
-            - screenshots: Dict of viewport -> base64 encoded image data
+            - screenshots: Dict of viewport -> Screenshot reference ({"path", "format"})
             - accessibility: Accessibility audit results (if URL provided)
             - metadata: Analysis metadata
         """
-        features = {
-            "mode": self.mode,
-            "screenshots": {},
-            "accessibility": None,
-            "metadata": {}
-        }
-
         if self.mode == "url":
+            cache_path = self._capture_cache_path()
+            features = _load_cached_capture(cache_path)
+            if features is not None:
+                logger.info("[UI/UX] Reusing cached capture for: %s", self.url)
+                return features
+
             # Capture screenshots and run accessibility audit
-            features["screenshots"] = self._capture_screenshots()
-            features["accessibility"] = self._run_accessibility_audit()
-            features["metadata"]["source"] = self.url
-            features["metadata"]["viewports_captured"] = list(features["screenshots"].keys())
+            features = self._url_features(*self._run_playwright_session())
+            _store_capture(cache_path, features)
+            return features
+
+        features = self._empty_features()
 
-        elif self.mode == "screenshots":
+        if self.mode == "screenshots":
             # Load provided screenshots
             features["screenshots"] = self._load_screenshots(self.screenshots)
             features["metadata"]["source"] = "provided_screenshots"
@@ -88,250 +361,337 @@ class UIUXExtractor:
 
         return features
 
-    def _capture_screenshots(self) -> Dict[str, str]:
+    async def extract_async(self) -> Dict[str, Any]:
         """
-        Capture screenshots at multiple viewport sizes using Playwright.
+        Extract UI/UX features without blocking the caller's event loop.
+
+        URL captures run on the shared browser pool, so concurrent extractions
+        overlap their network and rendering time (capped by
+        Config.BROWSER_MAX_SESSIONS). Provided screenshots are only checked
+        on disk, which needs no browser.
 
         Returns:
-            Dict mapping viewport name to base64 encoded image
+            Same dictionary as extract()
         """
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
-            print("[!] Playwright not installed. Install with: playwright install chromium")
-            return {}
-
-        screenshots = {}
-
-        # Define viewport configurations
-        viewports = {
-            "desktop": {"width": 1920, "height": 1080},
-            "tablet": {"width": 768, "height": 1024},
-            "mobile": {"width": 375, "height": 667},
+        if self.mode == "url":
+            cache_path = self._capture_cache_path()
+            features = _load_cached_capture(cache_path)
+            if features is not None:
+                logger.info("[UI/UX] Reusing cached capture for: %s", self.url)
+                return features
+
+            features = self._url_features(*await self._run_playwright_session_async())
+            _store_capture(cache_path, features)
+            return features
+        return self.extract()
+
+    def _capture_cache_path(self) -> Optional[Path]:
+        return _capture_cache_path(self.url, self.image_format, list(self.viewports))
+
+    def _empty_features(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "screenshots": {},
+            "accessibility": None,
+            "metadata": {}
         }
 
-        print(f"[UI/UX] Capturing screenshots from: {self.url}")
+    def _url_features(
+        self,
+        screenshots: Dict[str, Screenshot],
+        accessibility: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Assemble the features dict for a captured URL"""
+        features = self._empty_features()
+        features["screenshots"] = screenshots
+        features["accessibility"] = accessibility
+        features["metadata"]["source"] = self.url
+        features["metadata"]["viewports_captured"] = list(screenshots.keys())
+        features["metadata"]["format"] = self.image_format
+        features["metadata"]["capture"] = "above_the_fold"
+        features["metadata"]["fold_height"] = FOLD_HEIGHT
+        return features
+
+    def _run_playwright_session(self) -> Tuple[Dict[str, Screenshot], Optional[Dict[str, Any]]]:
+        """
+        Capture screenshots and run the accessibility audit in one Playwright session.
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
+        Uses a browser from the shared pool (launched once per process), so only
+        browser contexts are created per analysis. Viewports are rendered
+        concurrently, each in its own context, and the accessibility probes run on the
+        desktop page after its screenshot, so the URL is loaded once per viewport
+        rather than once more for the audit.
 
-                for viewport_name, viewport_size in viewports.items():
-                    print(f"[UI/UX] Capturing {viewport_name} view ({viewport_size['width']}x{viewport_size['height']})...")
+        Returns:
+            Tuple of (dict mapping viewport name to Screenshot,
+            accessibility audit results or None if the audit fails)
+        """
+        return browser_pool.run(self._playwright_session())
 
-                    try:
-                        context = browser.new_context(
-                            viewport=viewport_size,
-                            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                        )
-                        page = context.new_page()
+    async def _run_playwright_session_async(self) -> Tuple[Dict[str, Screenshot], Optional[Dict[str, Any]]]:
+        """Awaitable _run_playwright_session() for callers running their own event loop"""
+        return await browser_pool.run_async(self._playwright_session())
 
-                        # Navigate to page
-                        page.goto(self.url, wait_until="networkidle", timeout=30000)
+    async def _playwright_session(self) -> Tuple[Dict[str, Screenshot], Optional[Dict[str, Any]]]:
+        """Run one capture session on the pool loop, returning empty results on failure"""
+        if importlib.util.find_spec("playwright") is None:
+            logger.warning("[!] Playwright not installed. Install with: playwright install chromium")
+            return {}, None
 
-                        # Take screenshot
-                        screenshot_bytes = page.screenshot(full_page=False, type="png")
+        async with browser_pool.session_slot():
+            logger.info("[UI/UX] Capturing screenshots from: %s", self.url)
 
-                        # Encode to base64
-                        screenshot_base64 = base64.b64encode(screenshot_bytes).decode('utf-8')
-                        screenshots[viewport_name] = screenshot_base64
+            try:
+                screenshots, accessibility = await self._capture_all_viewports()
+            except Exception as e:
+                logger.error("[UI/UX] Error during screenshot capture: %s", e)
+                return {}, None
 
-                        context.close()
-                        print(f"[UI/UX] ✓ {viewport_name} screenshot captured")
+        logger.info("[UI/UX] Successfully captured %d screenshots", len(screenshots))
+        return screenshots, accessibility
 
-                    except Exception as e:
-                        print(f"[UI/UX] Error capturing {viewport_name} screenshot: {e}")
-                        continue
+    async def _capture_all_viewports(self) -> Tuple[Dict[str, Screenshot], Optional[Dict[str, Any]]]:
+        """Capture every viewport in parallel on a pooled browser"""
+        browser = await browser_pool.get_browser()
 
-                browser.close()
+        # The audit runs on the first requested viewport's page (desktop by default)
+        audit_viewport = next(iter(self.viewports))
 
-        except Exception as e:
-            print(f"[UI/UX] Error during screenshot capture: {e}")
-            return {}
+        results = await asyncio.gather(*(
+            self._capture_viewport(browser, viewport_name, viewport_size, audit=viewport_name == audit_viewport)
+            for viewport_name, viewport_size in self.viewports.items()
+        ))
 
-        print(f"[UI/UX] Successfully captured {len(screenshots)} screenshots")
-        return screenshots
+        # gather() keeps viewport order; failed captures are left out
+        screenshots = {name: data for name, data, _ in results if data is not None}
+        accessibility = next((audit for _, _, audit in results if audit is not None), None)
+        return screenshots, accessibility
 
-    def _run_accessibility_audit(self) -> Optional[Dict[str, Any]]:
+    async def _capture_viewport(
+        self,
+        browser,
+        viewport_name: str,
+        viewport_size: Dict[str, int],
+        audit: bool = False,
+    ) -> Tuple[str, Optional[Screenshot], Optional[Dict[str, Any]]]:
         """
-        Run accessibility audit using Lighthouse.
+        Capture one viewport in its own browser context.
+
+        Args:
+            browser: Playwright browser shared by all viewports
+            viewport_name: Viewport name (desktop, tablet, mobile)
+            viewport_size: Viewport width and height
+            audit: Also run the accessibility audit on this page
 
         Returns:
-            Accessibility audit results or None if audit fails
+            Tuple of (viewport name, Screenshot or None on failure,
+            accessibility audit results or None)
         """
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
-            print("[UI/UX] Playwright not available for accessibility audit")
-            return None
+        logger.info("[UI/UX] Capturing %s view (%dx%d)...", viewport_name, viewport_size['width'], viewport_size['height'])
 
-        print(f"[UI/UX] Running accessibility audit...")
+        screenshot = None
+        accessibility = None
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
-                page = context.new_page()
+            context = await browser.new_context(viewport=viewport_size, user_agent=USER_AGENT)
+            try:
+                await context.route(BLOCKED_URL_PATTERN, _abort_route)
+                page = await context.new_page()
 
                 # Navigate to page
-                page.goto(self.url, wait_until="networkidle", timeout=30000)
-
-                # Inject axe-core for accessibility testing
-                # For now, we'll do basic accessibility checks via Playwright
-                accessibility_issues = []
-
-                # Check for common accessibility issues
-
-                # 1. Images without alt text
-                images_without_alt = page.evaluate("""() => {
-                    const images = Array.from(document.querySelectorAll('img'));
-                    return images.filter(img => !img.alt || img.alt.trim() === '').length;
-                }""")
-
-                if images_without_alt > 0:
-                    accessibility_issues.append({
-                        "type": "missing_alt_text",
-                        "severity": "serious",
-                        "count": images_without_alt,
-                        "description": f"{images_without_alt} images missing alt text"
-                    })
-
-                # 2. Links without accessible names
-                links_without_text = page.evaluate("""() => {
-                    const links = Array.from(document.querySelectorAll('a'));
-                    return links.filter(link => !link.textContent.trim() && !link.getAttribute('aria-label')).length;
-                }""")
-
-                if links_without_text > 0:
-                    accessibility_issues.append({
-                        "type": "empty_links",
-                        "severity": "serious",
-                        "count": links_without_text,
-                        "description": f"{links_without_text} links without accessible names"
-                    })
-
-                # 3. Form inputs without labels
-                inputs_without_labels = page.evaluate("""() => {
-                    const inputs = Array.from(document.querySelectorAll('input:not([type="hidden"])'));
-                    return inputs.filter(input => {
-                        const id = input.id;
-                        const hasLabel = id && document.querySelector(`label[for="${id}"]`);
-                        const hasAriaLabel = input.getAttribute('aria-label');
-                        return !hasLabel && !hasAriaLabel;
-                    }).length;
-                }""")
-
-                if inputs_without_labels > 0:
-                    accessibility_issues.append({
-                        "type": "unlabeled_inputs",
-                        "severity": "critical",
-                        "count": inputs_without_labels,
-                        "description": f"{inputs_without_labels} form inputs without labels"
-                    })
-
-                # 4. Check for lang attribute
-                has_lang = page.evaluate("""() => {
-                    return document.documentElement.hasAttribute('lang');
-                }""")
-
-                if not has_lang:
-                    accessibility_issues.append({
-                        "type": "missing_lang",
-                        "severity": "serious",
-                        "count": 1,
-                        "description": "HTML element missing lang attribute"
-                    })
-
-                # 5. Check heading hierarchy
-                heading_issues = page.evaluate("""() => {
-                    const headings = Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, h6'));
-                    const levels = headings.map(h => parseInt(h.tagName[1]));
-
-                    let issues = [];
-
-                    // Check for H1
-                    const h1Count = levels.filter(l => l === 1).length;
-                    if (h1Count === 0) issues.push('No H1 heading found');
-                    if (h1Count > 1) issues.push(`Multiple H1 headings (${h1Count})`);
-
-                    // Check for skipped levels
-                    for (let i = 1; i < levels.length; i++) {
-                        if (levels[i] - levels[i-1] > 1) {
-                            issues.push(`Skipped heading level from H${levels[i-1]} to H${levels[i]}`);
-                            break;
-                        }
-                    }
-
-                    return issues;
-                }""")
-
-                for issue in heading_issues:
-                    accessibility_issues.append({
-                        "type": "heading_hierarchy",
-                        "severity": "moderate",
-                        "count": 1,
-                        "description": issue
-                    })
-
-                browser.close()
-
-                # Calculate accessibility score
-                critical_issues = len([i for i in accessibility_issues if i["severity"] == "critical"])
-                serious_issues = len([i for i in accessibility_issues if i["severity"] == "serious"])
-                moderate_issues = len([i for i in accessibility_issues if i["severity"] == "moderate"])
-
-                # Simple scoring: start at 100, deduct points
-                score = 100
-                score -= critical_issues * 15
-                score -= serious_issues * 10
-                score -= moderate_issues * 5
-                score = max(0, score)
-
-                audit_results = {
-                    "score": score,
-                    "issues": accessibility_issues,
-                    "summary": {
-                        "critical": critical_issues,
-                        "serious": serious_issues,
-                        "moderate": moderate_issues,
-                        "total": len(accessibility_issues)
-                    }
+                await self._navigate(page)
+
+                # Take screenshot straight to disk; consumers read it on demand
+                screenshot = await self._take_screenshot(page, viewport_name, viewport_size)
+                logger.info("[UI/UX] ✓ %s screenshot captured", viewport_name)
+
+                if audit:
+                    accessibility = await self._run_accessibility_audit(page)
+            finally:
+                await context.close()
+
+        except Exception as e:
+            logger.error("[UI/UX] Error capturing %s screenshot: %s", viewport_name, e)
+
+        return viewport_name, screenshot, accessibility
+
+    async def _take_screenshot(self, page, viewport_name: str, viewport_size: Dict[str, int]) -> Screenshot:
+        """
+        Save an above-the-fold screenshot in the configured image format.
+
+        Args:
+            page: Playwright page to capture
+            viewport_name: Viewport name used in the file name
+            viewport_size: Viewport width and height
+
+        Returns:
+            Screenshot reference to the saved file
+        """
+        screenshot_path = _new_screenshot_path(viewport_name, self.image_format)
+        clip = {"x": 0, "y": 0, "width": viewport_size["width"], "height": min(viewport_size["height"], FOLD_HEIGHT)}
+
+        if self.image_format == "webp":
+            # Chromium cannot encode webp screenshots; convert the png with Pillow
+            png_bytes = await page.screenshot(full_page=False, clip=clip, type="png")
+            webp_bytes = await asyncio.to_thread(convert_image, png_bytes, "WEBP", IMAGE_QUALITY)
+            screenshot_path.write_bytes(webp_bytes)
+        else:
+            quality = IMAGE_QUALITY if self.image_format == "jpeg" else None
+            await page.screenshot(path=str(screenshot_path), full_page=False, clip=clip, type=self.image_format, quality=quality)
+
+        return Screenshot(path=str(screenshot_path), format=self.image_format)
+
+    async def _navigate(self, page) -> None:
+        """
+        Load the URL without waiting for network idle.
+
+        Ad and analytics beacons can keep a page from ever going idle, so the
+        wait is DOMContentLoaded plus a bounded wait for the load event and a
+        short settle period for late layout shifts.
+
+        Args:
+            page: Playwright page to navigate
+        """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        await page.goto(self.url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
+        try:
+            await page.wait_for_load_state("load", timeout=LOAD_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
+        await page.wait_for_timeout(SETTLE_MS)
+
+    async def _run_accessibility_audit(self, page) -> Optional[Dict[str, Any]]:
+        """
+        Run basic accessibility checks on an already loaded page.
+
+        Args:
+            page: Playwright page the URL was navigated to
+
+        Returns:
+            Accessibility audit results or None if audit fails
+        """
+        logger.info("[UI/UX] Running accessibility audit...")
+
+        try:
+            # Inject axe-core for accessibility testing
+            # For now, we'll do basic accessibility checks via Playwright
+            accessibility_issues = []
+
+            # All checks run in one evaluate() call (a single CDP round trip)
+            probes = await page.evaluate(ACCESSIBILITY_PROBE_SCRIPT)
+
+            # 1. Images without alt text
+            images_without_alt = probes["imagesWithoutAlt"]
+            if images_without_alt > 0:
+                accessibility_issues.append({
+                    "type": "missing_alt_text",
+                    "severity": "serious",
+                    "count": images_without_alt,
+                    "description": f"{images_without_alt} images missing alt text"
+                })
+
+            # 2. Links without accessible names
+            links_without_text = probes["linksWithoutText"]
+            if links_without_text > 0:
+                accessibility_issues.append({
+                    "type": "empty_links",
+                    "severity": "serious",
+                    "count": links_without_text,
+                    "description": f"{links_without_text} links without accessible names"
+                })
+
+            # 3. Form inputs without labels
+            inputs_without_labels = probes["inputsWithoutLabels"]
+            if inputs_without_labels > 0:
+                accessibility_issues.append({
+                    "type": "unlabeled_inputs",
+                    "severity": "critical",
+                    "count": inputs_without_labels,
+                    "description": f"{inputs_without_labels} form inputs without labels"
+                })
+
+            # 4. Check for lang attribute
+            if not probes["hasLang"]:
+                accessibility_issues.append({
+                    "type": "missing_lang",
+                    "severity": "serious",
+                    "count": 1,
+                    "description": "HTML element missing lang attribute"
+                })
+
+            # 5. Check heading hierarchy
+            for issue in probes["headingIssues"]:
+                accessibility_issues.append({
+                    "type": "heading_hierarchy",
+                    "severity": "moderate",
+                    "count": 1,
+                    "description": issue
+                })
+
+            # Calculate accessibility score
+            critical_issues = len([i for i in accessibility_issues if i["severity"] == "critical"])
+            serious_issues = len([i for i in accessibility_issues if i["severity"] == "serious"])
+            moderate_issues = len([i for i in accessibility_issues if i["severity"] == "moderate"])
+
+            # Simple scoring: start at 100, deduct points
+            score = 100
+            score -= critical_issues * 15
+            score -= serious_issues * 10
+            score -= moderate_issues * 5
+            score = max(0, score)
+
+            audit_results = {
+                "score": score,
+                "issues": accessibility_issues,
+                "summary": {
+                    "critical": critical_issues,
+                    "serious": serious_issues,
+                    "moderate": moderate_issues,
+                    "total": len(accessibility_issues)
                 }
+            }
 
-                print(f"[UI/UX] ✓ Accessibility audit complete (Score: {score}/100)")
-                return audit_results
+            logger.info("[UI/UX] ✓ Accessibility audit complete (Score: %s/100)", score)
+            return audit_results
 
         except Exception as e:
-            print(f"[UI/UX] Error during accessibility audit: {e}")
+            logger.error("[UI/UX] Error during accessibility audit: %s", e)
             return None
 
-    def _load_screenshot(self, screenshot_path: str) -> str:
+    def _load_screenshot(self, screenshot_path: str) -> Screenshot:
         """
-        Load and encode a screenshot file to base64.
+        Check a screenshot file and return a reference to it.
+
+        Base64 input (a data URI or a bare base64 string) is passed through
+        without decoding or re-encoding.
 
         Args:
-            screenshot_path: Path to screenshot file
+            screenshot_path: Path to screenshot file, or base64 image data
 
         Returns:
-            Base64 encoded image string
+            Screenshot reference (the file is read when the image is needed)
         """
+        inline = _inline_screenshot(screenshot_path)
+        if inline is not None:
+            logger.info("[UI/UX] ✓ Loaded inline %s screenshot (%d bytes)", inline.format, inline.size)
+            return inline
+
         try:
             path = Path(screenshot_path)
             if not path.exists():
                 raise FileNotFoundError(f"Screenshot not found: {screenshot_path}")
 
-            with open(path, "rb") as f:
-                image_bytes = f.read()
-
-            screenshot_base64 = base64.b64encode(image_bytes).decode('utf-8')
-            print(f"[UI/UX] ✓ Loaded screenshot: {screenshot_path}")
-            return screenshot_base64
+            image_format = IMAGE_FORMATS.get(path.suffix.lower(), "png")
+            screenshot = Screenshot(path=str(path.resolve()), format=image_format)
+            logger.info("[UI/UX] ✓ Loaded screenshot: %s", screenshot_path)
+            return screenshot
 
         except Exception as e:
-            print(f"[UI/UX] Error loading screenshot {screenshot_path}: {e}")
+            logger.error("[UI/UX] Error loading screenshot %s: %s", screenshot_path, e)
             raise
 
-    def _load_screenshots(self, screenshots_dict: Dict[str, str]) -> Dict[str, str]:
+    def _load_screenshots(self, screenshots_dict: Dict[str, str]) -> Dict[str, Screenshot]:
         """
         Load multiple screenshots from paths.
 
@@ -339,25 +699,25 @@ class UIUXExtractor:
             screenshots_dict: Dict mapping viewport name to file path
 
         Returns:
-            Dict mapping viewport name to base64 encoded image
+            Dict mapping viewport name to Screenshot reference
         """
         loaded_screenshots = {}
 
         for viewport_name, screenshot_path in screenshots_dict.items():
             try:
-                screenshot_base64 = self._load_screenshot(screenshot_path)
-                loaded_screenshots[viewport_name] = screenshot_base64
+                loaded_screenshots[viewport_name] = self._load_screenshot(screenshot_path)
             except Exception as e:
-                print(f"[UI/UX] Skipping {viewport_name}: {e}")
+                logger.warning("[UI/UX] Skipping %s: %s", viewport_name, e)
                 continue
 
         return loaded_screenshots
 
-
 def analyze_uiux(
     url: Optional[str] = None,
     screenshot: Optional[str] = None,
-    screenshots: Optional[Dict[str, str]] = None
+    screenshots: Optional[Dict[str, str]] = None,
+    image_format: Literal["png", "jpeg", "webp"] = "jpeg",
+    viewports: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     Convenience function to extract UI/UX features.
@@ -366,6 +726,9 @@ def analyze_uiux(
         url: Website URL to analyze
         screenshot: Path to single screenshot
         screenshots: Dict of viewport names to screenshot paths
+        image_format: Format for captured screenshots (png, jpeg or webp)
+        viewports: Viewports to capture for a URL; defaults to desktop and
+                   mobile, add "tablet" to capture it too
 
     Returns:
         UI/UX features dictionary
@@ -374,6 +737,9 @@ def analyze_uiux(
         >>> # Analyze URL
         >>> features = analyze_uiux(url="https://example.com")
 
+        >>> # Analyze URL including the tablet viewport
+        >>> features = analyze_uiux(url="https://example.com", viewports=["desktop", "tablet", "mobile"])
+
         >>> # Analyze single screenshot
         >>> features = analyze_uiux(screenshot="screenshot.png")
 
@@ -383,5 +749,36 @@ def analyze_uiux(
         ...     "mobile": "mobile.png"
         ... })
     """
-    extractor = UIUXExtractor(url=url, screenshot=screenshot, screenshots=screenshots)
+    extractor = UIUXExtractor(url=url, screenshot=screenshot, screenshots=screenshots,
+                              image_format=image_format, viewports=viewports)
     return extractor.extract()
+
+
+async def analyze_uiux_async(
+    url: Optional[str] = None,
+    screenshot: Optional[str] = None,
+    screenshots: Optional[Dict[str, str]] = None,
+    image_format: Literal["png", "jpeg", "webp"] = "jpeg",
+    viewports: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Async version of analyze_uiux() for running many extractions concurrently.
+
+    Args:
+        url: Website URL to analyze
+        screenshot: Path to single screenshot
+        screenshots: Dict of viewport names to screenshot paths
+        image_format: Format for captured screenshots (png, jpeg or webp)
+        viewports: Viewports to capture for a URL; defaults to desktop and
+                   mobile, add "tablet" to capture it too
+
+    Returns:
+        UI/UX features dictionary
+
+    Examples:
+        >>> urls = ["https://example.com", "https://example.org"]
+        >>> results = await asyncio.gather(*(analyze_uiux_async(url=u) for u in urls))
+    """
+    extractor = UIUXExtractor(url=url, screenshot=screenshot, screenshots=screenshots,
+                              image_format=image_format, viewports=viewports)
+    return await extractor.extract_async()
@@ -3,19 +3,180 @@ Unified Website Analysis Workflow
 Combines SEO and Performance analysis with conditional execution based on input type.
 """
 
-from agno.workflow import Workflow, Step, StepInput, StepOutput, Condition
+from agno.workflow import Workflow, Step, StepInput, StepOutput, Condition, Parallel
 from agno.media import Image
+from agno.run.agent import RunContentEvent
+from config import Config
 from src.extractors.html_extractor import HtmlContentExtractor
 from src.extractors.performance_extractor import analyze_performance
-from src.extractors.uiux_extractor import UIUXExtractor
-from src.agents.classifier_agent import input_classifier
-from src.agents.seo_agent import seo_analyst
-from src.agents.performance_agent import performance_analyst
-from src.agents.uiux_agent import uiux_analyst
-from src.agents.summary_agent import summary_analyst
-from typing import Dict, Any, Union
-import base64
+from src.extractors.uiux_extractor import Screenshot, UIUXExtractor
+from src.agents.classifier_agent import get_input_classifier
+from src.agents.fast_classifier import classify_fast, fingerprint_base64
+from src.agents._category import cache_classification, get_cached_classification
+from src.agents.seo_agent import get_seo_analyst
+from src.agents.performance_agent import get_performance_analyst
+from src.agents.uiux_agent import get_uiux_analyst
+from src.agents.summary_agent import get_summary_analyst
+from src.agents._batch import batch_request, run_batch
+from src.agents._cache import MemoryCacheBackend
+from typing import Dict, Any, AsyncIterator, Iterator, List, NamedTuple, Optional, Tuple, Union
+import asyncio
+import enum
+import functools
+import hashlib
 import json
+import logging
+import orjson
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import PurePath
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Threads used to read and downscale screenshots for one vision request
+MAX_IMAGE_LOAD_WORKERS = 8
+
+# Threads extracting SEO/Performance features in analyze_batch (bounds concurrent fetches)
+MAX_BATCH_EXTRACTION_WORKERS = 8
+
+# String inputs starting with one of these are treated as URLs
+URL_PREFIXES = ('http://', 'https://')
+
+
+class ParsedInput(NamedTuple):
+    """Workflow input split into the fields the analysis steps read"""
+    url: Optional[str] = None
+    html: Optional[str] = None
+    screenshot: Optional[str] = None
+    screenshots: Optional[Dict[str, str]] = None
+    viewports: Optional[List[str]] = None
+
+
+@functools.singledispatch
+def parse_input(input_data: Any) -> ParsedInput:
+    """
+    Split raw workflow input into URL, HTML and screenshot fields.
+
+    Dispatches on the input type; new input types are added with
+    @parse_input.register instead of more type checks.
+
+    Args:
+        input_data: URL or HTML string, dict with url/html/screenshot(s)/viewports
+                    keys, or path to a screenshot file
+
+    Returns:
+        ParsedInput; a string is the url when it starts with http(s), otherwise the html
+    """
+    return ParsedInput()
+
+
+@parse_input.register
+def _(input_data: str) -> ParsedInput:
+    if input_data.startswith(URL_PREFIXES):
+        return ParsedInput(url=input_data)
+    return ParsedInput(html=input_data)
+
+
+@parse_input.register
+def _(input_data: dict) -> ParsedInput:
+    return ParsedInput(
+        url=input_data.get("url"),
+        html=input_data.get("html"),
+        screenshot=input_data.get("screenshot"),
+        screenshots=input_data.get("screenshots"),
+        viewports=input_data.get("viewports"),
+    )
+
+
+@parse_input.register
+def _(input_data: PurePath) -> ParsedInput:
+    return ParsedInput(screenshot=os.fspath(input_data))
+
+
+@functools.singledispatch
+def normalize_input(input_data: Any) -> Any:
+    """
+    Convert caller input to the str or dict form the workflow accepts.
+
+    Args:
+        input_data: Any input accepted by analyze()
+
+    Returns:
+        Strings and dicts unchanged, UTF-8 bytes decoded to str, and a
+        screenshot path wrapped as {"screenshot": path}
+    """
+    return input_data
+
+
+@normalize_input.register
+def _(input_data: bytes) -> str:
+    # Raw file contents: decode once in bulk
+    return input_data.decode("utf-8")
+
+
+@normalize_input.register
+def _(input_data: PurePath) -> Dict[str, str]:
+    return {"screenshot": os.fspath(input_data)}
+
+
+class InputKind(enum.IntFlag):
+    """Analysis sources found in workflow input"""
+    NONE = 0
+    URL = 1  # http(s) URL: SEO + Performance + UI/UX
+    HTML = 2  # HTML or a non-http url value: SEO only
+    SCREENSHOT = 4  # screenshot(s): UI/UX
+
+
+def input_kind(input_data: Any) -> InputKind:
+    """
+    Classify workflow input in one pass.
+
+    Args:
+        input_data: Raw input data (string or dict)
+
+    Returns:
+        InputKind flags; URL and HTML are exclusive, SCREENSHOT combines with either
+    """
+    parsed = parse_input(input_data)
+    kind = InputKind.NONE
+    if isinstance(parsed.url, str) and parsed.url.startswith(URL_PREFIXES):
+        kind |= InputKind.URL
+    elif parsed.url is not None or parsed.html is not None:
+        kind |= InputKind.HTML
+    if parsed.screenshot is not None or parsed.screenshots is not None:
+        kind |= InputKind.SCREENSHOT
+    return kind
+
+
+def require_input_kind(input_data: Any) -> InputKind:
+    """
+    Classify workflow input and reject inputs no analysis branch can use.
+
+    Args:
+        input_data: Normalized workflow input (string or dict)
+
+    Returns:
+        InputKind flags of the input (never InputKind.NONE)
+
+    Raises:
+        ValueError: If the input has no URL, HTML or screenshot, or is an
+                    http(s) URL without a host
+    """
+    kind = input_kind(input_data)
+    if kind == InputKind.NONE:
+        raise ValueError(
+            "analyze() expects a URL string, HTML string, or dict with "
+            f"'url'/'html'/'screenshot(s)'; got {type(input_data).__name__}"
+        )
+    if kind & InputKind.URL:
+        url = parse_input(input_data).url
+        if not urlparse(url).netloc:
+            raise ValueError(f"Invalid URL (no host): {url!r}")
+    return kind
 
 
 def extract_seo_features_step(step_input: StepInput) -> StepOutput:
@@ -28,28 +189,17 @@ def extract_seo_features_step(step_input: StepInput) -> StepOutput:
     Returns:
         StepOutput with formatted SEO features
     """
-    input_data = step_input.input
-
     # Parse input - can be string or dict
-    if isinstance(input_data, dict):
-        url = input_data.get("url")
-        html = input_data.get("html")
-    else:
-        # String input - determine if URL or HTML
-        if isinstance(input_data, str) and (input_data.startswith('http://') or input_data.startswith('https://')):
-            url = input_data
-            html = None
-        else:
-            url = None
-            html = input_data
+    parsed = parse_input(step_input.input)
+    url, html = parsed.url, parsed.html
 
     # Determine source type for display
     if url:
-        print(f"\n[SEO Feature Extraction] Analyzing URL: {url}")
+        logger.info("[SEO Feature Extraction] Analyzing URL: %s", url)
         source_type = "URL"
         source_value = url
     else:
-        print(f"\n[SEO Feature Extraction] Analyzing raw HTML content")
+        logger.info("[SEO Feature Extraction] Analyzing raw HTML content")
         source_type = "Raw HTML"
         source_value = "HTML Document"
 
@@ -65,12 +215,12 @@ def extract_seo_features_step(step_input: StepInput) -> StepOutput:
         # Format features for agent
         formatted_features = format_seo_features(features, source_type, source_value)
 
-        print("[SEO Feature Extraction] Complete\n")
+        logger.info("[SEO Feature Extraction] Complete")
         return StepOutput(content=formatted_features)
 
     except Exception as e:
         error_message = f"[SEO] Error extracting features: {str(e)}"
-        print(error_message)
+        logger.error(error_message)
         return StepOutput(content=error_message)
 
 
@@ -86,21 +236,16 @@ def extract_performance_features_step(step_input: StepInput) -> StepOutput:
     Returns:
         StepOutput with formatted performance features
     """
-    input_data = step_input.input
-
     # Parse input
-    if isinstance(input_data, dict):
-        url = input_data.get("url")
-    else:
-        url = input_data if isinstance(input_data, str) and (input_data.startswith('http://') or input_data.startswith('https://')) else None
+    url = parse_input(step_input.input).url
 
     if not url:
         error_message = "[PERFORMANCE] Error: Performance analysis requires a valid URL"
-        print(error_message)
+        logger.error(error_message)
         return StepOutput(content=error_message)
 
-    print(f"\n[Performance Feature Extraction] Analyzing URL: {url}")
-    print("[Performance Feature Extraction] This may take 10-30 seconds...")
+    logger.info("[Performance Feature Extraction] Analyzing URL: %s", url)
+    logger.info("[Performance Feature Extraction] This may take 10-30 seconds...")
 
     try:
         # Run comprehensive performance analysis
@@ -109,12 +254,12 @@ def extract_performance_features_step(step_input: StepInput) -> StepOutput:
         # Format features for agent
         formatted_features = format_performance_features(features, url)
 
-        print("[Performance Feature Extraction] Complete\n")
+        logger.info("[Performance Feature Extraction] Complete")
         return StepOutput(content=formatted_features)
 
     except Exception as e:
         error_message = f"[PERFORMANCE] Error extracting features: {str(e)}"
-        print(error_message)
+        logger.error(error_message)
         return StepOutput(content=error_message)
 
 
@@ -128,147 +273,247 @@ def extract_uiux_features_step(step_input: StepInput) -> StepOutput:
     Returns:
         StepOutput with formatted UI/UX features including screenshots and accessibility data
     """
-    input_data = step_input.input
-
     # Parse input to determine mode
-    url = None
-    screenshot = None
-    screenshots = None
-
-    if isinstance(input_data, dict):
-        url = input_data.get("url")
-        screenshot = input_data.get("screenshot")
-        screenshots = input_data.get("screenshots")
-    elif isinstance(input_data, str) and (input_data.startswith('http://') or input_data.startswith('https://')):
-        url = input_data
+    parsed = parse_input(step_input.input)
+    url, screenshot, screenshots, viewports = parsed.url, parsed.screenshot, parsed.screenshots, parsed.viewports
 
     # Determine extraction mode
     if url:
-        print(f"\n[UI/UX Feature Extraction] Analyzing URL: {url}")
-        print("[UI/UX Feature Extraction] Capturing screenshots and running accessibility audit...")
+        logger.info("[UI/UX Feature Extraction] Analyzing URL: %s", url)
+        logger.info("[UI/UX Feature Extraction] Capturing screenshots and running accessibility audit...")
     elif screenshots:
-        print(f"\n[UI/UX Feature Extraction] Analyzing provided screenshots: {list(screenshots.keys())}")
+        logger.info("[UI/UX Feature Extraction] Analyzing provided screenshots: %s", list(screenshots))
     elif screenshot:
-        print(f"\n[UI/UX Feature Extraction] Analyzing provided screenshot: {screenshot}")
+        # Inline base64 screenshots are far too long to echo
+        label = screenshot if len(screenshot) < 256 else f"<inline image data, {len(screenshot)} chars>"
+        logger.info("[UI/UX Feature Extraction] Analyzing provided screenshot: %s", label)
     else:
         error_message = "[UI/UX] Error: No valid input for UI/UX analysis"
-        print(error_message)
+        logger.error(error_message)
         return StepOutput(content=error_message)
 
     try:
         # Run UI/UX extractor
-        extractor = UIUXExtractor(url=url, screenshot=screenshot, screenshots=screenshots)
+        extractor = UIUXExtractor(url=url, screenshot=screenshot, screenshots=screenshots, viewports=viewports)
         features = extractor.extract()
 
-        print("[UI/UX Feature Extraction] Complete\n")
+        logger.info("[UI/UX Feature Extraction] Complete")
 
         # Return features as JSON string (will be parsed in analysis step)
-        return StepOutput(content=json.dumps(features))
+        return StepOutput(content=dump_uiux_features(features))
 
     except Exception as e:
         error_message = f"[UI/UX] Error extracting features: {str(e)}"
-        print(error_message)
+        logger.error(error_message)
         return StepOutput(content=error_message)
 
 
-def analyze_uiux_with_vision_step(step_input: StepInput) -> StepOutput:
-    """
-    Analyze UI/UX features with vision model by passing screenshots as images.
+def dump_uiux_features(features: Dict[str, Any]) -> str:
+    """Serialize UI/UX features for the hand-off to the vision step"""
+    return orjson.dumps(features).decode("utf-8")
 
-    Args:
-        step_input: StepInput containing JSON-encoded features from extraction step
 
-    Returns:
-        StepOutput with UI/UX analysis from vision agent
-    """
-    try:
-        # Get the content from the previous step (UI/UX Feature Extraction)
-        previous_content = step_input.previous_step_content
+def load_uiux_features(content: str) -> Dict[str, Any]:
+    """Parse features produced by dump_uiux_features (raises json.JSONDecodeError)"""
+    return orjson.loads(content)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
 
-        # Debug: check what we received
-        if not previous_content or previous_content == "":
-            raise ValueError("No content received from UI/UX Feature Extraction step")
-
-        # Parse JSON string from previous step
-        features = json.loads(previous_content)
 
-        # Prepare text context for the agent
-        mode = features.get('mode', 'unknown')
-        metadata = features.get('metadata', {})
-        accessibility = features.get('accessibility')
-
-        # Build context text
-        context = f"""
+# Section headers shared by the UI/UX vision prompt and format_uiux_features()
+UIUX_REQUEST_HEADER = """
 === UI/UX ANALYSIS REQUEST ===
 
-Analysis Mode: {mode.upper()}
-Source: {metadata.get('source', 'N/A')}
+Analysis Mode: {mode}
+Source: {source}
 """
 
-        if mode == 'url':
-            context += f"Viewports Captured: {', '.join(metadata.get('viewports_captured', []))}\n"
-        elif mode == 'screenshots':
-            context += f"Viewports Provided: {', '.join(metadata.get('viewports', []))}\n"
-        elif mode == 'screenshot':
-            context += f"Viewport: {metadata.get('viewport', 'default')}\n"
-
-        # Add accessibility data if available
-        if accessibility:
-            score = accessibility.get('score', 'N/A')
-            summary = accessibility.get('summary', {})
-            issues = accessibility.get('issues', [])
-
-            context += f"""
+ACCESSIBILITY_AUDIT_SECTION = """
 === ACCESSIBILITY AUDIT RESULTS ===
 
 Overall Accessibility Score: {score}/100
 
 Issue Summary:
-  Critical Issues: {summary.get('critical', 0)}
-  Serious Issues: {summary.get('serious', 0)}
-  Moderate Issues: {summary.get('moderate', 0)}
-  Total Issues: {summary.get('total', 0)}
+  Critical Issues: {critical}
+  Serious Issues: {serious}
+  Moderate Issues: {moderate}
+  Total Issues: {total}
 
 """
-            if issues:
-                context += "Detailed Issues:\n"
-                for issue in issues:
-                    context += f"  [{issue.get('severity', 'unknown').upper()}] {issue.get('description', 'No description')}\n"
-                context += "\n"
 
-        context += """
+
+def _accessibility_audit_section(accessibility: Dict[str, Any]) -> str:
+    """Render the accessibility audit summary and detailed issues"""
+    summary = accessibility.get('summary', {})
+    section = ACCESSIBILITY_AUDIT_SECTION.format(
+        score=accessibility.get('score', 'N/A'),
+        critical=summary.get('critical', 0),
+        serious=summary.get('serious', 0),
+        moderate=summary.get('moderate', 0),
+        total=summary.get('total', 0),
+    )
+
+    issues = accessibility.get('issues', [])
+    if not issues:
+        return section
+
+    parts = [section, "Detailed Issues:\n"]
+    for issue in issues:
+        parts.append(f"  [{issue.get('severity', 'unknown').upper()}] {issue.get('description', 'No description')}\n")
+    parts.append("\n")
+    return "".join(parts)
+
+
+def build_uiux_request(features: Dict[str, Any]) -> Tuple[str, List[Image]]:
+    """
+    Build the vision agent prompt and images from extracted UI/UX features.
+
+    Args:
+        features: Decoded output of UIUXExtractor.extract()
+
+    Returns:
+        Tuple of (text context, screenshot Image objects)
+    """
+    # Prepare text context for the agent
+    mode = features.get('mode', 'unknown')
+    metadata = features.get('metadata', {})
+    accessibility = features.get('accessibility')
+
+    # Build context text (sections are collected and joined once)
+    parts = [UIUX_REQUEST_HEADER.format(mode=mode.upper(), source=metadata.get('source', 'N/A'))]
+
+    if mode == 'url':
+        parts.append(f"Viewports Captured: {', '.join(metadata.get('viewports_captured', []))}\n")
+        if metadata.get('capture') == 'above_the_fold':
+            parts.append(f"Capture: above the fold (first {metadata.get('fold_height')}px of each viewport)\n")
+    elif mode == 'screenshots':
+        parts.append(f"Viewports Provided: {', '.join(metadata.get('viewports', []))}\n")
+    elif mode == 'screenshot':
+        parts.append(f"Viewport: {metadata.get('viewport', 'default')}\n")
+    if len(features.get('screenshots', {})) > 1:
+        parts.append(f"Image Detail: first screenshot {Config.UIUX_PRIMARY_IMAGE_DETAIL}, other viewports {Config.UIUX_EXTRA_IMAGE_DETAIL}\n")
+
+    # Add accessibility data if available
+    if accessibility:
+        parts.append(_accessibility_audit_section(accessibility))
+
+    parts.append("""
 Please analyze the provided screenshots and accessibility data to provide a comprehensive UI/UX evaluation.
 Focus on visual design, user experience, accessibility compliance, and responsive design quality.
-"""
+""")
+    context = "".join(parts)
 
-        # Convert base64 screenshots to Image objects
-        screenshots = features.get('screenshots', {})
-        image_objects = []
+    # Convert screenshot references to Image objects; only the first one is sent at full detail
+    screenshots = list(features.get('screenshots', {}).values())
+    details = [Config.UIUX_PRIMARY_IMAGE_DETAIL] + [Config.UIUX_EXTRA_IMAGE_DETAIL] * (len(screenshots) - 1)
+    if len(screenshots) <= 1:
+        return context, [_screenshot_image(entry, detail) for entry, detail in zip(screenshots, details)]
 
-        for viewport_name, screenshot_base64 in screenshots.items():
-            # Decode base64 to bytes
-            image_bytes = base64.b64decode(screenshot_base64)
-            # Create Image object
-            image_objects.append(Image(content=image_bytes, format="png"))
+    # Files are read (and downscaled) only now; Pillow and file I/O release the GIL
+    with ThreadPoolExecutor(max_workers=min(MAX_IMAGE_LOAD_WORKERS, len(screenshots))) as pool:
+        image_objects = list(pool.map(_screenshot_image, screenshots, details))
 
-        print(f"\n[UI/UX Analysis with Vision] Analyzing {len(image_objects)} screenshots with vision model...\n")
+    return context, image_objects
 
-        # Call agent with images and display the response
-        uiux_analyst.print_response(
-            input=context,
-            images=image_objects,
-            markdown=True,
-            stream=True
-        )
 
-        print("\n[UI/UX Analysis with Vision] Complete\n")
-        return StepOutput(content="UI/UX analysis completed (displayed above)")
+def _screenshot_image(entry: Dict[str, Any], detail: Optional[str] = None) -> Image:
+    """Read a screenshot reference into an agno Image (detail: low/high/auto)"""
+    screenshot = Screenshot(entry)
+    return Image(content=screenshot.as_bytes(), format=screenshot.format, detail=detail)
+
+
+async def analyze_screenshots_async(context: str, viewports: Dict[str, Image]) -> str:
+    """
+    Analyze each viewport screenshot with its own concurrent vision call.
+
+    Every call shares a byte-identical prefix (system instructions + context)
+    and only appends the viewport name at the end, so OpenAI's automatic
+    prompt caching can reuse the prefix. The first viewport runs alone to warm
+    that cache; the remaining viewports then run concurrently.
+
+    Args:
+        context: UI/UX request text built by build_uiux_request()
+        viewports: Mapping of viewport name (desktop/tablet/mobile) to screenshot
+
+    Returns:
+        Per-viewport analyses combined into one markdown report
+    """
+    agent = get_uiux_analyst()
+
+    async def analyze_viewport(name: str, image: Image) -> Any:
+        return await agent.arun(input=f"{context}\nViewport under review: {name}\n", images=[image], stream=False)
+
+    items = list(viewports.items())
+    first = await asyncio.gather(analyze_viewport(*items[0]), return_exceptions=True)
+    rest = await asyncio.gather(*(analyze_viewport(name, image) for name, image in items[1:]), return_exceptions=True)
+    responses = first + rest
+
+    sections = []
+    cached_tokens = input_tokens = 0
+    for name, response in zip(viewports, responses):
+        if isinstance(response, Exception):
+            content = f"[UI/UX] Error analyzing {name} screenshot: {str(response)}"
+        else:
+            content = response.content
+            metrics = getattr(response, "metrics", None)
+            cached_tokens += getattr(metrics, "cache_read_tokens", 0) or 0
+            input_tokens += getattr(metrics, "input_tokens", 0) or 0
+        sections.append(f"## {name.capitalize()} Viewport\n\n{content}")
+
+    if input_tokens:
+        logger.info("[UI/UX Analysis with Vision] Prompt cache: %d/%d input tokens reused", cached_tokens, input_tokens)
+    return "\n\n".join(sections)
+
+
+def _run_coroutine(coroutine: Any) -> Any:
+    """Run a coroutine from sync code, including steps executed inside a running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
+def analyze_uiux_with_vision_step(step_input: StepInput) -> StepOutput:
+    """
+    Analyze UI/UX features with vision model by passing screenshots as images.
+
+    Args:
+        step_input: StepInput containing JSON-encoded features from extraction step
+
+    Returns:
+        StepOutput with UI/UX analysis from vision agent
+    """
+    try:
+        # Get the content from the previous step (UI/UX Feature Extraction)
+        previous_content = step_input.previous_step_content
+
+        # Debug: check what we received
+        if not previous_content or previous_content == "":
+            raise ValueError("No content received from UI/UX Feature Extraction step")
+
+        # Parse JSON string from previous step
+        features = load_uiux_features(previous_content)
+        context, image_objects = build_uiux_request(features)
+
+        logger.info("[UI/UX Analysis with Vision] Analyzing %d screenshots with vision model...", len(image_objects))
+
+        # Multiple viewports: one vision call per screenshot, run concurrently
+        if len(image_objects) > 1:
+            viewports = dict(zip(features.get('screenshots', {}).keys(), image_objects))
+            analysis = _run_coroutine(analyze_screenshots_async(context, viewports))
+            logger.info("[UI/UX Analysis with Vision] Complete")
+            return StepOutput(content=analysis)
+
+        # Non-streaming, so a repeated screenshot is served from the LLM response cache
+        response = get_uiux_analyst().run(input=context, images=image_objects, stream=False)
+
+        logger.info("[UI/UX Analysis with Vision] Complete")
+        return StepOutput(content=response.content)
 
     except Exception as e:
         error_message = f"[UI/UX] Error during vision analysis: {str(e)}"
-        print(error_message)
-        import traceback
-        traceback.print_exc()
+        logger.exception(error_message)  # Stack is formatted only if a handler emits the record
         return StepOutput(content=error_message)
 
 
@@ -286,33 +531,48 @@ def classify_input_step(step_input: StepInput) -> StepOutput:
         # Get the raw input
         user_input = step_input.input
 
+        # Obvious inputs (plain URL, HTML document, image path, structured dict) skip the LLM
+        classification = classify_fast(user_input)
+        if classification is not None:
+            logger.info("[Input Classification] Detected %s input (rule-based)", classification['type'])
+            return StepOutput(content=json.dumps(classification))
+
         # Convert to string if needed
         if isinstance(user_input, dict):
             input_str = json.dumps(user_input)
         else:
             input_str = str(user_input)
 
-        print(f"\n[Input Classification] Analyzing input type...")
+        # Similar payloads (same category) reuse an earlier classifier decision
+        cached = get_cached_classification(input_str)
+        if cached is not None:
+            logger.info("[Input Classification] Detected %s input (cached category)", cached['type'])
+            return StepOutput(content=json.dumps(cached))
+
+        logger.info("[Input Classification] Analyzing input type...")
 
-        # Call the classifier agent
-        response = input_classifier.run(
-            input=f"Classify this input:\n\n{input_str}",
+        # Call the classifier agent (inline image data is sent as a short fingerprint)
+        response = get_input_classifier().run(
+            input=f"Classify this input:\n\n{fingerprint_base64(input_str)}",
             stream=False
         )
 
         # The agent returns JSON classification
         classification = response.content
 
-        print(f"[Input Classification] Complete\n")
+        try:
+            cache_classification(input_str, json.loads(classification))
+        except (TypeError, ValueError):
+            pass  # Non-JSON answers are passed through but not category-cached
+
+        logger.info("[Input Classification] Complete")
 
         # Return the classification result
         return StepOutput(content=classification)
 
     except Exception as e:
         error_message = f"[Classifier] Error during classification: {str(e)}"
-        print(error_message)
-        import traceback
-        traceback.print_exc()
+        logger.exception(error_message)
 
         # Return a default classification
         default = json.dumps({
@@ -324,24 +584,6 @@ def classify_input_step(step_input: StepInput) -> StepOutput:
         return StepOutput(content=default)
 
 
-def _check_is_url(input_data: Any) -> bool:
-    """
-    Helper function to check if input contains a URL.
-
-    Args:
-        input_data: Raw input data (string or dict)
-
-    Returns:
-        True if input contains a valid URL, False otherwise
-    """
-    if isinstance(input_data, dict):
-        url = input_data.get("url")
-        return url is not None and isinstance(url, str) and (url.startswith('http://') or url.startswith('https://'))
-    elif isinstance(input_data, str):
-        return input_data.startswith('http://') or input_data.startswith('https://')
-    return False
-
-
 def is_url_input(step_input: StepInput, session_state: Any = None) -> bool:
     """
     Condition evaluator for Agno workflow to check if input contains a URL.
@@ -355,24 +597,7 @@ def is_url_input(step_input: StepInput, session_state: Any = None) -> bool:
     Returns:
         True if input contains a valid URL, False otherwise
     """
-    return _check_is_url(step_input.input)
-
-
-def _check_has_url_or_html(input_data: Any) -> bool:
-    """
-    Helper function to check if input contains URL or HTML.
-
-    Args:
-        input_data: Raw input data (string or dict)
-
-    Returns:
-        True if input contains URL or HTML, False otherwise
-    """
-    if isinstance(input_data, dict):
-        return "url" in input_data or "html" in input_data
-    elif isinstance(input_data, str):
-        return True  # String is either URL or HTML
-    return False
+    return bool(input_kind(step_input.input) & InputKind.URL)
 
 
 def has_url_or_html(step_input: StepInput, session_state: Any = None) -> bool:
@@ -386,22 +611,7 @@ def has_url_or_html(step_input: StepInput, session_state: Any = None) -> bool:
     Returns:
         True if input contains URL or HTML, False otherwise
     """
-    return _check_has_url_or_html(step_input.input)
-
-
-def _check_has_screenshot(input_data: Any) -> bool:
-    """
-    Helper function to check if input contains screenshot(s).
-
-    Args:
-        input_data: Raw input data (string or dict)
-
-    Returns:
-        True if input contains screenshot or screenshots, False otherwise
-    """
-    if isinstance(input_data, dict):
-        return "screenshot" in input_data or "screenshots" in input_data
-    return False
+    return bool(input_kind(step_input.input) & (InputKind.URL | InputKind.HTML))
 
 
 def has_screenshot(step_input: StepInput, session_state: Any = None) -> bool:
@@ -415,7 +625,7 @@ def has_screenshot(step_input: StepInput, session_state: Any = None) -> bool:
     Returns:
         True if input contains screenshot(s), False otherwise
     """
-    return _check_has_screenshot(step_input.input)
+    return bool(input_kind(step_input.input) & InputKind.SCREENSHOT)
 
 
 def needs_uiux_analysis(step_input: StepInput, session_state: Any = None) -> bool:
@@ -433,121 +643,192 @@ def needs_uiux_analysis(step_input: StepInput, session_state: Any = None) -> boo
     Returns:
         True if UI/UX analysis should run, False otherwise
     """
-    return _check_is_url(step_input.input) or _check_has_screenshot(step_input.input)
-
-
-def format_seo_features(features: Dict[str, Any], source_type: str, source_value: str) -> str:
-    """Format SEO features into structured string for agent analysis"""
-
-    def format_list(items, max_items=5):
-        if not items:
-            return 'None'
-        if len(items) <= max_items:
-            return ', '.join(str(item) for item in items)
-        return ', '.join(str(item) for item in items[:max_items]) + f' (+ {len(items) - max_items} more)'
-
-    h1_display = format_list(features.get('h1_texts', []), max_items=3)
-    h2_display = format_list(features.get('h2_texts', []), max_items=5)
-    json_ld_display = format_list(features.get('json_ld_types', []))
-
-    top_keywords = features.get('top_keywords', [])
-    if top_keywords:
-        keyword_display = ', '.join([
-            f"{kw['keyword']}({kw['density']}%)" for kw in top_keywords[:5]
-        ])
-    else:
-        keyword_display = 'None analyzed'
+    return bool(input_kind(step_input.input) & (InputKind.URL | InputKind.SCREENSHOT))
 
-    page_text = features.get('text', '')
-    preview_text = page_text[:500] if page_text else 'No text content found'
 
-    formatted = f"""SEO FEATURES EXTRACTED FROM {source_type}: {source_value}
+# Prompt layout for format_seo_features(); placeholders are feature keys
+SEO_FEATURES_TEMPLATE = """SEO FEATURES EXTRACTED FROM {source_type}: {source_value}
 
 === URL STRUCTURE ===
-URL Length: {features.get('url_length', 0)} characters
-URL Readability: {features.get('url_readability', 'N/A')}
-URL Depth: {features.get('url_depth', 0)} levels
-Uses HTTPS: {features.get('url_uses_https', False)}
-Contains Keywords: {features.get('url_has_keywords', False)}
+URL Length: {url_length} characters
+URL Readability: {url_readability}
+URL Depth: {url_depth} levels
+Uses HTTPS: {url_uses_https}
+Contains Keywords: {url_has_keywords}
 
 === META TAGS ===
-Title: {features.get('title', 'N/A')} ({features.get('title_length', 0)} chars)
-Meta Description: {features.get('meta_description', 'N/A')} ({features.get('meta_description_length', 0)} chars)
-Meta Robots: {features.get('meta_robots', 'N/A')}
-Canonical URL: {features.get('canonical_url', 'N/A')}
+Title: {title} ({title_length} chars)
+Meta Description: {meta_description} ({meta_description_length} chars)
+Meta Robots: {meta_robots}
+Canonical URL: {canonical_url}
 
 === HEADING STRUCTURE ===
-H1 Count: {features.get('h1_count', 0)}
+H1 Count: {h1_count}
 H1 Texts: {h1_display}
-H2 Count: {features.get('h2_count', 0)}
+H2 Count: {h2_count}
 H2 Texts: {h2_display}
-H3 Count: {features.get('h3_count', 0)}
-H4 Count: {features.get('h4_count', 0)}
-H5 Count: {features.get('h5_count', 0)}
-H6 Count: {features.get('h6_count', 0)}
+H3 Count: {h3_count}
+H4 Count: {h4_count}
+H5 Count: {h5_count}
+H6 Count: {h6_count}
 
 === CONTENT METRICS ===
-Word Count: {features.get('word_count', 0)}
-Paragraph Count: {features.get('paragraph_count', 0)}
-Average Paragraph Length: {features.get('average_paragraph_length', 0)} words
-Text-to-HTML Ratio: {features.get('text_html_ratio', 0)}%
-Readability Score: {features.get('readability_score', 'N/A')}
-Content Depth Score: {features.get('content_depth_score', 0)}/100
+Word Count: {word_count}
+Paragraph Count: {paragraph_count}
+Average Paragraph Length: {average_paragraph_length} words
+Text-to-HTML Ratio: {text_html_ratio}%
+Readability Score: {readability_score}
+Content Depth Score: {content_depth_score}/100
 
 === CONTENT STRUCTURE ===
-Has Lists: {features.get('has_lists', False)} (Count: {features.get('list_count', 0)})
-Has Tables: {features.get('has_tables', False)} (Count: {features.get('table_count', 0)})
+Has Lists: {has_lists} (Count: {list_count})
+Has Tables: {has_tables} (Count: {table_count})
 
 === KEYWORD ANALYSIS ===
 Top Keywords: {keyword_display}
-Title Keyword Match: {features.get('title_keyword_match', False)}
-H1 Keyword Match: {features.get('h1_keyword_match', False)}
+Title Keyword Match: {title_keyword_match}
+H1 Keyword Match: {h1_keyword_match}
 
 === LINKS ===
-Internal Links: {features.get('internal_links', 0)}
-External Links: {features.get('external_links', 0)}
-Total Links: {features.get('total_links', 0)}
+Internal Links: {internal_links}
+External Links: {external_links}
+Total Links: {total_links}
 
 === IMAGES ===
-Total Images: {features.get('total_images', 0)}
-Images with Alt Text: {features.get('images_with_alt', 0)}
-Images without Alt Text: {features.get('images_without_alt', 0)}
+Total Images: {total_images}
+Images with Alt Text: {images_with_alt}
+Images without Alt Text: {images_without_alt}
 
 === STRUCTURED DATA ===
-Has JSON-LD: {features.get('has_json_ld', False)}
+Has JSON-LD: {has_json_ld}
 JSON-LD Types: {json_ld_display}
-Has FAQ Schema: {features.get('has_faq_schema', False)}
-Has Breadcrumb Schema: {features.get('has_breadcrumb_schema', False)}
-Has Local Business Schema: {features.get('has_local_business_schema', False)}
+Has FAQ Schema: {has_faq_schema}
+Has Breadcrumb Schema: {has_breadcrumb_schema}
+Has Local Business Schema: {has_local_business_schema}
 
 === SOCIAL MEDIA TAGS ===
-OG Title: {features.get('og_title', 'N/A')}
-OG Description: {features.get('og_description', 'N/A')}
-OG Image: {features.get('og_image', 'N/A')}
-Twitter Card: {features.get('twitter_card', 'N/A')}
-Twitter Title: {features.get('twitter_title', 'N/A')}
+OG Title: {og_title}
+OG Description: {og_description}
+OG Image: {og_image}
+Twitter Card: {twitter_card}
+Twitter Title: {twitter_title}
 
 === INTERNATIONAL SEO ===
-Language: {features.get('language', 'N/A')}
-Has Hreflang: {features.get('has_hreflang', False)}
+Language: {language}
+Has Hreflang: {has_hreflang}
 
 === NAVIGATION & UX ===
-Has Breadcrumbs: {features.get('has_breadcrumbs', False)}
-Has Search Functionality: {features.get('has_search', False)}
-Has Contact Info: {features.get('has_contact_info', False)}
+Has Breadcrumbs: {has_breadcrumbs}
+Has Search Functionality: {has_search}
+Has Contact Info: {has_contact_info}
 
 === CONTENT FRESHNESS ===
-Has Date Modified: {features.get('has_date_modified', False)}
-Last Modified: {features.get('last_modified', 'N/A')}
+Has Date Modified: {has_date_modified}
+Last Modified: {last_modified}
 
 === MOBILE & TECHNICAL ===
-Has Viewport Meta: {features.get('has_viewport', False)}
-Page Size: {features.get('page_size_kb', 0)} KB
+Has Viewport Meta: {has_viewport}
+Page Size: {page_size_kb} KB
 
 === PAGE CONTENT PREVIEW (First 500 chars) ===
 {preview_text}...
 """
-    return formatted
+
+# Value shown for each feature key the extractor did not return
+SEO_FEATURE_DEFAULTS = {
+    'url_length': 0,
+    'url_readability': 'N/A',
+    'url_depth': 0,
+    'url_uses_https': False,
+    'url_has_keywords': False,
+    'title': 'N/A',
+    'title_length': 0,
+    'meta_description': 'N/A',
+    'meta_description_length': 0,
+    'meta_robots': 'N/A',
+    'canonical_url': 'N/A',
+    'h1_count': 0,
+    'h2_count': 0,
+    'h3_count': 0,
+    'h4_count': 0,
+    'h5_count': 0,
+    'h6_count': 0,
+    'word_count': 0,
+    'paragraph_count': 0,
+    'average_paragraph_length': 0,
+    'text_html_ratio': 0,
+    'readability_score': 'N/A',
+    'content_depth_score': 0,
+    'has_lists': False,
+    'list_count': 0,
+    'has_tables': False,
+    'table_count': 0,
+    'title_keyword_match': False,
+    'h1_keyword_match': False,
+    'internal_links': 0,
+    'external_links': 0,
+    'total_links': 0,
+    'total_images': 0,
+    'images_with_alt': 0,
+    'images_without_alt': 0,
+    'has_json_ld': False,
+    'has_faq_schema': False,
+    'has_breadcrumb_schema': False,
+    'has_local_business_schema': False,
+    'og_title': 'N/A',
+    'og_description': 'N/A',
+    'og_image': 'N/A',
+    'twitter_card': 'N/A',
+    'twitter_title': 'N/A',
+    'language': 'N/A',
+    'has_hreflang': False,
+    'has_breadcrumbs': False,
+    'has_search': False,
+    'has_contact_info': False,
+    'has_date_modified': False,
+    'last_modified': 'N/A',
+    'has_viewport': False,
+    'page_size_kb': 0,
+}
+
+
+def format_seo_features(features: Dict[str, Any], source_type: str, source_value: str) -> str:
+    """Format SEO features into structured string for agent analysis"""
+
+    def format_list(items, max_items=5):
+        if not items:
+            return 'None'
+        if len(items) <= max_items:
+            return ', '.join(str(item) for item in items)
+        return ', '.join(str(item) for item in items[:max_items]) + f' (+ {len(items) - max_items} more)'
+
+    h1_display = format_list(features.get('h1_texts', []), max_items=3)
+    h2_display = format_list(features.get('h2_texts', []), max_items=5)
+    json_ld_display = format_list(features.get('json_ld_types', []))
+
+    top_keywords = features.get('top_keywords', [])
+    if top_keywords:
+        keyword_display = ', '.join([
+            f"{kw['keyword']}({kw['density']}%)" for kw in top_keywords[:5]
+        ])
+    else:
+        keyword_display = 'None analyzed'
+
+    page_text = features.get('text', '')
+    preview_text = page_text[:500] if page_text else 'No text content found'
+
+    values = {
+        **SEO_FEATURE_DEFAULTS,
+        **features,
+        'source_type': source_type,
+        'source_value': source_value,
+        'h1_display': h1_display,
+        'h2_display': h2_display,
+        'json_ld_display': json_ld_display,
+        'keyword_display': keyword_display,
+        'preview_text': preview_text,
+    }
+    return SEO_FEATURES_TEMPLATE.format_map(values)
 
 
 def format_performance_features(features: Dict[str, Any], url: str) -> str:
@@ -742,145 +1023,223 @@ def format_uiux_features(features: Dict[str, Any]) -> str:
     mode = features.get('mode', 'unknown')
     metadata = features.get('metadata', {})
 
-    formatted = f"""
-=== UI/UX ANALYSIS REQUEST ===
-
-Analysis Mode: {mode.upper()}
-Source: {metadata.get('source', 'N/A')}
-"""
+    parts = [UIUX_REQUEST_HEADER.format(mode=mode.upper(), source=metadata.get('source', 'N/A'))]
 
     if mode == 'url':
-        formatted += f"Viewports Captured: {', '.join(metadata.get('viewports_captured', []))}\n"
+        parts.append(f"Viewports Captured: {', '.join(metadata.get('viewports_captured', []))}\n")
     elif mode == 'screenshots':
-        formatted += f"Viewports Provided: {', '.join(metadata.get('viewports', []))}\n"
+        parts.append(f"Viewports Provided: {', '.join(metadata.get('viewports', []))}\n")
     elif mode == 'screenshot':
-        formatted += f"Viewport: {metadata.get('viewport', 'default')}\n"
+        parts.append(f"Viewport: {metadata.get('viewport', 'default')}\n")
 
     # Add accessibility data if available
     accessibility = features.get('accessibility')
     if accessibility:
-        score = accessibility.get('score', 'N/A')
-        summary = accessibility.get('summary', {})
-        issues = accessibility.get('issues', [])
-
-        formatted += f"""
-=== ACCESSIBILITY AUDIT RESULTS ===
-
-Overall Accessibility Score: {score}/100
-
-Issue Summary:
-  Critical Issues: {summary.get('critical', 0)}
-  Serious Issues: {summary.get('serious', 0)}
-  Moderate Issues: {summary.get('moderate', 0)}
-  Total Issues: {summary.get('total', 0)}
-
-"""
-
-        if issues:
-            formatted += "Detailed Issues:\n"
-            for issue in issues:
-                formatted += f"  [{issue.get('severity', 'unknown').upper()}] {issue.get('description', 'No description')}\n"
-            formatted += "\n"
+        parts.append(_accessibility_audit_section(accessibility))
 
     # Add screenshots info
     screenshots = features.get('screenshots', {})
 
-    formatted += f"""
+    parts.append(f"""
 === SCREENSHOTS AVAILABLE ===
 
 Number of Viewports: {len(screenshots)}
 Viewports: {', '.join(screenshots.keys())}
 
 Note: Screenshots have been captured and will be analyzed visually.
-Each screenshot is approximately {len(list(screenshots.values())[0]) if screenshots else 0} bytes (base64 encoded).
+Each screenshot is approximately {Screenshot(next(iter(screenshots.values()))).size if screenshots else 0} bytes.
 
-"""
+""")
 
     # Add note about limitations
-    formatted += """
+    parts.append("""
 === ANALYSIS INSTRUCTIONS ===
 
 Please provide a comprehensive UI/UX evaluation based on the screenshots and accessibility data.
 Analyze visual design, user experience, accessibility compliance, and responsive design quality.
 Provide specific, actionable recommendations prioritized by impact.
 
-"""
+""")
 
-    return formatted
+    return "".join(parts)
 
 
 # Create the Unified Workflow with Conditional Execution
-unified_workflow = Workflow(
-    name="Unified Website Analysis Workflow",
-    description="Comprehensive SEO, Performance, and UI/UX analysis with conditional execution based on input type",
-    steps=[
-        # Input Classification - ALWAYS RUNS FIRST: Detects input type using AI
-        Step(
-            name="Input Classification",
-            executor=classify_input_step,
-        ),
-
-        # SEO Analysis - CONDITIONAL: Only if URL or HTML provided
-        Condition(
-            name="SEO Analysis Condition",
-            description="Run SEO analysis if URL or HTML provided",
-            evaluator=has_url_or_html,
-            steps=[
-                Step(
-                    name="SEO Feature Extraction",
-                    executor=extract_seo_features_step,
-                ),
-                Step(
-                    name="SEO Analysis",
-                    agent=seo_analyst,
-                ),
-            ],
-        ),
-
-        # Performance Analysis - CONDITIONAL: Only if URL provided
-        Condition(
-            name="Performance Analysis Condition",
-            description="Run performance analysis if URL is provided",
-            evaluator=is_url_input,
-            steps=[
-                Step(
-                    name="Performance Feature Extraction",
-                    executor=extract_performance_features_step,
-                ),
-                Step(
-                    name="Performance Analysis",
-                    agent=performance_analyst,
+@functools.lru_cache(maxsize=1)
+def get_unified_workflow() -> Workflow:
+    """Return the shared Unified Workflow, building it (and its agents) on first use"""
+    return Workflow(
+        name="Unified Website Analysis Workflow",
+        description="Comprehensive SEO, Performance, and UI/UX analysis with conditional execution based on input type",
+        steps=[
+            # Input Classification - ALWAYS RUNS FIRST: Detects input type using AI
+            Step(
+                name="Input Classification",
+                executor=classify_input_step,
+            ),
+
+            # SEO, Performance and UI/UX branches are independent, so their
+            # extraction and LLM calls overlap instead of running back to back
+            Parallel(
+                # SEO Analysis - CONDITIONAL: Only if URL or HTML provided
+                Condition(
+                    name="SEO Analysis Condition",
+                    description="Run SEO analysis if URL or HTML provided",
+                    evaluator=has_url_or_html,
+                    steps=[
+                        Step(
+                            name="SEO Feature Extraction",
+                            executor=extract_seo_features_step,
+                        ),
+                        Step(
+                            name="SEO Analysis",
+                            agent=get_seo_analyst(),
+                        ),
+                    ],
                 ),
-            ],
-        ),
-
-        # UI/UX Analysis - CONDITIONAL: Only if URL or Screenshot(s) provided
-        Condition(
-            name="UI/UX Analysis Condition",
-            description="Run UI/UX analysis if URL or screenshot(s) are provided",
-            evaluator=needs_uiux_analysis,
-            steps=[
-                Step(
-                    name="UI/UX Feature Extraction",
-                    executor=extract_uiux_features_step,
+
+                # Performance Analysis - CONDITIONAL: Only if URL provided
+                Condition(
+                    name="Performance Analysis Condition",
+                    description="Run performance analysis if URL is provided",
+                    evaluator=is_url_input,
+                    steps=[
+                        Step(
+                            name="Performance Feature Extraction",
+                            executor=extract_performance_features_step,
+                        ),
+                        Step(
+                            name="Performance Analysis",
+                            agent=get_performance_analyst(),
+                        ),
+                    ],
                 ),
-                Step(
-                    name="UI/UX Analysis with Vision",
-                    executor=analyze_uiux_with_vision_step,
+
+                # UI/UX Analysis - CONDITIONAL: Only if URL or Screenshot(s) provided
+                Condition(
+                    name="UI/UX Analysis Condition",
+                    description="Run UI/UX analysis if URL or screenshot(s) are provided",
+                    evaluator=needs_uiux_analysis,
+                    steps=[
+                        Step(
+                            name="UI/UX Feature Extraction",
+                            executor=extract_uiux_features_step,
+                        ),
+                        Step(
+                            name="UI/UX Analysis with Vision",
+                            executor=analyze_uiux_with_vision_step,
+                        ),
+                    ],
                 ),
-            ],
-        ),
-
-        # Final Summary - ALWAYS RUNS: Synthesizes all analysis results
-        Step(
-            name="Executive Summary & Recommendations",
-            agent=summary_analyst,
-        ),
-    ],
+                name="Specialist Analyses",
+            ),
+
+            # Final Summary - ALWAYS RUNS: Synthesizes all analysis results
+            Step(
+                name="Executive Summary & Recommendations",
+                agent=get_summary_analyst(),
+            ),
+        ],
+    )
+
+
+def __getattr__(name: str):
+    # Backward compatibility for `from src.workflows.unified_workflow import unified_workflow`
+    if name == "unified_workflow":
+        return get_unified_workflow()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _file_fingerprint(value: Any) -> Any:
+    """Replace an existing file path with (path, mtime_ns, size) so edited files change the key"""
+    if not isinstance(value, str):
+        return value
+    try:
+        stat = os.stat(value)
+    except (OSError, ValueError):
+        return value  # URLs, inline image data and missing files are keyed by value
+    return [value, stat.st_mtime_ns, stat.st_size]
+
+
+def analysis_cache_key(input_data: Union[str, Dict[str, Any]]) -> bytes:
+    """
+    Hash workflow input into a stable analysis cache key.
+
+    Dict keys are order-insensitive, and screenshot paths are keyed by their
+    modification time and size, so replacing an image invalidates the entry.
+
+    Args:
+        input_data: Workflow input (string or dict)
+
+    Returns:
+        16-byte blake2b digest
+    """
+    if isinstance(input_data, dict):
+        keyed = dict(input_data)
+        if "screenshot" in keyed:
+            keyed["screenshot"] = _file_fingerprint(keyed["screenshot"])
+        if isinstance(keyed.get("screenshots"), dict):
+            keyed["screenshots"] = {name: _file_fingerprint(path) for name, path in keyed["screenshots"].items()}
+        # orjson returns bytes directly; unknown values fall back to str() like the stdlib default
+        payload = orjson.dumps(keyed, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = str(input_data).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _default_analysis_cache() -> Optional[MemoryCacheBackend]:
+    if Config.ANALYSIS_CACHE_MAXSIZE <= 0:
+        return None
+    return MemoryCacheBackend(maxsize=Config.ANALYSIS_CACHE_MAXSIZE, ttl=Config.ANALYSIS_CACHE_TTL)
+
+
+# Complete analyze() reports keyed by analysis_cache_key() (None when disabled)
+analysis_cache: Optional[MemoryCacheBackend] = _default_analysis_cache()
+
+
+BANNER_SEPARATOR = "=" * 70
+
+# Banner label per input kind, checked in order (a URL with screenshots is a URL analysis)
+ANALYSIS_MODE_LABELS = (
+    (InputKind.URL, "SEO + Performance + UI/UX (URL detected)"),
+    (InputKind.HTML, "SEO Only (HTML input detected)"),
+    (InputKind.SCREENSHOT, "UI/UX Only (Screenshot provided)"),
 )
 
 
-def analyze(input_data: Union[str, Dict[str, str]], stream: bool = False) -> str:
+def _print_analysis_mode(kind: InputKind) -> None:
+    """Print the analysis banner describing which branches will run"""
+    label = next((label for flag, label in ANALYSIS_MODE_LABELS if kind & flag), "Unknown input type")
+
+    # One write keeps the banner intact when analyses run concurrently
+    sys.stdout.write(
+        f"\n{BANNER_SEPARATOR}\nUNIFIED WEBSITE ANALYSIS\n{BANNER_SEPARATOR}\n"
+        f"Analysis Mode: {label}\n{BANNER_SEPARATOR}\n\n"
+    )
+
+
+def _cached_report(input_data: Any, use_cache: bool) -> Tuple[Optional[bytes], Optional[str]]:
+    """Return (cache key, cached report); the key is None when caching is off for this call"""
+    if not use_cache or analysis_cache is None:
+        return None, None
+    key = analysis_cache_key(input_data)
+    cached = analysis_cache.get(key)
+    if cached is not None:
+        logger.info("[Analysis] Served from cache")
+    return key, cached
+
+
+def _cache_report(key: Optional[bytes], report: Any) -> None:
+    if key is not None and isinstance(report, str) and report:
+        analysis_cache.set(key, report)
+
+
+def analyze(
+    input_data: Union[str, bytes, PurePath, Dict[str, str]],
+    stream: bool = False,
+    use_cache: bool = True,
+    verbose: bool = True,
+) -> str:
     """
     Unified analysis function for SEO, Performance, and UI/UX.
 
@@ -891,18 +1250,27 @@ def analyze(input_data: Union[str, Dict[str, str]], stream: bool = False) -> str
     - Dict with 'html': Runs SEO only
     - Dict with 'screenshot': Runs UI/UX only
     - Dict with 'screenshots': Runs UI/UX only
+    - pathlib.Path: Runs UI/UX only on that screenshot file
 
     Args:
-        input_data: URL string, HTML string, or dict with keys:
+        input_data: URL string, HTML string (or UTF-8 bytes), screenshot Path, or dict with keys:
                    - 'url': Website URL
                    - 'html': Raw HTML content
                    - 'screenshot': Path to single screenshot file
                    - 'screenshots': Dict of {viewport_name: screenshot_path}
-        stream: Whether to stream the output (default: False)
+                   - 'viewports': Viewports captured for a URL (default: desktop, mobile)
+        stream: Print the report as it is generated and also return it (default: False)
+        use_cache: Reuse the report of an identical earlier non-streaming call
+                   (default: True; kept for Config.ANALYSIS_CACHE_TTL seconds)
+        verbose: Print the analysis mode banner (default: True)
 
     Returns:
         String containing the analysis results
 
+    Raises:
+        ValueError: If the input holds no URL, HTML or screenshot (checked
+                    before any agent runs)
+
     Examples:
         >>> # Analyze URL (SEO + Performance + UI/UX)
         >>> analyze("https://example.com", stream=True)
@@ -929,30 +1297,321 @@ def analyze(input_data: Union[str, Dict[str, str]], stream: bool = False) -> str
         ... }, stream=True)
     """
 
-    # Determine what will be analyzed
-    is_url = _check_is_url(input_data)
-    is_html = _check_has_url_or_html(input_data) and not is_url
-    has_screenshot = _check_has_screenshot(input_data)
+    input_data = normalize_input(input_data)
 
-    print(f"\n{'='*70}")
-    print("UNIFIED WEBSITE ANALYSIS")
-    print(f"{'='*70}")
+    kind = require_input_kind(input_data)
+    if verbose:
+        _print_analysis_mode(kind)
 
-    # Display analysis mode
-    if is_url:
-        print("Analysis Mode: SEO + Performance + UI/UX (URL detected)")
-    elif is_html:
-        print("Analysis Mode: SEO Only (HTML input detected)")
-    elif has_screenshot:
-        print("Analysis Mode: UI/UX Only (Screenshot provided)")
-    else:
-        print("Analysis Mode: Unknown input type")
+    if stream:
+        # Echo chunks as they arrive and return the same text, so callers get the report too
+        chunks: List[str] = []
+        for chunk in analyze_iter(input_data, verbose=False):
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+            chunks.append(chunk)
+        return "".join(chunks)
+
+    key, cached = _cached_report(input_data, use_cache)
+    if cached is not None:
+        return cached
+
+    result = get_unified_workflow().run(input=input_data)
+    _cache_report(key, result.content)
+    return result.content
+
+
+async def analyze_async(
+    input_data: Union[str, bytes, PurePath, Dict[str, str]],
+    stream: bool = False,
+    use_cache: bool = True,
+    verbose: bool = True,
+) -> str:
+    """
+    Async variant of analyze() for callers already running an event loop.
 
-    print(f"{'='*70}\n")
+    Runs the workflow with arun(), so the parallel SEO, Performance and UI/UX
+    branches await their agents concurrently instead of occupying threads.
+    Server code running on an event loop should await this instead of calling
+    analyze() in a worker thread. Shares analyze()'s report cache.
+
+    Args:
+        input_data: Same inputs as analyze()
+        stream: Print the report as it is generated and also return it (default: False)
+        use_cache: Reuse the report of an identical earlier non-streaming call (default: True)
+        verbose: Print the analysis mode banner (default: True)
+
+    Returns:
+        String containing the analysis results
+
+    Examples:
+        >>> import asyncio
+        >>> asyncio.run(analyze_async("https://example.com"))
+    """
+    input_data = normalize_input(input_data)
+
+    kind = require_input_kind(input_data)
+    if verbose:
+        _print_analysis_mode(kind)
 
     if stream:
-        unified_workflow.print_response(input=input_data, markdown=True, stream=True)
-        return "Analysis streamed above"
-    else:
-        result = unified_workflow.run(input=input_data)
-        return result.content
+        chunks: List[str] = []
+        async for chunk in analyze_stream(input_data, verbose=False):
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+            chunks.append(chunk)
+        return "".join(chunks)
+
+    key, cached = _cached_report(input_data, use_cache)
+    if cached is not None:
+        return cached
+
+    result = await get_unified_workflow().arun(input=input_data)
+    _cache_report(key, result.content)
+    return result.content
+
+
+def analyze_batch(urls: List[str], poll_interval: int = 30) -> Dict[str, str]:
+    """
+    Analyze many URLs through the OpenAI Batch API (non-interactive bulk runs).
+
+    Features are extracted locally for every URL, then all SEO and Performance
+    prompts are submitted as one batch job, followed by a second batch for the
+    executive summaries. Batch jobs are billed at the discounted batch rate but
+    can take minutes to hours, so use analyze() for interactive work.
+
+    UI/UX analysis is not included: it needs the vision model with screenshots
+    attached and streams its output.
+
+    Args:
+        urls: List of website URLs to analyze
+        poll_interval: Seconds between batch status checks (default: 30)
+
+    Returns:
+        Dict mapping each URL to its combined analysis report
+
+    Examples:
+        >>> reports = analyze_batch(["https://example.com", "https://example.org"])
+        >>> print(reports["https://example.com"])
+    """
+    sys.stdout.write(
+        f"\n{BANNER_SEPARATOR}\nBATCH WEBSITE ANALYSIS\n{BANNER_SEPARATOR}\n"
+        f"URLs: {len(urls)} | Analysis Mode: SEO + Performance (Batch API)\n{BANNER_SEPARATOR}\n\n"
+    )
+
+    # Phase 1: Local feature extraction (no LLM calls); fetches overlap on the shared HTTP sessions
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_BATCH_EXTRACTION_WORKERS, 2 * len(urls)))) as pool:
+        seo_futures = [pool.submit(extract_seo_features_step, StepInput(input=url)) for url in urls]
+        performance_futures = [pool.submit(extract_performance_features_step, StepInput(input=url)) for url in urls]
+
+    requests = []
+    for index, (seo_future, performance_future) in enumerate(zip(seo_futures, performance_futures)):
+        seo_features = seo_future.result().content
+        performance_features = performance_future.result().content
+        requests.append(batch_request(f"seo-{index}", get_seo_analyst(), seo_features))
+        requests.append(batch_request(f"performance-{index}", get_performance_analyst(), performance_features))
+
+    # Phase 2: Specialist analyses in one batch
+    analyses = run_batch(requests, poll_interval=poll_interval)
+
+    reports = {}
+    summary_requests = []
+    for index, url in enumerate(urls):
+        reports[url] = f"""=== SEO ANALYSIS ===
+
+{analyses[f"seo-{index}"]}
+
+=== PERFORMANCE ANALYSIS ===
+
+{analyses[f"performance-{index}"]}
+"""
+        summary_requests.append(batch_request(f"summary-{index}", get_summary_analyst(), reports[url]))
+
+    # Phase 3: Executive summaries in a second batch
+    summaries = run_batch(summary_requests, poll_interval=poll_interval)
+
+    return {
+        url: f"{reports[url]}\n=== EXECUTIVE SUMMARY ===\n\n{summaries[f'summary-{index}']}\n"
+        for index, url in enumerate(urls)
+    }
+
+
+async def _stream_agent(agent: Any, input: str, images: Optional[List[Image]] = None) -> AsyncIterator[str]:
+    """Yield the text chunks of a streaming agent run"""
+    async for event in agent.arun(input=input, images=images or None, stream=True):
+        if isinstance(event, RunContentEvent) and isinstance(event.content, str):
+            yield event.content
+
+
+async def _produce_section(name: str, queue: asyncio.Queue, prepare, agent: Any, input: Any) -> None:
+    """
+    Producer: extract features in a worker thread, then stream the agent's tokens.
+
+    Puts (name, chunk) pairs on the queue and a final (name, None) when done.
+    """
+    try:
+        prepared = await asyncio.to_thread(prepare, StepInput(input=input))
+        if isinstance(prepared, tuple):
+            prompt, images = prepared
+        else:
+            prompt, images = prepared, None
+
+        async for chunk in _stream_agent(agent, prompt, images):
+            await queue.put((name, chunk))
+    except Exception as e:
+        await queue.put((name, f"[{name}] Error during analysis: {str(e)}"))
+    finally:
+        await queue.put((name, None))
+
+
+def _prepare_uiux(step_input: StepInput) -> Tuple[str, List[Image]]:
+    """Run UI/UX extraction and build the vision request (raises on extraction errors)"""
+    content = extract_uiux_features_step(step_input).content
+    try:
+        features = load_uiux_features(content)
+    except json.JSONDecodeError:
+        raise ValueError(content)
+    return build_uiux_request(features)
+
+
+async def analyze_stream(input_data: Union[str, bytes, PurePath, Dict[str, str]], verbose: bool = True) -> AsyncIterator[str]:
+    """
+    Stream the analysis as it is generated.
+
+    The SEO, Performance and UI/UX analysts run as concurrent producers feeding
+    an asyncio.Queue. The first analyst to emit a token is streamed live while
+    the others are buffered and flushed as soon as it finishes, so the first
+    bytes arrive after the fastest agent's first token instead of after the
+    whole workflow. The executive summary needs the complete analyses and is
+    streamed last.
+
+    Args:
+        input_data: Same inputs as analyze()
+        verbose: Print the analysis mode banner (default: True)
+
+    Yields:
+        Markdown text chunks of the report
+
+    Examples:
+        >>> async for chunk in analyze_stream("https://example.com"):
+        ...     sys.stdout.write(chunk)
+    """
+    input_data = normalize_input(input_data)
+
+    kind = require_input_kind(input_data)
+    if verbose:
+        _print_analysis_mode(kind)
+
+    producers = []
+    if kind & (InputKind.URL | InputKind.HTML):
+        producers.append(("SEO ANALYSIS", lambda si: extract_seo_features_step(si).content, get_seo_analyst()))
+    if kind & InputKind.URL:
+        producers.append(("PERFORMANCE ANALYSIS", lambda si: extract_performance_features_step(si).content, get_performance_analyst()))
+    if kind & (InputKind.URL | InputKind.SCREENSHOT):
+        producers.append(("UI/UX ANALYSIS", _prepare_uiux, get_uiux_analyst()))
+
+    queue: asyncio.Queue = asyncio.Queue()
+    tasks = [
+        asyncio.create_task(_produce_section(name, queue, prepare, agent, input_data))
+        for name, prepare, agent in producers
+    ]
+
+    order: List[str] = []  # section names in order of first output
+    buffered: Dict[str, List[str]] = {}  # chunks received but not yet yielded
+    reports: Dict[str, List[str]] = {}  # full text per section, for the summary
+    finished = set()
+    flushed = set()
+    active = None
+
+    try:
+        while len(finished) < len(tasks):
+            name, chunk = await queue.get()
+            if name not in buffered:
+                order.append(name)
+                buffered[name] = []
+                reports[name] = []
+            if chunk is None:
+                finished.add(name)
+            else:
+                buffered[name].append(chunk)
+                reports[name].append(chunk)
+
+            # Stream the active section live; flush buffered ones once it completes
+            while True:
+                if active is None:
+                    pending = [n for n in order if n not in flushed]
+                    if not pending:
+                        break
+                    active = pending[0]
+                    yield f"=== {active} ===\n\n"
+
+                if buffered[active]:
+                    yield "".join(buffered[active])
+                    buffered[active].clear()
+
+                if active not in finished:
+                    break
+                flushed.add(active)
+                active = None
+                yield "\n\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    # Executive summary over the complete specialist reports
+    summary_input = "\n\n".join(f"=== {name} ===\n\n{''.join(reports[name])}" for name in order)
+    yield "=== EXECUTIVE SUMMARY ===\n\n"
+    async for chunk in _stream_agent(get_summary_analyst(), summary_input):
+        yield chunk
+    yield "\n"
+
+
+def analyze_iter(input_data: Union[str, bytes, PurePath, Dict[str, str]], verbose: bool = True) -> Iterator[str]:
+    """
+    Synchronous variant of analyze_stream() for WSGI handlers and scripts.
+
+    The async stream runs on its own event loop in a daemon thread and hands
+    each chunk over through a queue, so callers can flush every section to the
+    client as soon as it is produced instead of waiting for the whole report.
+    Closing the iterator early stops the remaining agents at their next chunk.
+
+    Args:
+        input_data: Same inputs as analyze()
+        verbose: Print the analysis mode banner (default: True)
+
+    Yields:
+        Markdown text chunks of the report
+
+    Examples:
+        >>> for chunk in analyze_iter("https://example.com"):
+        ...     sys.stdout.write(chunk)
+    """
+    chunks: queue.Queue = queue.Queue()
+    stopped = threading.Event()
+    done = object()
+
+    async def pump() -> None:
+        stream = analyze_stream(input_data, verbose)
+        try:
+            async for chunk in stream:
+                if stopped.is_set():
+                    break
+                chunks.put(chunk)
+        except Exception as e:
+            chunks.put(e)
+        finally:
+            await stream.aclose()  # Cancels the producer tasks when stopped early
+            chunks.put(done)
+
+    thread = threading.Thread(target=asyncio.run, args=(pump(),), name="analyze-iter", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
@@ -0,0 +1,112 @@
+"""
+Partial feature masks must report the same values as a full extraction.
+"""
+
+import pytest
+
+from src.extractors.html_extractor import (
+    FEATURE_ALL,
+    FEATURE_CONTENT,
+    FEATURE_CONTENT_DEPTH,
+    FEATURE_FRESHNESS,
+    FEATURE_HEADINGS,
+    FEATURE_IMAGES,
+    FEATURE_INTERNATIONAL,
+    FEATURE_KEYWORDS,
+    FEATURE_LINKS,
+    FEATURE_META,
+    FEATURE_NAVIGATION,
+    FEATURE_SOCIAL,
+    FEATURE_STRUCTURED_DATA,
+    FEATURE_URL,
+    HtmlContentExtractor,
+)
+
+SAMPLE_HTML = """<!doctype html>
+<html lang="en">
+<head>
+  <title>Sample Page</title>
+  <meta name="description" content="A sample page">
+  <meta name="robots" content="index,follow">
+  <meta name="viewport" content="width=device-width">
+  <meta name="last-modified" content="2024-01-01">
+  <meta property="og:title" content="Sample OG title">
+  <meta name="twitter:card" content="summary">
+  <link rel="canonical" href="https://example.com/page">
+  <link rel="alternate" hreflang="fr" href="https://example.com/fr">
+  <script type="application/ld+json">{"@context": "https://schema.org", "@type": "Article", "headline": "x"}</script>
+</head>
+<body>
+  <nav class="breadcrumb"><a href="/">Home</a></nav>
+  <h1>Sample heading</h1>
+  <h2>Sub one</h2><h2>Sub two</h2><h3>Third</h3>
+  <p>First paragraph with several words about sample content and testing.</p>
+  <p>Contact us at info@example.com or 555-123-4567.</p>
+  <ul><li>one</li></ul>
+  <table><tr><td>cell</td></tr></table>
+  <img src="a.png" alt="A"><img src="b.png">
+  <a href="https://example.com/about">About</a>
+  <a href="https://other.org/">Other</a>
+  <input type="search" name="q">
+  <time datetime="2023-05-05">May 5</time>
+  <footer><address>1 Main St</address></footer>
+</body>
+</html>"""
+
+# Depth scoring and keyword matching read headings, images, title and text
+MASKS = [
+    FEATURE_META,
+    FEATURE_HEADINGS,
+    FEATURE_LINKS,
+    FEATURE_IMAGES,
+    FEATURE_SOCIAL,
+    FEATURE_INTERNATIONAL,
+    FEATURE_NAVIGATION,
+    FEATURE_FRESHNESS,
+    FEATURE_STRUCTURED_DATA,
+    FEATURE_CONTENT,
+    FEATURE_URL,
+    FEATURE_CONTENT_DEPTH | FEATURE_HEADINGS | FEATURE_IMAGES,
+    FEATURE_KEYWORDS | FEATURE_META | FEATURE_HEADINGS | FEATURE_CONTENT,
+    FEATURE_ALL & ~(FEATURE_KEYWORDS | FEATURE_CONTENT_DEPTH),
+    FEATURE_ALL & ~FEATURE_SOCIAL,
+]
+
+
+def extract(mask: int) -> dict:
+    # Passing both skips the fetch while keeping link and URL features URL-relative
+    return HtmlContentExtractor(url="https://example.com/blog/sample-page", html=SAMPLE_HTML).extract(mask)
+
+
+@pytest.mark.parametrize("mask", MASKS)
+def test_partial_mask_matches_full_extraction(mask):
+    full = extract(FEATURE_ALL)
+    defaults = extract(0)
+    partial = extract(mask)
+
+    changed = {key for key, value in partial.items() if value != defaults[key]}
+    assert changed, "mask extracted nothing"
+    assert {key: partial[key] for key in changed} == {key: full[key] for key in changed}
+
+
+def test_partial_masks_cover_every_full_field():
+    full = extract(FEATURE_ALL)
+    defaults = extract(0)
+    covered = set()
+    for mask in MASKS:
+        partial = extract(mask)
+        covered.update(key for key, value in partial.items() if value != defaults[key])
+
+    assert {key for key, value in full.items() if value != defaults[key]} <= covered
+
+
+def test_meta_mask_reports_viewport():
+    assert extract(FEATURE_META)["has_viewport"] is True
+    assert extract(FEATURE_ALL & ~FEATURE_SOCIAL)["has_viewport"] is True
+
+
+def test_header_only_mask_uses_single_traversal(monkeypatch):
+    calls = []
+    monkeypatch.setattr(HtmlContentExtractor, "extract_meta_tags", lambda self: calls.append("meta"))
+    extract(FEATURE_ALL & ~(FEATURE_KEYWORDS | FEATURE_CONTENT_DEPTH))
+    assert calls == []